@@ -15,6 +15,12 @@ from app.models import (  # noqa: F401
     share,
     upload,
     audit_log,
+    member_status,
+    org_rollup,
+    stp_items,
+    auth_session,
+    member_access,
+    upload_blob,
 )
 
 config = context.config
@@ -0,0 +1,29 @@
+"""add upload sha256
+
+Revision ID: 0e15287195a4
+Revises: 1663e409a042
+Create Date: 2026-10-18 16:58:20.734105
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0e15287195a4"
+down_revision = "1663e409a042"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    # Filled for new uploads only; older files stay NULL until re-uploaded
+    op.add_column("upload_files", sa.Column("sha256", sa.String(length=64), nullable=True))
+
+    op.create_index("ix_upload_files_sha256", "upload_files", ["sha256"])
+
+
+def downgrade():
+
+    op.drop_index("ix_upload_files_sha256", table_name="upload_files")
+    op.drop_column("upload_files", "sha256")
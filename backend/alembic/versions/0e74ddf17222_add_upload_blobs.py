@@ -0,0 +1,43 @@
+"""add upload blobs
+
+Revision ID: 0e74ddf17222
+Revises: 0e15287195a4
+Create Date: 2026-10-18 17:32:56.118402
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0e74ddf17222"
+down_revision = "0e15287195a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "upload_blobs",
+        sa.Column("sha256", sa.String(length=64), primary_key=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("storage_path", sa.String(length=500), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    op.add_column(
+        "upload_files",
+        sa.Column("blob_sha256", sa.String(length=64), sa.ForeignKey("upload_blobs.sha256"), nullable=True),
+    )
+    op.create_index("ix_upload_files_blob_sha256", "upload_files", ["blob_sha256"])
+
+    # Existing files stay where they are (blob_sha256 NULL) until moved with:
+    #   python -m app.cli backfill-upload-blobs
+
+
+def downgrade():
+
+    op.drop_index("ix_upload_files_blob_sha256", table_name="upload_files")
+    op.drop_column("upload_files", "blob_sha256")
+    op.drop_table("upload_blobs")
@@ -0,0 +1,38 @@
+"""add share created_at and org inbox index
+
+Revision ID: 1663e409a042
+Revises: ca8b77323197
+Create Date: 2026-10-18 16:27:43.501927
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "1663e409a042"
+down_revision = "ca8b77323197"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    # Existing shares have no request time; they sort as requested at migration time
+    op.add_column(
+        "service_member_shares",
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    # Only pending rows are indexed, so the inbox index stays small as shares are decided
+    op.create_index(
+        "ix_service_member_shares_org_pending",
+        "service_member_shares",
+        ["target_org_id", "created_at", "id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade():
+
+    op.drop_index("ix_service_member_shares_org_pending", table_name="service_member_shares")
+    op.drop_column("service_member_shares", "created_at")
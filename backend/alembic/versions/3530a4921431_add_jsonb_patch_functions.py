@@ -0,0 +1,123 @@
+"""add jsonb patch functions
+
+Revision ID: 3530a4921431
+Revises: 5725e1c2e19f
+Create Date: 2026-10-18 13:21:44.318207
+"""
+
+from alembic import op
+
+
+revision = "3530a4921431"
+down_revision = "5725e1c2e19f"
+branch_labels = None
+depends_on = None
+
+
+# JSON Merge Patch (RFC 7386): objects merge recursively, null removes a key,
+# anything else replaces the target value.
+JSONB_MERGE_PATCH_FN = r"""
+CREATE OR REPLACE FUNCTION jsonb_merge_patch(target jsonb, patch jsonb) RETURNS jsonb
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    key text;
+    value jsonb;
+BEGIN
+    IF patch IS NULL OR jsonb_typeof(patch) <> 'object' THEN
+        RETURN patch;
+    END IF;
+    IF target IS NULL OR jsonb_typeof(target) <> 'object' THEN
+        target := '{}'::jsonb;
+    END IF;
+    FOR key, value IN SELECT * FROM jsonb_each(patch) LOOP
+        IF jsonb_typeof(value) = 'null' THEN
+            target := target - key;
+        ELSE
+            target := jsonb_set(target, ARRAY[key], jsonb_merge_patch(target -> key, value));
+        END IF;
+    END LOOP;
+    RETURN target;
+END;
+$$;
+"""
+
+# JSON Patch (RFC 6902) add/replace/remove. Paths arrive pre-split as
+# arrays of keys (see app.domain.stp_patch); a missing target raises
+# invalid_parameter_value (22023) so the whole patch is rejected.
+JSONB_APPLY_PATCH_FN = r"""
+CREATE OR REPLACE FUNCTION jsonb_apply_patch(doc jsonb, ops jsonb) RETURNS jsonb
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    op jsonb;
+    path text[];
+    parent_path text[];
+    parent jsonb;
+    key text;
+    idx int;
+    n int;
+BEGIN
+    FOR op IN SELECT * FROM jsonb_array_elements(ops) LOOP
+        path := ARRAY(SELECT jsonb_array_elements_text(op -> 'path'));
+        n := cardinality(path);
+        parent_path := path[1:n - 1];
+        key := path[n];
+        parent := doc #> parent_path;
+
+        IF jsonb_typeof(parent) = 'object' THEN
+            IF op ->> 'op' <> 'add' AND NOT parent ? key THEN
+                RAISE EXCEPTION 'path not found: %', op -> 'path' USING ERRCODE = '22023';
+            END IF;
+            IF op ->> 'op' = 'remove' THEN
+                parent := parent - key;
+            ELSE
+                parent := parent || jsonb_build_object(key, op -> 'value');
+            END IF;
+
+        ELSIF jsonb_typeof(parent) = 'array' THEN
+            IF key = '-' AND op ->> 'op' = 'add' THEN
+                idx := jsonb_array_length(parent);
+            ELSIF key ~ '^(0|[1-9][0-9]{0,8})$' THEN
+                idx := key::int;
+            ELSE
+                RAISE EXCEPTION 'invalid array index: %', op -> 'path' USING ERRCODE = '22023';
+            END IF;
+            IF idx > jsonb_array_length(parent)
+                OR (idx = jsonb_array_length(parent) AND op ->> 'op' <> 'add') THEN
+                RAISE EXCEPTION 'array index out of range: %', op -> 'path' USING ERRCODE = '22023';
+            END IF;
+            IF op ->> 'op' = 'remove' THEN
+                parent := parent - idx;
+            ELSIF op ->> 'op' = 'replace' THEN
+                parent := jsonb_set(parent, ARRAY[idx::text], op -> 'value');
+            ELSIF idx = jsonb_array_length(parent) THEN
+                parent := parent || jsonb_build_array(op -> 'value');
+            ELSE
+                parent := jsonb_insert(parent, ARRAY[idx::text], op -> 'value');
+            END IF;
+
+        ELSE
+            RAISE EXCEPTION 'path not found: %', op -> 'path' USING ERRCODE = '22023';
+        END IF;
+
+        IF n = 1 THEN
+            doc := parent;
+        ELSE
+            doc := jsonb_set(doc, parent_path, parent);
+        END IF;
+    END LOOP;
+    RETURN doc;
+END;
+$$;
+"""
+
+
+def upgrade():
+
+    op.execute(JSONB_MERGE_PATCH_FN)
+    op.execute(JSONB_APPLY_PATCH_FN)
+
+
+def downgrade():
+
+    op.execute("DROP FUNCTION IF EXISTS jsonb_apply_patch(jsonb, jsonb)")
+    op.execute("DROP FUNCTION IF EXISTS jsonb_merge_patch(jsonb, jsonb)")
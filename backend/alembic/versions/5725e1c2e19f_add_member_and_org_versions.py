@@ -0,0 +1,34 @@
+"""add member and org versions
+
+Revision ID: 5725e1c2e19f
+Revises: cbdd11834da6
+Create Date: 2026-10-18 12:48:30.906417
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "5725e1c2e19f"
+down_revision = "cbdd11834da6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.add_column(
+        "service_members",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+    op.add_column(
+        "organizations",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade():
+
+    op.drop_column("organizations", "version")
+    op.drop_column("service_members", "version")
@@ -0,0 +1,37 @@
+"""add account organization
+
+Revision ID: 5d9ba1568c72
+Revises: 9a3827635c90
+Create Date: 2026-10-18 15:06:25.917340
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "5d9ba1568c72"
+down_revision = "9a3827635c90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "organization_id",
+            sa.String(length=36),
+            sa.ForeignKey("organizations.id", name="fk_accounts_organization_id"),
+            nullable=True,
+        ),
+    )
+
+    op.create_index("ix_accounts_organization_id", "accounts", ["organization_id"])
+
+
+def downgrade():
+
+    op.drop_index("ix_accounts_organization_id", table_name="accounts")
+    op.drop_constraint("fk_accounts_organization_id", "accounts", type_="foreignkey")
+    op.drop_column("accounts", "organization_id")
@@ -0,0 +1,64 @@
+"""add service member statuses
+
+Revision ID: 7c3a9f6cd4b2
+Revises: 292ee3aac2b7
+Create Date: 2026-10-18 09:12:40.118204
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "7c3a9f6cd4b2"
+down_revision = "292ee3aac2b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "service_member_statuses",
+        sa.Column(
+            "service_member_id",
+            sa.String(length=36),
+            sa.ForeignKey("service_members.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("fitness_status", sa.String(length=8), nullable=False),
+        sa.Column("fitness_expiration", sa.DateTime(), nullable=True),
+        sa.Column("training_status", sa.String(length=8), nullable=False),
+        sa.Column("training_next_due", sa.DateTime(), nullable=True),
+        sa.Column("awards_status", sa.String(length=8), nullable=False),
+        sa.Column("readiness_status", sa.String(length=8), nullable=False),
+        sa.Column("readiness_expiration", sa.DateTime(), nullable=True),
+        sa.Column("valid_until", sa.DateTime(), nullable=True),
+        sa.Column(
+            "computed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    op.create_index(
+        "ix_sm_status_rag",
+        "service_member_statuses",
+        ["fitness_status", "training_status", "awards_status", "readiness_status"],
+    )
+
+    op.create_index(
+        "ix_service_member_statuses_valid_until",
+        "service_member_statuses",
+        ["valid_until"],
+    )
+
+    # Rows are filled lazily by the org summary, or in bulk with:
+    #   python -m app.cli rebuild-member-status
+
+
+def downgrade():
+
+    op.drop_index("ix_service_member_statuses_valid_until", table_name="service_member_statuses")
+    op.drop_index("ix_sm_status_rag", table_name="service_member_statuses")
+    op.drop_table("service_member_statuses")
@@ -0,0 +1,52 @@
+"""add auth sessions
+
+Revision ID: 9a3827635c90
+Revises: ca0e8f096fbd
+Create Date: 2026-10-18 14:37:52.640113
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "9a3827635c90"
+down_revision = "ca0e8f096fbd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "auth_sessions",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column(
+            "account_id",
+            sa.String(length=36),
+            sa.ForeignKey("accounts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("family_id", sa.String(length=36), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("replaced_by_id", sa.String(length=36), nullable=True),
+    )
+
+    op.create_index("ix_auth_sessions_token_hash", "auth_sessions", ["token_hash"], unique=True)
+    op.create_index("ix_auth_sessions_account_id", "auth_sessions", ["account_id"])
+    op.create_index("ix_auth_sessions_family_id", "auth_sessions", ["family_id"])
+
+
+def downgrade():
+
+    op.drop_index("ix_auth_sessions_family_id", table_name="auth_sessions")
+    op.drop_index("ix_auth_sessions_account_id", table_name="auth_sessions")
+    op.drop_index("ix_auth_sessions_token_hash", table_name="auth_sessions")
+    op.drop_table("auth_sessions")
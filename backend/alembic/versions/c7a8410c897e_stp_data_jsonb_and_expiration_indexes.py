@@ -0,0 +1,86 @@
+"""stp_data jsonb and expiration indexes
+
+Revision ID: c7a8410c897e
+Revises: 7c3a9f6cd4b2
+Create Date: 2026-10-18 10:03:17.402551
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "c7a8410c897e"
+down_revision = "7c3a9f6cd4b2"
+branch_labels = None
+depends_on = None
+
+
+# Mirrors app.domain.dashboard_cards._parse_iso for extended ISO 8601 strings:
+# offset-aware values are converted to UTC, naive ones are taken as UTC, and
+# anything else (non-strings, free-form dates, invalid values) yields NULL.
+# Declared IMMUTABLE so it can back expression indexes.
+STP_TIMESTAMP_FN = r"""
+CREATE OR REPLACE FUNCTION stp_timestamp(value jsonb) RETURNS timestamp
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    raw text;
+BEGIN
+    IF value IS NULL OR jsonb_typeof(value) <> 'string' THEN
+        RETURN NULL;
+    END IF;
+    raw := value #>> '{}';
+    IF raw !~ '^\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}(:\d{2}(\.\d{1,6})?)?)?(Z|[+-]\d{2}(:?\d{2})?)?)?$' THEN
+        RETURN NULL;
+    END IF;
+    IF raw ~ '[T ].*(Z|[+-]\d{2}(:?\d{2})?)$' THEN
+        RETURN (raw::timestamptz AT TIME ZONE 'UTC');
+    END IF;
+    RETURN raw::timestamp;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade():
+
+    # drop the json default first so the type change does not have to cast it
+    op.alter_column("service_members", "stp_data", server_default=None)
+    op.alter_column(
+        "service_members",
+        "stp_data",
+        type_=postgresql.JSONB(),
+        postgresql_using="stp_data::jsonb",
+        existing_nullable=False,
+    )
+    op.alter_column("service_members", "stp_data", server_default=sa.text("'{}'::jsonb"))
+
+    op.execute(STP_TIMESTAMP_FN)
+
+    op.execute(
+        "CREATE INDEX ix_sm_fitness_expiration ON service_members "
+        "(stp_timestamp(stp_data->'fitness'->'expiration_date'))"
+    )
+
+    op.execute(
+        "CREATE INDEX ix_sm_readiness_expiration ON service_members "
+        "(stp_timestamp(stp_data->'readiness'->'readiness_expiration'))"
+    )
+
+
+def downgrade():
+
+    op.drop_index("ix_sm_readiness_expiration", table_name="service_members")
+    op.drop_index("ix_sm_fitness_expiration", table_name="service_members")
+    op.execute("DROP FUNCTION IF EXISTS stp_timestamp(jsonb)")
+    op.alter_column("service_members", "stp_data", server_default=None)
+    op.alter_column(
+        "service_members",
+        "stp_data",
+        type_=sa.JSON(),
+        postgresql_using="stp_data::json",
+        existing_nullable=False,
+    )
+    op.alter_column("service_members", "stp_data", server_default=sa.text("'{}'::json"))
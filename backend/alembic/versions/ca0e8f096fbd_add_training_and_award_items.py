@@ -0,0 +1,66 @@
+"""add training and award items
+
+Revision ID: ca0e8f096fbd
+Revises: 3530a4921431
+Create Date: 2026-10-18 13:58:06.271934
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "ca0e8f096fbd"
+down_revision = "3530a4921431"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "training_items",
+        sa.Column(
+            "service_member_id",
+            sa.String(length=36),
+            sa.ForeignKey("service_members.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("position", sa.Integer(), primary_key=True),
+        sa.Column("item_type", sa.String(length=128), nullable=True),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("completed", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+    op.create_index("ix_training_items_type_due", "training_items", ["item_type", "due_date"])
+    op.create_index("ix_training_items_due_date", "training_items", ["due_date"])
+    op.create_index("ix_training_items_completed", "training_items", ["completed"])
+
+    op.create_table(
+        "award_items",
+        sa.Column(
+            "service_member_id",
+            sa.String(length=36),
+            sa.ForeignKey("service_members.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("position", sa.Integer(), primary_key=True),
+        sa.Column("award_type", sa.String(length=128), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=True),
+    )
+
+    op.create_index("ix_award_items_status_type", "award_items", ["status", "award_type"])
+    op.create_index("ix_award_items_award_type", "award_items", ["award_type"])
+
+    # Existing members are backfilled with:
+    #   python -m app.cli backfill-stp-items
+
+
+def downgrade():
+
+    op.drop_index("ix_award_items_award_type", table_name="award_items")
+    op.drop_index("ix_award_items_status_type", table_name="award_items")
+    op.drop_table("award_items")
+    op.drop_index("ix_training_items_completed", table_name="training_items")
+    op.drop_index("ix_training_items_due_date", table_name="training_items")
+    op.drop_index("ix_training_items_type_due", table_name="training_items")
+    op.drop_table("training_items")
@@ -0,0 +1,52 @@
+"""add member access
+
+Revision ID: ca8b77323197
+Revises: 5d9ba1568c72
+Create Date: 2026-10-18 15:41:09.283716
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.member_access_service import INSERT_MEMBER_ACCESS, MEMBER_ACCESS_SQL
+
+
+revision = "ca8b77323197"
+down_revision = "5d9ba1568c72"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.create_table(
+        "member_access",
+        sa.Column("principal_type", sa.String(length=8), primary_key=True),
+        sa.Column("principal_id", sa.String(length=36), primary_key=True),
+        sa.Column(
+            "service_member_id",
+            sa.String(length=36),
+            sa.ForeignKey("service_members.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("permission", sa.SmallInteger(), nullable=False),
+    )
+
+    op.create_index(
+        "ix_member_access_service_member_id",
+        "member_access",
+        ["service_member_id"],
+    )
+
+    # Reads go only through this table, so fill it before anything uses it
+    # (python -m app.cli rebuild-member-access recomputes it later)
+    op.execute(
+        INSERT_MEMBER_ACCESS
+        + MEMBER_ACCESS_SQL.format(share_filter="", member_filter="", grants_filter="")
+    )
+
+
+def downgrade():
+
+    op.drop_index("ix_member_access_service_member_id", table_name="member_access")
+    op.drop_table("member_access")
@@ -0,0 +1,58 @@
+"""add org hierarchy and rollups
+
+Revision ID: cbdd11834da6
+Revises: c7a8410c897e
+Create Date: 2026-10-18 11:26:52.730915
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "cbdd11834da6"
+down_revision = "c7a8410c897e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+
+    op.add_column(
+        "organizations",
+        sa.Column(
+            "parent_id",
+            sa.String(length=36),
+            sa.ForeignKey("organizations.id"),
+            nullable=True,
+        ),
+    )
+
+    op.create_index(
+        "ix_organizations_parent_id",
+        "organizations",
+        ["parent_id"],
+    )
+
+    op.create_table(
+        "org_status_rollups",
+        sa.Column(
+            "organization_id",
+            sa.String(length=36),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("card", sa.String(length=16), primary_key=True),
+        sa.Column("status", sa.String(length=8), primary_key=True),
+        sa.Column("member_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Populate after upgrading with:
+    #   python -m app.cli rebuild-member-status
+    #   python -m app.cli rebuild-org-rollups
+
+
+def downgrade():
+
+    op.drop_table("org_status_rollups")
+    op.drop_index("ix_organizations_parent_id", table_name="organizations")
+    op.drop_column("organizations", "parent_id")
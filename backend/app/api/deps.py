@@ -4,9 +4,9 @@ from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from app.core.principal import AccountPrincipal, get_account_principal
 from app.core.security import decode_token
 from app.db.session import SessionLocal
-from app.models.account import Account
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
@@ -17,20 +17,20 @@ def get_db():
     finally:
         db.close()
 
-def get_current_account(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> Account:
+def get_current_account(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> AccountPrincipal:
     try:
         payload = decode_token(token)
         account_id = payload["sub"]
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
-    acct = db.get(Account, account_id)
+    acct = get_account_principal(db, account_id)
     if not acct or not acct.is_active:
         raise HTTPException(status_code=401, detail="Account inactive or missing")
     return acct
 
 def require_role(*roles: str):
-    def _inner(acct: Account = Depends(get_current_account)) -> Account:
+    def _inner(acct: AccountPrincipal = Depends(get_current_account)) -> AccountPrincipal:
         if acct.role not in roles:
             raise HTTPException(status_code=403, detail="Insufficient role")
         return acct
@@ -4,11 +4,9 @@ from fastapi import Depends, HTTPException, Header
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account
-from app.core.authz import Action, decide_action_for_role, can_control_service_member, can_org_access_service_member
-
-# NOTE: adjust import paths/names to match your models
+from app.core.access_resolver import resolve_member_access
+from app.core.authz import Action, Permission, decide_action_for_role, decide_member_action
 from app.models.service_member import ServiceMember
-from app.models.service_member_share import ServiceMemberShare  # if your project uses a different name, change it
 
 
 def require_role_action(action: Action):
@@ -20,68 +18,57 @@ def require_role_action(action: Action):
     return _dep
 
 
-def require_service_member_access(action: Action, *, allow_shared_read: bool = True):
+def authorize_service_member(
+    db: Session,
+    acct,
+    service_member_id: str,
+    action: Action,
+    *,
+    allow_shared_read: bool = True,
+    with_stp: bool = True,
+) -> ServiceMember:
     """
     Enforces:
     - role allowed for action
-    - resource-level rules:
-      - controller account can read/write/share/upload
-      - subject account can read/write if assigned to them
-      - org can read if same org_id
-      - shared accounts can read if share exists (read-only unless share grants edit)
+    - resource-level rules, resolved in one query (app.core.access_resolver):
+      - controller account (subject, else creator) can do anything
+      - owner/admin accounts act as controllers
+      - the creator keeps view after control passes to the subject
+      - accepted account or org shares grant view, or edit if the share does
+      - org accounts see members shared to their org or a unit below it
+    With allow_shared_read=False, reads also require control. For routes
+    that take the member id from the body instead of the path.
+    """
+    # global role policy
+    d = decide_action_for_role(acct.role, action)
+    if not d.allowed:
+        raise HTTPException(status_code=403, detail=d.reason)
+
+    sm, permission = resolve_member_access(db, acct, service_member_id, with_stp=with_stp)
+    if not sm:
+        raise HTTPException(status_code=404, detail="Service member not found")
+
+    if action == Action.SM_READ and not allow_shared_read and permission < Permission.CONTROL:
+        raise HTTPException(status_code=403, detail="Not authorized for this service member")
+
+    d = decide_member_action(permission, action)
+    if not d.allowed:
+        raise HTTPException(status_code=403, detail="Not authorized for this service member")
+    return sm
+
+
+def require_service_member_access(action: Action, *, allow_shared_read: bool = True, with_stp: bool = True):
+    """
+    authorize_service_member for the {service_member_id} path parameter.
     """
     def _dep(
         service_member_id: str,
         db: Session = Depends(get_db),
         acct=Depends(get_current_account),
     ):
-        # global role policy
-        d = decide_action_for_role(acct.role, action)
-        if not d.allowed:
-            raise HTTPException(status_code=403, detail=d.reason)
-
-        sm = db.get(ServiceMember, service_member_id)
-        if not sm:
-            raise HTTPException(status_code=404, detail="Service member not found")
-
-        # Controller access
-        if can_control_service_member(
-            actor_account_id=acct.id,
-            service_member_creator_account_id=getattr(sm, "creator_account_id", None),
-            service_member_subject_account_id=getattr(sm, "subject_account_id", None),
-        ):
-            return sm
-
-        # Org scoped read
-        if action == Action.SM_READ and can_org_access_service_member(
-            actor_org_id=getattr(acct, "organization_id", None),
-            service_member_org_id=getattr(sm, "organization_id", None),
-        ):
-            return sm
-
-        # Shared access (read-only by default)
-        if allow_shared_read and action == Action.SM_READ:
-            share = (
-                db.query(ServiceMemberShare)
-                .filter(ServiceMemberShare.service_member_id == service_member_id)
-                .filter(ServiceMemberShare.shared_with_account_id == acct.id)
-                .one_or_none()
-            )
-            if share:
-                return sm
-
-        # Shared write only if explicit edit permission exists on share
-        if action in (Action.SM_WRITE_STP, Action.SM_UPLOAD, Action.SM_SHARE):
-            share = (
-                db.query(ServiceMemberShare)
-                .filter(ServiceMemberShare.service_member_id == service_member_id)
-                .filter(ServiceMemberShare.shared_with_account_id == acct.id)
-                .one_or_none()
-            )
-            if share and getattr(share, "can_edit", False):
-                return sm
-
-        raise HTTPException(status_code=403, detail="Not authorized for this service member")
+        return authorize_service_member(
+            db, acct, service_member_id, action, allow_shared_read=allow_shared_read, with_stp=with_stp
+        )
 
     return _dep
 
@@ -1,29 +1,102 @@
 from __future__ import annotations
 
+from concurrent.futures import TimeoutError as HashTimeout
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.principal import get_account_principal
+from app.core.process_pool import PoolBusy
+from app.core.security import hash_password, verify_and_update_password, create_access_token
+from app.core.session_service import (
+    InvalidRefreshToken,
+    RefreshTokenReused,
+    issue_refresh_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
 from app.models.account import Account
-from app.schemas.auth import RegisterIn, LoginIn, TokenOut
+from app.schemas.auth import RegisterIn, LoginIn, RefreshIn, TokenOut
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many sign-in requests, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
 @router.post("/register", response_model=TokenOut)
 def register(data: RegisterIn, db: Session = Depends(get_db)):
     existing = db.query(Account).filter(Account.email == data.email).first()
     if existing:
         raise HTTPException(status_code=409, detail="Email already registered")
-    acct = Account(email=data.email, password_hash=hash_password(data.password), role="user", tier_code="SINGLE_FREE")
+    try:
+        password_hash = hash_password(data.password)
+    except (PoolBusy, HashTimeout) as e:
+        raise _hasher_busy() from e
+    acct = Account(email=data.email, password_hash=password_hash, role="user", tier_code="SINGLE_FREE")
     db.add(acct)
+    db.flush()
+    out = TokenOut(
+        access_token=create_access_token(acct.id, acct.role),
+        refresh_token=issue_refresh_token(db, acct.id),
+    )
     db.commit()
-    db.refresh(acct)
-    return TokenOut(access_token=create_access_token(acct.id, acct.role))
+    return out
 
 @router.post("/login", response_model=TokenOut)
 def login(data: LoginIn, db: Session = Depends(get_db)):
     acct = db.query(Account).filter(Account.email == data.email).first()
-    if not acct or not verify_password(data.password, acct.password_hash):
+    if not acct:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    try:
+        ok, new_hash = verify_and_update_password(data.password, acct.password_hash)
+    except (PoolBusy, HashTimeout) as e:
+        raise _hasher_busy() from e
+    if not ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    return TokenOut(access_token=create_access_token(acct.id, acct.role))
\ No newline at end of file
+    if not acct.is_active:
+        raise HTTPException(status_code=401, detail="Account inactive")
+    if new_hash:
+        # configured bcrypt cost changed since this hash was made
+        acct.password_hash = new_hash
+    out = TokenOut(
+        access_token=create_access_token(acct.id, acct.role),
+        refresh_token=issue_refresh_token(db, acct.id),
+    )
+    db.commit()
+    return out
+
+@router.post("/refresh", response_model=TokenOut)
+def refresh(data: RefreshIn, db: Session = Depends(get_db)):
+    """
+    Trades a refresh token for a new access token and a new refresh token.
+    No password check: one indexed lookup by token hash.
+    """
+    try:
+        account_id, refresh_token = rotate_refresh_token(db, data.refresh_token)
+    except RefreshTokenReused as e:
+        db.commit()  # keep the family revocation
+        raise HTTPException(status_code=401, detail=str(e)) from e
+    except InvalidRefreshToken as e:
+        raise HTTPException(status_code=401, detail=str(e)) from e
+
+    acct = get_account_principal(db, account_id)
+    if not acct or not acct.is_active:
+        db.rollback()
+        raise HTTPException(status_code=401, detail="Account inactive or missing")
+    db.commit()
+    return TokenOut(access_token=create_access_token(acct.id, acct.role), refresh_token=refresh_token)
+
+@router.post("/logout")
+def logout(data: RefreshIn, db: Session = Depends(get_db)):
+    """
+    Revokes the refresh token and every token rotated from the same login.
+    Access tokens already issued stay valid until they expire.
+    """
+    revoke_refresh_token(db, data.refresh_token)
+    db.commit()
+    return {"ok": True}
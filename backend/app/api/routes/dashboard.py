@@ -1,40 +1,60 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Response
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_current_account
+from app.api.deps import get_db
+from app.api.deps_authz import require_role_action, require_service_member_access
+from app.core.access_resolver import resolve_members_access
+from app.core.authz import Action, Permission, decide_member_action
+from app.core.etag import etag_matches, make_etag
 from app.models.service_member import ServiceMember
-from app.domain.dashboard_cards import (
-    build_perstats_card,
-    build_fitness_card,
-    build_training_card,
-    build_awards_card,
-    build_readiness_card,
-)
+from app.domain.card_evaluator import CardEvaluator
+from app.schemas.dashboard import DashboardCardsBatchIn
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/{service_member_id}/cards")
 def get_dashboard_cards(
-    service_member_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    sm: ServiceMember = Depends(require_service_member_access(Action.SM_READ, with_stp=False)),
+):
+    # Authorized and ETag built without loading stp_data
+    as_of = datetime.utcnow()
+    etag = make_etag("sm", sm.id, sm.version, as_of.date())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return CardEvaluator(as_of).evaluate(sm.stp_data or {})
+
+
+@router.post("/cards")
+def get_dashboard_cards_batch(
+    data: DashboardCardsBatchIn,
     db: Session = Depends(get_db),
-    acct=Depends(get_current_account),
+    acct=Depends(require_role_action(Action.SM_READ)),
 ):
-    sm = db.get(ServiceMember, service_member_id)
-    if not sm:
-        raise HTTPException(status_code=404, detail="Service member not found")
-
-    controller = sm.subject_account_id or sm.creator_account_id
-    if controller != acct.id and acct.role not in ("admin", "owner", "org"):
-        raise HTTPException(status_code=403, detail="Not authorized")
-
-    stp = sm.stp_data or {}
-
-    return {
-        "perstats": build_perstats_card(stp),
-        "fitness": build_fitness_card(stp),
-        "training": build_training_card(stp),
-        "awards": build_awards_card(stp),
-        "readiness": build_readiness_card(stp),
-    }
+    """
+    Cards for many members in one round trip. Members that are missing
+    or not visible are reported under errors; the rest still succeed.
+    """
+    ids = list(dict.fromkeys(data.service_member_ids))
+    resolved = resolve_members_access(db, acct, ids, with_stp=True)
+
+    evaluator = CardEvaluator()
+    cards: dict[str, dict] = {}
+    errors: dict[str, dict] = {}
+    for service_member_id in ids:
+        sm, permission = resolved.get(service_member_id, (None, Permission.NONE))
+        if sm is None:
+            errors[service_member_id] = {"status": 404, "detail": "Service member not found"}
+        elif not decide_member_action(permission, Action.SM_READ).allowed:
+            errors[service_member_id] = {"status": 403, "detail": "Not authorized"}
+        else:
+            cards[service_member_id] = evaluator.evaluate(sm.stp_data or {})
+    return {"cards": cards, "errors": errors}
@@ -1,31 +1,197 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account
+from app.core.config import settings
+from app.core.etag import etag_matches, make_etag
+from app.core.member_status_service import summarize_member_statuses
+from app.core.org_dashboard_sql import summarize_org_sql
+from app.core.org_drilldown_service import list_members_by_status
+from app.core.org_forecast_service import forecast_red
+from app.core.org_rollup_service import org_ancestor_ids, summarize_org_rollup
+from app.core.org_roster import org_member_ids
+from app.core.stp_items_service import summarize_items_by_type
+from app.db.session import SessionLocal
+from app.models.organization import Organization
 from app.models.service_member import ServiceMember
-from app.domain.org_dashboard import build_org_dashboard
+from app.domain.card_evaluator import CardEvaluator
+from app.domain.forecast import parse_horizons
+from app.domain.roster_export import EXPORT_FORMATS, encode_export, export_row
+from app.domain.org_dashboard_columnar import build_org_dashboard_columnar
 
 
 router = APIRouter(prefix="/org-dashboard", tags=["org-dashboard"])
 
 
+def _require_org_scope(db: Session, acct, organization_id: str) -> None:
+    if acct.role not in ("owner", "admin", "org"):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    # Org staff only see their own org and the units under it
+    if acct.role == "org" and (
+        acct.organization_id is None or acct.organization_id not in org_ancestor_ids(db, organization_id)
+    ):
+        raise HTTPException(status_code=403, detail="Not authorized for this organization")
+
+
+def _stream_org_stp(db: Session, organization_id: str):
+    """
+    Yields only the stp_data column for an org roster, fetched in
+    server-side batches so the full roster is never held in memory.
+    """
+    rows = db.execute(
+        select(ServiceMember.stp_data)
+        .where(ServiceMember.id.in_(org_member_ids(organization_id)))
+        .execution_options(yield_per=settings.org_dashboard_batch_size)
+    ).scalars()
+    for stp in rows:
+        yield stp or {}
+
+
+def _export_org_roster(organization_id: str, fmt: str):
+    """
+    Encoded export lines for an org roster. Runs after the response has
+    started, so it owns its session; rows come from a server-side cursor
+    and cards are computed as each row streams.
+    """
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(ServiceMember.id, ServiceMember.branch, ServiceMember.component, ServiceMember.stp_data)
+            .where(ServiceMember.id.in_(org_member_ids(organization_id)))
+            .order_by(ServiceMember.id)
+            .execution_options(yield_per=settings.org_dashboard_batch_size)
+        )
+        evaluator = CardEvaluator()
+        yield from encode_export(
+            (export_row(evaluator, *row) for row in rows),
+            fmt,
+        )
+
+
 @router.get("/{organization_id}/summary")
 def get_org_dashboard_summary(
     organization_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     acct=Depends(get_current_account),
 ):
-    if acct.role not in ("owner", "admin", "org"):
-        raise HTTPException(status_code=403, detail="Not authorized")
+    _require_org_scope(db, acct, organization_id)
+
+    version = db.execute(
+        select(Organization.version).where(Organization.id == organization_id)
+    ).scalar_one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    etag = make_etag("org", organization_id, version, datetime.utcnow().date())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    if settings.org_dashboard_source == "stream":
+        return build_org_dashboard_columnar(
+            _stream_org_stp(db, organization_id),
+            chunk_size=settings.org_dashboard_batch_size,
+        )
+    if settings.org_dashboard_source == "sql":
+        return summarize_org_sql(db, organization_id)
+    if settings.org_dashboard_source == "status_table":
+        return summarize_member_statuses(db, org_member_ids(organization_id))
+    return summarize_org_rollup(db, organization_id)
+
+
+@router.get("/{organization_id}/forecast")
+def get_org_dashboard_forecast(
+    organization_id: str,
+    horizons: str = Query("7,30,60,90", description="Comma-separated day horizons"),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Counts of members going red on fitness, readiness and training
+    within each horizon (cumulative from today).
+    """
+    _require_org_scope(db, acct, organization_id)
+
+    try:
+        parsed = parse_horizons(horizons)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
-    members = (
-        db.query(ServiceMember)
-        .filter(ServiceMember.organization_id == organization_id)
-        .all()
+    return forecast_red(db, org_member_ids(organization_id), parsed)
+
+
+@router.get("/{organization_id}/items")
+def get_org_dashboard_items(
+    organization_id: str,
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Training overdue/upcoming counts and pending awards per item type,
+    e.g. who is overdue on weapons qualification.
+    """
+    _require_org_scope(db, acct, organization_id)
+
+    return summarize_items_by_type(db, org_member_ids(organization_id))
+
+
+@router.get("/{organization_id}/export")
+def export_org_roster(
+    organization_id: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Whole org roster with card statuses, streamed as CSV or NDJSON.
+    """
+    _require_org_scope(db, acct, organization_id)
+
+    exists = db.execute(
+        select(Organization.id).where(Organization.id == organization_id)
+    ).scalar_one_or_none()
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    return StreamingResponse(
+        _export_org_roster(organization_id, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="org-{organization_id}-roster.{format}"'},
     )
 
-    stp_list = [m.stp_data or {} for m in members]
 
-    return build_org_dashboard(stp_list)
\ No newline at end of file
+@router.get("/{organization_id}/members")
+def list_org_dashboard_members(
+    organization_id: str,
+    card: str = Query(..., pattern="^(fitness|training|awards|readiness)$"),
+    status: str = Query(..., pattern="^(green|amber|red|gray)$"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Drill-down behind a summary count: members whose card has the given
+    status, soonest expiration first, one keyset page at a time.
+    """
+    _require_org_scope(db, acct, organization_id)
+
+    try:
+        return list_members_by_status(
+            db,
+            org_member_ids(organization_id),
+            card=card,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account, require_role
 from app.core.audit import audit
+from app.core.member_access_service import rebuild_member_access
+from app.core.org_rollup_service import org_ancestor_ids, rebuild_org_rollups
+from app.core.share_inbox_service import list_pending_org_shares
+from app.core.versioning import bump_org_versions
 from app.models.organization import Organization
-from app.schemas.organization import OrgCreateRequestIn, OrgOut
+from app.schemas.organization import OrgCreateRequestIn, OrgOut, OrgParentIn
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
@@ -51,4 +55,59 @@ def approve_org(org_id: str, db: Session = Depends(get_db), acct=Depends(require
           target_type="organization", target_id=org.id, meta={})
     db.commit()
     db.refresh(org)
-    return OrgOut(**org.__dict__)
\ No newline at end of file
+    return OrgOut(**org.__dict__)
+
+@router.post("/{org_id}/parent", response_model=OrgOut)
+def set_org_parent(data: OrgParentIn, org_id: str, db: Session = Depends(get_db), acct=Depends(require_role("admin","owner"))):
+    org = db.get(Organization, org_id)
+    if not org:
+        raise HTTPException(status_code=404, detail="Not found")
+    if data.parent_id is not None:
+        if not db.get(Organization, data.parent_id):
+            raise HTTPException(status_code=404, detail="Parent not found")
+        if org.id in org_ancestor_ids(db, data.parent_id):
+            raise HTTPException(status_code=409, detail="Parent would create a cycle")
+
+    # Rollups and org access above the old and new positions both change
+    affected = org_ancestor_ids(db, org.id)
+    org.parent_id = data.parent_id
+    db.add(org)
+    db.flush()
+    affected |= org_ancestor_ids(db, org.id)
+    rebuild_org_rollups(db, affected - {org.id})
+    rebuild_member_access(db, affected - {org.id})
+    bump_org_versions(db, affected - {org.id})
+
+    audit(db, actor_type="account", actor_id=acct.id, action="org.parent.set",
+          target_type="organization", target_id=org.id, meta={"parent_id": data.parent_id})
+    db.commit()
+    db.refresh(org)
+    return OrgOut(**org.__dict__)
+
+@router.get("/{org_id}/pending-shares")
+def list_org_pending_shares(
+    org_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Inbox of member shares awaiting this org's decision, oldest first,
+    answered with /shares/org-decision (or its bulk variant). Org accounts
+    may read their own org and any unit below it.
+    """
+    if acct.role not in ("owner", "admin", "org"):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    if not db.get(Organization, org_id):
+        raise HTTPException(status_code=404, detail="Not found")
+    # Org staff only see their own org's inbox and those of units under it
+    if acct.role == "org" and (
+        acct.organization_id is None or acct.organization_id not in org_ancestor_ids(db, org_id)
+    ):
+        raise HTTPException(status_code=403, detail="Not authorized for this organization")
+
+    try:
+        return list_pending_org_shares(db, org_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
@@ -1,18 +1,50 @@
 from __future__ import annotations
 
+import io
 import secrets
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, Query, Response, UploadFile
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account
+from app.api.deps_authz import require_service_member_access
 from app.core.audit import audit
+from app.core.authz import Action
+from app.core.etag import if_match_version, make_etag
+from app.core.member_access_service import sync_member_access
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.roster_import_service import import_service_members
+from app.core.stp_patch_service import apply_stp_patch
+from app.core.stp_sync import sync_stp_derived
+from app.core.versioning import bump_member_version
 from app.domain.branch_rules import validate_branch_component
+from app.domain.roster_import import detect_format, parse_import
+from app.domain.stp_patch import format_pointer, merge_patch_paths, validate_json_patch
+from app.models.member_access import MemberAccess
 from app.models.service_member import ServiceMember
-from app.models.share import ServiceMemberShare
-from app.schemas.service_member import ServiceMemberCreateIn, ServiceMemberOut, ClaimCodeOut
+from app.schemas.service_member import (
+    ServiceMemberCreateIn,
+    ServiceMemberOut,
+    ServiceMemberSummaryOut,
+    ServiceMemberPageOut,
+    ClaimCodeOut,
+)
 
 router = APIRouter(prefix="/service-members", tags=["service-members"])
 
+# Heavy columns a list caller can opt into with ?fields=
+OPTIONAL_LIST_FIELDS = {"stp_data": ServiceMember.stp_data}
+
+SUMMARY_COLUMNS = (
+    ServiceMember.id,
+    ServiceMember.creator_account_id,
+    ServiceMember.subject_account_id,
+    ServiceMember.branch,
+    ServiceMember.component,
+    ServiceMember.version,
+)
+
 @router.post("", response_model=ServiceMemberOut)
 def create_service_member(
     data: ServiceMemberCreateIn,
@@ -29,8 +61,9 @@ def create_service_member(
         stp_data=data.stp_data or {},
     )
     db.add(sm)
-    db.commit()
-    db.refresh(sm)
+    db.flush()  # one transaction: the member never exists without its member_access rows
+    sync_stp_derived(db, sm)
+    sync_member_access(db, [sm.id])
 
     audit(
         db,
@@ -41,26 +74,133 @@ def create_service_member(
         target_id=sm.id,
         meta={"branch": sm.branch, "component": sm.component},
     )
+    out = ServiceMemberOut(**sm.__dict__)  # read before commit expires sm
     db.commit()
-    return ServiceMemberOut(**sm.__dict__)
+    return out
+
+@router.post("/import")
+def import_service_member_roster(
+    file: UploadFile = File(...),
+    format: str | None = Query(None, pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    """
+    Bulk-creates service members from a CSV (branch, component, optional
+    stp_data JSON and extra stp columns) or NDJSON upload. The file is
+    read line by line; valid rows are inserted in batches and invalid
+    ones are reported by line number.
+    """
+    fmt = format or detect_format(file.filename)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="Specify format=csv|ndjson or upload a .csv/.ndjson file")
+
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return import_service_members(db, acct.id, parse_import(lines, fmt))
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail="Upload must be UTF-8 text") from e
+    finally:
+        lines.detach()
 
-@router.get("", response_model=list[ServiceMemberOut])
+@router.get("", response_model=ServiceMemberPageOut, response_model_exclude_unset=True)
 def list_accessible_service_members(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = Query(None),
+    fields: str | None = Query(None, description="Comma-separated extra fields, e.g. stp_data"),
+    db: Session = Depends(get_db),
+    acct=Depends(get_current_account),
+):
+    extra = [f.strip() for f in (fields or "").split(",") if f.strip()]
+    unknown = set(extra) - OPTIONAL_LIST_FIELDS.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    # Accessible if: subject, creator, or shared (accepted); see member_access
+    query = (
+        select(*SUMMARY_COLUMNS, *(OPTIONAL_LIST_FIELDS[f] for f in extra))
+        .join(MemberAccess, MemberAccess.service_member_id == ServiceMember.id)
+        .where(MemberAccess.principal_type == "account")
+        .where(MemberAccess.principal_id == acct.id)
+    )
+    if cursor:
+        try:
+            (after_id,) = decode_cursor(cursor, 1)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if not isinstance(after_id, str):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(MemberAccess.service_member_id > after_id)
+
+    rows = db.execute(query.order_by(MemberAccess.service_member_id).limit(limit + 1)).mappings().all()
+    page = rows[:limit]
+    next_cursor = encode_cursor([page[-1]["id"]]) if len(rows) > limit else None
+    return ServiceMemberPageOut(
+        items=[ServiceMemberSummaryOut(**row) for row in page],
+        next_cursor=next_cursor,
+    )
+
+@router.patch("/{service_member_id}/stp", response_model=ServiceMemberOut)
+def patch_service_member_stp(
+    service_member_id: str,
+    response: Response,
+    patch: dict | list = Body(...),
+    content_type: str | None = Header(default=None),
+    if_match: str | None = Header(default=None),
+    sm: ServiceMember = Depends(require_service_member_access(Action.SM_WRITE_STP, with_stp=False)),
     db: Session = Depends(get_db),
     acct=Depends(get_current_account),
 ):
-    # Accessible if: subject, creator, or shared (accepted)
-    owned = db.query(ServiceMember).filter(
-        (ServiceMember.subject_account_id == acct.id) | (ServiceMember.creator_account_id == acct.id)
+    """
+    Partial stp_data update applied in Postgres. Send a JSON Merge Patch
+    (application/merge-patch+json, an object) or a JSON Patch
+    (application/json-patch+json, an array of add/replace/remove ops),
+    with If-Match set to the member's ETag or "<version>".
+    """
+    expected = if_match_version(if_match)
+    if expected is None:
+        raise HTTPException(status_code=428, detail="If-Match with the current version is required")
+    if expected != sm.version:
+        raise HTTPException(status_code=409, detail=f"stp_data was modified (current version {sm.version})")
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    as_json_patch = media_type == "application/json-patch+json" or (
+        media_type != "application/merge-patch+json" and isinstance(patch, list)
     )
-    shared_ids = (
-        db.query(ServiceMemberShare.service_member_id)
-        .filter(ServiceMemberShare.target_account_id == acct.id, ServiceMemberShare.status == "accepted")
-        .subquery()
+    try:
+        if as_json_patch:
+            ops = validate_json_patch(patch)
+            paths = [format_pointer(op.path) for op in ops]
+            result = apply_stp_patch(db, service_member_id, expected, ops=ops)
+        else:
+            paths = merge_patch_paths(patch)
+            result = apply_stp_patch(db, service_member_id, expected, merge_patch=patch)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    if result is None:
+        raise HTTPException(status_code=409, detail="stp_data was modified concurrently")
+    _, new_version = result
+
+    sm = db.get(ServiceMember, service_member_id, populate_existing=True)
+    sync_stp_derived(db, sm)
+    audit(
+        db,
+        actor_type="account",
+        actor_id=acct.id,
+        action="service_member.stp.patch",
+        target_type="service_member",
+        target_id=sm.id,
+        meta={
+            "format": "json-patch" if as_json_patch else "merge-patch",
+            "paths": paths,
+            "version": new_version,
+        },
     )
-    shared = db.query(ServiceMember).filter(ServiceMember.id.in_(shared_ids))
-    sms = owned.union(shared).all()
-    return [ServiceMemberOut(**sm.__dict__) for sm in sms]
+    out = ServiceMemberOut(**sm.__dict__)  # read before commit expires sm
+    db.commit()
+
+    response.headers["ETag"] = make_etag("sm", out.id, new_version, datetime.utcnow().date())
+    return out
 
 @router.post("/{service_member_id}/issue-claim", response_model=ClaimCodeOut)
 def issue_claim_code(
@@ -107,6 +247,9 @@ def claim_service_member(
     sm.subject_account_id = acct.id
     sm.claim_code = None
     db.add(sm)
+    db.flush()
+    bump_member_version(db, sm.id)
+    sync_member_access(db, [sm.id])
     db.commit()
     db.refresh(sm)
 
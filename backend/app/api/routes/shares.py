@@ -5,9 +5,21 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account
 from app.core.audit import audit
+from app.core.member_access_service import sync_member_access
+from app.core.org_rollup_service import member_rollup_orgs, org_ancestor_ids, reconcile_member_orgs
+from app.core.share_bulk_service import bulk_decide_org_shares, bulk_share_to_org
+from app.core.versioning import bump_member_org_versions, bump_member_version, bump_org_versions
+from app.domain.bulk_share import DECISIONS
+from app.models.organization import Organization
 from app.models.service_member import ServiceMember
 from app.models.share import ServiceMemberShare
-from app.schemas.share import ShareToAccountIn, ShareToOrgIn, ShareDecisionIn
+from app.schemas.share import (
+    ShareToAccountIn,
+    ShareToOrgIn,
+    ShareDecisionIn,
+    ShareToOrgBulkIn,
+    ShareDecisionBulkIn,
+)
 
 router = APIRouter(prefix="/shares", tags=["shares"])
 
@@ -31,6 +43,9 @@ def share_to_account(data: ShareToAccountIn, db: Session = Depends(get_db), acct
         status="accepted",  # account sharing accepted immediately (no second-party acceptance specified)
     )
     db.add(share)
+    db.flush()
+    sync_member_access(db, [sm.id])
+    bump_member_version(db, sm.id)
     audit(db, actor_type="account", actor_id=acct.id, action="share.account.grant",
           target_type="service_member", target_id=sm.id, meta={"permission": data.permission})
     db.commit()
@@ -50,11 +65,29 @@ def share_to_org(data: ShareToOrgIn, db: Session = Depends(get_db), acct=Depends
         status="pending",
     )
     db.add(share)
+    bump_member_version(db, sm.id)
     audit(db, actor_type="account", actor_id=acct.id, action="share.org.request",
           target_type="service_member", target_id=sm.id, meta={"target_org_id": data.target_org_id})
     db.commit()
     return {"share_id": share.id, "status": share.status}
 
+@router.post("/to-org/bulk")
+def share_to_org_bulk(data: ShareToOrgBulkIn, db: Session = Depends(get_db), acct=Depends(get_current_account)):
+    """
+    /to-org for many members. Members the caller does not control, unknown
+    ids and members already shared (pending or accepted) with the org are
+    reported per item instead of failing the request.
+    """
+    if not db.get(Organization, data.target_org_id):
+        raise HTTPException(status_code=404, detail="Organization not found")
+
+    results = bulk_share_to_org(db, acct.id, data.service_member_ids, data.target_org_id)
+    return {
+        "requested": len(results),
+        "created": sum(r["status"] == "pending" for r in results),
+        "results": results,
+    }
+
 @router.post("/org-decision")
 def org_accept_deny(data: ShareDecisionIn, db: Session = Depends(get_db), acct=Depends(get_current_account)):
     # For MVP: allow org admins later; currently gate by role=org or admin/owner
@@ -64,17 +97,81 @@ def org_accept_deny(data: ShareDecisionIn, db: Session = Depends(get_db), acct=D
     share = db.get(ServiceMemberShare, data.share_id)
     if not share or not share.target_org_id:
         raise HTTPException(status_code=404, detail="Org share not found")
+    # Org staff only decide for their own org and the units under it
+    if acct.role == "org" and (
+        acct.organization_id is None or acct.organization_id not in org_ancestor_ids(db, share.target_org_id)
+    ):
+        raise HTTPException(status_code=403, detail="Not authorized for this organization")
 
     if share.status != "pending":
         raise HTTPException(status_code=409, detail="Already decided")
 
-    if data.decision not in ("accepted", "denied"):
+    if data.decision not in DECISIONS:
         raise HTTPException(status_code=400, detail="Invalid decision")
 
+    before = member_rollup_orgs(db, [share.service_member_id]).get(share.service_member_id, set())
     share.status = data.decision
     db.add(share)
+    if share.status == "accepted":
+        db.flush()
+        reconcile_member_orgs(db, db.get(ServiceMember, share.service_member_id), before)
+        bump_member_org_versions(db, share.service_member_id)
+        sync_member_access(db, [share.service_member_id])
+    bump_member_version(db, share.service_member_id)
 
     audit(db, actor_type="account", actor_id=acct.id, action=f"share.org.{data.decision}",
           target_type="share", target_id=share.id, meta={"reason": data.reason})
     db.commit()
-    return {"share_id": share.id, "status": share.status}
\ No newline at end of file
+    return {"share_id": share.id, "status": share.status}
+
+@router.post("/org-decision/bulk")
+def org_accept_deny_bulk(data: ShareDecisionBulkIn, db: Session = Depends(get_db), acct=Depends(get_current_account)):
+    """
+    /org-decision for many shares at once; shares that are not pending org
+    shares are reported per item.
+    """
+    if acct.role not in ("org", "admin", "owner"):
+        raise HTTPException(status_code=403, detail="Org decision not permitted for role")
+    if acct.role == "org" and acct.organization_id is None:
+        raise HTTPException(status_code=403, detail="Not authorized for this organization")
+    if data.decision not in DECISIONS:
+        raise HTTPException(status_code=400, detail="Invalid decision")
+
+    # Org staff only decide for their own org and the units under it
+    results = bulk_decide_org_shares(
+        db, acct.id, data.share_ids, data.decision, data.reason,
+        org_scope=acct.organization_id if acct.role == "org" else None,
+    )
+    return {
+        "requested": len(results),
+        "decided": sum(r["status"] == data.decision for r in results),
+        "results": results,
+    }
+
+@router.post("/{share_id}/revoke")
+def revoke_share(share_id: str, db: Session = Depends(get_db), acct=Depends(get_current_account)):
+    share = db.get(ServiceMemberShare, share_id)
+    if not share:
+        raise HTTPException(status_code=404, detail="Share not found")
+    sm = db.get(ServiceMember, share.service_member_id)
+    if acct.role not in ("admin", "owner"):
+        _controller_check(sm, acct.id)
+    if share.status not in ("pending", "accepted"):
+        raise HTTPException(status_code=409, detail="Share is not active")
+
+    was_accepted = share.status == "accepted"
+    before = member_rollup_orgs(db, [sm.id]).get(sm.id, set())
+    share.status = "revoked"
+    db.add(share)
+    db.flush()
+    if was_accepted and share.target_org_id:
+        # Leaving an org takes the member out of that org's (and its parents') rollups
+        reconcile_member_orgs(db, sm, before)
+        bump_org_versions(db, before)
+    sync_member_access(db, [sm.id])
+    bump_member_version(db, sm.id)
+
+    audit(db, actor_type="account", actor_id=acct.id, action="share.revoke",
+          target_type="share", target_id=share.id, meta={"previous_status": "accepted" if was_accepted else "pending"})
+    db.commit()
+    return {"share_id": share.id, "status": share.status}
@@ -4,9 +4,16 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_account
+from app.api.deps_authz import require_support_verification
+from app.core.audit import audit
 from app.core.authz import Role
+from app.core.principal import AccountPrincipal, account_cache, invalidate_account
+from app.core.security import token_cache, token_decode_latency
+from app.core.session_service import revoke_account_sessions
 from app.core.support_code_service import generate_support_code
 from app.models.account import Account
+from app.models.organization import Organization
+from app.schemas.support import AccountRoleIn, AccountStatusOut
 
 router = APIRouter(prefix="/support", tags=["support"])
 
@@ -14,7 +21,7 @@ router = APIRouter(prefix="/support", tags=["support"])
 @router.post("/generate-verify-code")
 def generate_verify_code(
     db: Session = Depends(get_db),
-    acct: Account = Depends(get_current_account),
+    acct: AccountPrincipal = Depends(get_current_account),
 ):
     """
     Generates a 6-digit support verification code.
@@ -31,4 +38,105 @@ def generate_verify_code(
         "message": "Verification code generated",
         "expires_in_minutes": 5,
         "code": code,  # In production this would be sent via SMS/email instead
-    }
\ No newline at end of file
+    }
+
+
+def _get_target_account(db: Session, account_id: str, acct: AccountPrincipal) -> Account:
+    target = db.get(Account, account_id)
+    if not target:
+        raise HTTPException(status_code=404, detail="Account not found")
+    if target.role == Role.OWNER.value and acct.role != Role.OWNER.value:
+        raise HTTPException(status_code=403, detail="Only an owner can change an owner account")
+    return target
+
+
+@router.post("/accounts/{account_id}/deactivate", response_model=AccountStatusOut)
+def deactivate_account(
+    account_id: str,
+    db: Session = Depends(get_db),
+    acct: AccountPrincipal = Depends(require_support_verification()),
+):
+    """
+    Disables sign-in for an account. Requires a support verification code.
+    """
+    target = _get_target_account(db, account_id, acct)
+    target.is_active = False
+    revoke_account_sessions(db, target.id)
+    audit(
+        db,
+        actor_type="account",
+        actor_id=acct.id,
+        action="account.deactivate",
+        target_type="account",
+        target_id=target.id,
+        meta={},
+    )
+    out = AccountStatusOut(
+        id=target.id,
+        role=target.role,
+        is_active=target.is_active,
+        tier_code=target.tier_code,
+        organization_id=target.organization_id,
+    )
+    db.commit()
+    invalidate_account(account_id)
+    return out
+
+
+@router.post("/accounts/{account_id}/role", response_model=AccountStatusOut)
+def change_account_role(
+    account_id: str,
+    data: AccountRoleIn,
+    db: Session = Depends(get_db),
+    acct: AccountPrincipal = Depends(require_support_verification()),
+):
+    """
+    Changes an account's role. Granting owner or admin is owner-only;
+    org accounts must name the organization they act for.
+    """
+    if data.role not in {r.value for r in Role}:
+        raise HTTPException(status_code=400, detail="Unknown role")
+    if data.role in (Role.OWNER.value, Role.ADMIN.value) and acct.role != Role.OWNER.value:
+        raise HTTPException(status_code=403, detail="Only an owner can grant owner or admin")
+
+    if data.role == Role.ORG.value:
+        if not data.organization_id or not db.get(Organization, data.organization_id):
+            raise HTTPException(status_code=400, detail="Org accounts need an existing organization_id")
+
+    target = _get_target_account(db, account_id, acct)
+    previous = target.role
+    target.role = data.role
+    target.organization_id = data.organization_id if data.role == Role.ORG.value else None
+    audit(
+        db,
+        actor_type="account",
+        actor_id=acct.id,
+        action="account.role.change",
+        target_type="account",
+        target_id=target.id,
+        meta={"from": previous, "to": data.role, "organization_id": target.organization_id},
+    )
+    out = AccountStatusOut(
+        id=target.id,
+        role=target.role,
+        is_active=target.is_active,
+        tier_code=target.tier_code,
+        organization_id=target.organization_id,
+    )
+    db.commit()
+    invalidate_account(account_id)
+    return out
+
+
+@router.get("/auth-cache/stats")
+def auth_cache_stats(acct: AccountPrincipal = Depends(get_current_account)):
+    """
+    Hit/miss counters for the account principal and token claims caches,
+    plus JWT decode latency on misses. Owner/admin only.
+    """
+    if acct.role not in (Role.OWNER.value, Role.ADMIN.value):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return {
+        "accounts": account_cache.stats(),
+        "tokens": {**token_cache.stats(), "decode_latency": token_decode_latency.stats()},
+    }
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import os
+import uuid
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+from starlette.datastructures import UploadFile
 
 from app.api.deps import get_db, get_current_account
+from app.api.deps_authz import authorize_service_member
 from app.core.config import settings
 from app.core.audit import audit
+from app.core.authz import Action
+from app.core.blob_store import store_upload
+from app.core.upload_storage import MULTIPART_OVERHEAD, UploadTooLarge, max_upload_bytes, stream_to_file
 from app.models.upload import UploadFile as UploadFileModel
-from app.models.service_member import ServiceMember
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
 
@@ -20,22 +25,48 @@ def _ensure_storage_dir() -> Path:
     return p
 
 @router.post("/spot")
-def upload_to_spot(
-    service_member_id: str = Form(...),
-    spot_key: str = Form(...),
-    confirm_rotate: bool = Form(False),
-    file: UploadFile = File(...),
+async def upload_to_spot(
+    request: Request,
+    content_length: int | None = Header(default=None),
     db: Session = Depends(get_db),
     acct=Depends(get_current_account),
 ):
-    sm = db.get(ServiceMember, service_member_id)
-    if not sm:
-        raise HTTPException(status_code=404, detail="Service member not found")
+    """
+    Multipart form: service_member_id, spot_key, confirm_rotate (optional)
+    and file. The body is parsed here instead of through Form/File params so
+    an oversized upload is refused from Content-Length before it is read.
+    """
+    # A spot limit can only lower the tier's, so this bounds every spot
+    ceiling = max_upload_bytes(
+        "",
+        acct.tier_code,
+        default=settings.max_upload_bytes,
+        by_tier=settings.max_upload_bytes_by_tier,
+        by_spot={},
+    )
+    if content_length is not None and content_length > ceiling + MULTIPART_OVERHEAD:
+        raise HTTPException(status_code=413, detail=f"File exceeds {ceiling} bytes")
+
+    async with request.form() as form:
+        service_member_id = form.get("service_member_id")
+        spot_key = form.get("spot_key")
+        file = form.get("file")
+        if not (isinstance(service_member_id, str) and isinstance(spot_key, str) and isinstance(file, UploadFile)):
+            raise HTTPException(status_code=422, detail="service_member_id, spot_key and file are required")
+        confirm_rotate = str(form.get("confirm_rotate", "false")).lower() in ("1", "true", "yes", "on")
+        return await run_in_threadpool(
+            _upload_to_spot, db, acct, service_member_id, spot_key, confirm_rotate, file
+        )
 
-    # Controller: subject if linked else creator
-    controller = sm.subject_account_id or sm.creator_account_id
-    if controller != acct.id and acct.role not in ("admin","owner","org"):
-        raise HTTPException(status_code=403, detail="No permission")
+def _upload_to_spot(
+    db: Session,
+    acct,
+    service_member_id: str,
+    spot_key: str,
+    confirm_rotate: bool,
+    file: UploadFile,
+):
+    authorize_service_member(db, acct, service_member_id, Action.SM_UPLOAD, with_stp=False)
 
     storage_dir = _ensure_storage_dir()
     existing = (
@@ -56,35 +87,48 @@ def upload_to_spot(
             "current_files": [e.filename for e in existing],
         }
 
+    limit = max_upload_bytes(
+        spot_key,
+        acct.tier_code,
+        default=settings.max_upload_bytes,
+        by_tier=settings.max_upload_bytes_by_tier,
+        by_spot=settings.max_upload_bytes_by_spot,
+    )
+    # Starlette already knows the spooled size; skip the copy when it is over
+    if file.size is not None and file.size > limit:
+        raise HTTPException(status_code=413, detail=f"File exceeds {limit} bytes for this spot")
+
+    # Persist new file first so a failed or oversized upload never costs the oldest one
+    file_id = str(uuid.uuid4())
+    staging_dir = storage_dir / ".staging"
+    staging_dir.mkdir(exist_ok=True)
+    try:
+        stored = stream_to_file(file.file, staging_dir / file_id, max_bytes=limit)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=f"File exceeds {e.limit} bytes for this spot") from e
+
+    rotated = None
     if len(existing) >= settings.max_uploads_per_spot and confirm_rotate:
-        oldest = existing[0]
-        try:
-            if os.path.exists(oldest.storage_path):
-                os.remove(oldest.storage_path)
-        except Exception:
-            pass
-        db.delete(oldest)
+        rotated = existing[0]
         audit(db, actor_type="account", actor_id=acct.id, action="upload.rotate.delete_oldest",
-              target_type="upload_file", target_id=oldest.id, meta={"spot_key": spot_key, "filename": oldest.filename})
-        db.commit()
-
-    # Persist new file
-    safe_name = f"{service_member_id}_{spot_key.replace('.','_')}_{file.filename}"
-    dest = storage_dir / safe_name
-    content = file.file.read()
-    dest.write_bytes(content)
+              target_type="upload_file", target_id=rotated.id, meta={"spot_key": spot_key, "filename": rotated.filename})
 
     rec = UploadFileModel(
+        id=file_id,
         service_member_id=service_member_id,
         spot_key=spot_key,
         filename=file.filename,
         content_type=file.content_type or "application/octet-stream",
-        size_bytes=len(content),
-        storage_path=str(dest),
+        size_bytes=stored.size_bytes,
     )
-    db.add(rec)
     audit(db, actor_type="account", actor_id=acct.id, action="upload.add",
-          target_type="service_member", target_id=service_member_id, meta={"spot_key": spot_key, "filename": file.filename})
-    db.commit()
+          target_type="service_member", target_id=service_member_id,
+          meta={"spot_key": spot_key, "filename": file.filename, "size_bytes": stored.size_bytes, "sha256": stored.sha256})
+    try:
+        # Identical content already stored for any member is reused, not written again;
+        # the oldest file goes only once the new record (and its deletion) is committed
+        store_upload(db, stored, storage_dir, rec, rotated=rotated)
+    finally:
+        stored.path.unlink(missing_ok=True)  # still staged only if the blob step failed
 
-    return {"uploaded": True, "file_id": rec.id, "filename": rec.filename}
\ No newline at end of file
+    return {"uploaded": True, "file_id": file_id, "filename": file.filename, "size_bytes": stored.size_bytes, "sha256": stored.sha256}
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from app.db.session import SessionLocal
+
+
+def _rebuild_member_status(args: argparse.Namespace) -> None:
+    from app.core.member_status_service import rebuild_member_statuses
+
+    with SessionLocal() as db:
+        total = rebuild_member_statuses(db, batch_size=args.batch_size)
+    print(f"rebuilt {total} member status rows")
+
+
+def _rebuild_org_rollups(args: argparse.Namespace) -> None:
+    from app.core.org_rollup_service import rebuild_org_rollups
+
+    with SessionLocal() as db:
+        rebuild_org_rollups(db)
+        db.commit()
+    print("rebuilt org status rollups")
+
+
+def _backfill_stp_items(args: argparse.Namespace) -> None:
+    from app.core.stp_items_service import backfill_stp_items
+
+    with SessionLocal() as db:
+        total = backfill_stp_items(db, batch_size=args.batch_size)
+    print(f"backfilled training/award items for {total} members")
+
+
+def _rebuild_member_access(args: argparse.Namespace) -> None:
+    from app.core.member_access_service import rebuild_member_access
+
+    with SessionLocal() as db:
+        rebuild_member_access(db)
+        db.commit()
+    print("rebuilt member_access")
+
+
+def _check_member_access(args: argparse.Namespace) -> None:
+    from app.core.member_access_service import check_member_access
+
+    with SessionLocal() as db:
+        diff = check_member_access(db)
+    print(json.dumps(diff))
+    if diff["missing"] or diff["extra"]:
+        raise SystemExit(1)
+
+
+def _backfill_upload_blobs(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from app.core.blob_store import backfill_upload_blobs
+    from app.core.config import settings
+
+    with SessionLocal() as db:
+        counts = backfill_upload_blobs(db, Path(settings.upload_storage_dir), batch_size=args.batch_size)
+    print(f"moved {counts['migrated']} uploads into the blob store ({counts['missing']} files missing)")
+
+
+def _compare_org_summary(args: argparse.Namespace) -> None:
+    from app.api.routes.org_dashboard import _stream_org_stp
+    from app.core.org_dashboard_sql import summarize_org_sql
+    from app.domain.org_dashboard import build_org_dashboard
+
+    with SessionLocal() as db:
+        python_summary = build_org_dashboard(_stream_org_stp(db, args.organization_id))
+        sql_summary = summarize_org_sql(db, args.organization_id)
+    if python_summary == sql_summary:
+        print("summaries match")
+        return
+    print(json.dumps({"python": python_summary, "sql": sql_summary}, indent=2))
+    raise SystemExit(1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Maintenance commands, e.g.:
+      python -m app.cli rebuild-member-status
+      python -m app.cli rebuild-org-rollups
+      python -m app.cli backfill-stp-items
+      python -m app.cli rebuild-member-access
+      python -m app.cli check-member-access
+      python -m app.cli backfill-upload-blobs
+      python -m app.cli compare-org-summary <organization_id>
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("rebuild-member-status", help="recompute service_member_statuses")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.set_defaults(func=_rebuild_member_status)
+
+    p = commands.add_parser("rebuild-org-rollups", help="recompute org_status_rollups from member statuses")
+    p.set_defaults(func=_rebuild_org_rollups)
+
+    p = commands.add_parser("backfill-stp-items", help="rebuild training_items/award_items from stp_data")
+    p.add_argument("--batch-size", type=int, default=1000)
+    p.set_defaults(func=_backfill_stp_items)
+
+    p = commands.add_parser("rebuild-member-access", help="recompute member_access from control and shares")
+    p.set_defaults(func=_rebuild_member_access)
+
+    p = commands.add_parser("check-member-access", help="diff member_access against a fresh computation")
+    p.set_defaults(func=_check_member_access)
+
+    p = commands.add_parser("backfill-upload-blobs", help="move legacy upload files into the content-addressed store")
+    p.add_argument("--batch-size", type=int, default=200)
+    p.set_defaults(func=_backfill_upload_blobs)
+
+    p = commands.add_parser("compare-org-summary", help="diff build_org_dashboard against the SQL summary")
+    p.add_argument("organization_id")
+    p.set_defaults(func=_compare_org_summary)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, defer
+
+from app.core.authz import Permission
+from app.core.member_access_service import principal_filter
+from app.core.principal import AccountPrincipal
+from app.models.member_access import MemberAccess
+from app.models.service_member import ServiceMember
+
+
+def permission_expression(acct: AccountPrincipal):
+    """
+    SQL expression for acct's effective Permission on the ServiceMember in
+    the enclosing query, read from the materialized member_access rows of
+    the account and its org (app.core.member_access_service).
+    """
+    level = (
+        select(func.max(MemberAccess.permission))
+        .where(MemberAccess.service_member_id == ServiceMember.id)
+        .where(principal_filter(acct))
+        .scalar_subquery()
+    )
+    return func.coalesce(level, int(Permission.NONE)).label("permission")
+
+
+def _effective(acct: AccountPrincipal, level: int) -> Permission:
+    # Owner and admin (support) accounts act as controllers on every member
+    if acct.role in ("owner", "admin"):
+        return Permission.CONTROL
+    return Permission(level)
+
+
+def resolve_member_access(
+    db: Session,
+    acct: AccountPrincipal,
+    service_member_id: str,
+    *,
+    with_stp: bool = True,
+) -> tuple[ServiceMember | None, Permission]:
+    """
+    The member row and acct's effective permission on it, in one query.
+    (None, Permission.NONE) if the member does not exist. Without with_stp,
+    stp_data is deferred and loads on first access.
+    """
+    query = select(ServiceMember, permission_expression(acct)).where(ServiceMember.id == service_member_id)
+    if not with_stp:
+        query = query.options(defer(ServiceMember.stp_data))
+    row = db.execute(query).one_or_none()
+    if row is None:
+        return None, Permission.NONE
+    return row[0], _effective(acct, row[1])
+
+
+def resolve_members_access(
+    db: Session,
+    acct: AccountPrincipal,
+    service_member_ids: Iterable[str],
+    *,
+    with_stp: bool = False,
+) -> dict[str, tuple[ServiceMember, Permission]]:
+    """
+    Bulk resolve_member_access for list views: one query for all ids.
+    Missing ids are absent from the result; stp_data is deferred unless
+    with_stp is set.
+    """
+    ids = list(dict.fromkeys(service_member_ids))
+    if not ids:
+        return {}
+    query = select(ServiceMember, permission_expression(acct)).where(ServiceMember.id.in_(ids))
+    if not with_stp:
+        query = query.options(defer(ServiceMember.stp_data))
+    return {sm.id: (sm, _effective(acct, level)) for sm, level in db.execute(query)}
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models.audit_log import AuditLog
@@ -24,4 +27,33 @@ def audit(
             target_id=target_id,
             meta=meta or {},
         )
-    )
\ No newline at end of file
+    )
+
+def audit_many(
+    db: Session,
+    *,
+    actor_type: str,
+    actor_id: str,
+    action: str,
+    target_type: str,
+    entries: Iterable[tuple[str, Optional[dict[str, Any]]]],
+) -> None:
+    """
+    One audit row per (target_id, meta) entry, written with a single INSERT.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "actor_type": actor_type,
+            "actor_id": actor_id,
+            "action": action,
+            "target_type": target_type,
+            "target_id": target_id,
+            "meta": meta or {},
+            "created_at": now,
+        }
+        for target_id, meta in entries
+    ]
+    if rows:
+        db.execute(insert(AuditLog).values(rows))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Optional
 
 
@@ -29,6 +29,27 @@ class Action(str, Enum):
     SUPPORT_ACCOUNT_ACTION = "support:account_action"  # requires 6-digit verify
 
 
+class Permission(IntEnum):
+    """
+    Effective permission of an account on one service member; ordered so
+    a higher value implies every lower one.
+    """
+    NONE = 0
+    VIEW = 1      # accepted view share
+    EDIT = 2      # accepted edit share (account or org)
+    CONTROL = 3   # controlling account (subject, else creator)
+
+
+# Minimum permission each service member action needs
+ACTION_PERMISSIONS = {
+    Action.SM_READ: Permission.VIEW,
+    Action.SM_WRITE_STP: Permission.EDIT,
+    Action.SM_UPLOAD: Permission.EDIT,
+    Action.SM_SHARE: Permission.EDIT,
+    Action.SM_DELETE: Permission.CONTROL,
+}
+
+
 @dataclass(frozen=True)
 class Decision:
     allowed: bool
@@ -73,7 +94,11 @@ def decide_action_for_role(role: str, action: Action) -> Decision:
         return Decision(True, "admin allowed")
 
     if is_org(role):
-        if action in (Action.ORG_READ, Action.ORG_MANAGE_ROSTER, Action.ORG_DASHBOARD, Action.SM_READ):
+        # Writes on a member still need an edit share to the org (decide_member_action)
+        if action in (
+            Action.ORG_READ, Action.ORG_MANAGE_ROSTER, Action.ORG_DASHBOARD,
+            Action.SM_READ, Action.SM_WRITE_STP, Action.SM_UPLOAD,
+        ):
             return Decision(True, "org allowed")
         return Decision(False, "org not allowed for this action")
 
@@ -110,4 +135,23 @@ def can_org_access_service_member(
     """
     Org actor can see org-owned members.
     """
-    return bool(actor_org_id) and (actor_org_id == service_member_org_id)
\ No newline at end of file
+    return bool(actor_org_id) and (actor_org_id == service_member_org_id)
+
+
+def share_permission(permission: Optional[str]) -> Permission:
+    """
+    ServiceMemberShare.permission ("view"|"edit") of an accepted share.
+    """
+    return Permission.EDIT if permission == "edit" else Permission.VIEW
+
+
+def decide_member_action(permission: Permission, action: Action) -> Decision:
+    """
+    Resource-level check once the effective permission is known.
+    """
+    required = ACTION_PERMISSIONS.get(action)
+    if required is None:
+        return Decision(False, "not a service member action")
+    if permission >= required:
+        return Decision(True, f"{permission.name.lower()} permission")
+    return Decision(False, f"requires {required.name.lower()} permission")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.upload_storage import StoredUpload, blob_lock_key, blob_path, hash_file
+from app.models.upload import UploadFile
+from app.models.upload_blob import UploadBlob
+
+# Every file operation on a blob happens under a transaction-level advisory
+# lock on its hash, so placing a file (acquire_blob) and removing it
+# (purge_blob) for the same content never interleave across workers.
+
+BLOB_BACKFILL_BATCH_SIZE = 200
+
+
+def _lock_blob(db: Session, sha256: str) -> None:
+    db.execute(select(func.pg_advisory_xact_lock(blob_lock_key(sha256))))
+
+
+def acquire_blob(db: Session, staged: StoredUpload, storage_dir: Path) -> tuple[Path, bool]:
+    """
+    Adds one reference to the blob holding staged's content and returns
+    (path, placed). New content is moved into the blob store (placed is
+    True); a duplicate's staged file is discarded. The caller owns the
+    commit, which releases the lock; if it rolls back a placed file,
+    purge_blob removes it again.
+    """
+    _lock_blob(db, staged.sha256)
+    stmt = insert(UploadBlob).values(
+        sha256=staged.sha256,
+        size_bytes=staged.size_bytes,
+        storage_path=str(blob_path(storage_dir, staged.sha256)),
+        ref_count=1,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UploadBlob.sha256],
+        set_={"ref_count": UploadBlob.ref_count + 1},
+    ).returning(UploadBlob.storage_path)
+    path = Path(db.execute(stmt).scalar_one())
+
+    if path.exists():
+        staged.path.unlink(missing_ok=True)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged.path, path)
+        return path, True
+    return path, False
+
+
+def release_blob(db: Session, sha256: str) -> Optional[Path]:
+    """
+    Drops one reference. When none remain the row is deleted and its path
+    returned; pass it to purge_blob once this transaction has committed.
+    """
+    remaining = db.execute(
+        update(UploadBlob)
+        .where(UploadBlob.sha256 == sha256)
+        .values(ref_count=UploadBlob.ref_count - 1)
+        .returning(UploadBlob.ref_count)
+    ).scalar_one_or_none()
+    if remaining is None or remaining > 0:
+        return None
+    path = db.execute(
+        delete(UploadBlob)
+        .where(UploadBlob.sha256 == sha256, UploadBlob.ref_count <= 0)
+        .returning(UploadBlob.storage_path)
+    ).scalar_one_or_none()
+    return Path(path) if path else None
+
+
+def purge_blob(db: Session, sha256: str, path: Path) -> bool:
+    """
+    Unlinks a released blob's file unless an upload re-acquired the same
+    content in the meantime. The caller commits right after.
+    """
+    _lock_blob(db, sha256)
+    if db.execute(select(UploadBlob.sha256).where(UploadBlob.sha256 == sha256)).first():
+        return False
+    path.unlink(missing_ok=True)
+    return True
+
+
+def store_upload(
+    db: Session,
+    staged: StoredUpload,
+    storage_dir: Path,
+    record: UploadFile,
+    *,
+    rotated: Optional[UploadFile] = None,
+) -> None:
+    """
+    Commits a new upload_files row for a staged file, pointing it at the
+    blob for its content, and deletes rotated (the spot's oldest upload)
+    in the same transaction. Files are only removed after the outcome is
+    known: the rotated blob (or legacy file) once the commit succeeds, a
+    newly placed blob if it fails.
+    """
+    path, placed = acquire_blob(db, staged, storage_dir)
+    record.storage_path = str(path)
+    record.sha256 = record.blob_sha256 = staged.sha256
+
+    rotated_blob = rotated_path = None
+    try:
+        if rotated is not None:
+            rotated_blob, rotated_path = rotated.blob_sha256, rotated.storage_path
+            # The row must be gone before its blob row can be deleted (FK)
+            db.delete(rotated)
+            db.flush()
+            if rotated_blob:
+                rotated_path = release_blob(db, rotated_blob)
+        db.add(record)
+        db.commit()
+    except BaseException:
+        db.rollback()
+        if placed:
+            purge_blob(db, staged.sha256, path)
+            db.commit()
+        raise
+
+    if rotated_blob:
+        if rotated_path:
+            purge_blob(db, rotated_blob, rotated_path)
+            db.commit()
+    elif rotated_path:
+        # Legacy per-upload file
+        try:
+            if os.path.exists(rotated_path):
+                os.remove(rotated_path)
+        except Exception:
+            pass
+
+
+def backfill_upload_blobs(db: Session, storage_dir: Path, *, batch_size: int = BLOB_BACKFILL_BATCH_SIZE) -> dict[str, int]:
+    """
+    Moves legacy per-upload files (blob_sha256 NULL) into the blob store,
+    one commit per file. Rows sharing a path (the same filename uploaded
+    twice before names carried the file id) each take a reference; rows
+    whose file is gone are counted and left as they are.
+    """
+    moved: dict[str, StoredUpload] = {}
+    counts = {"migrated": 0, "missing": 0}
+    after = ""
+    while True:
+        rows = db.execute(
+            select(UploadFile.id, UploadFile.storage_path)
+            .where(UploadFile.blob_sha256.is_(None), UploadFile.id > after)
+            .order_by(UploadFile.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return counts
+        after = rows[-1].id
+
+        for file_id, storage_path in rows:
+            staged = moved.get(storage_path)
+            if staged is None:
+                if not os.path.exists(storage_path):
+                    counts["missing"] += 1
+                    continue
+                staged = moved[storage_path] = hash_file(Path(storage_path))
+
+            path, _ = acquire_blob(db, staged, storage_dir)
+            db.execute(
+                update(UploadFile)
+                .where(UploadFile.id == file_id)
+                .values(blob_sha256=staged.sha256, sha256=staged.sha256, storage_path=str(path))
+            )
+            db.commit()
+            counts["migrated"] += 1
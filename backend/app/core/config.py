@@ -21,10 +21,36 @@ class Settings(BaseSettings):
     jwt_secret: str
     jwt_alg: str = "HS256"
     jwt_expires_min: int = 60
+    # rotating refresh tokens (auth_sessions), see /auth/refresh
+    refresh_token_days: int = 30
+    # verified JWT claims kept in-process until each token's exp
+    token_cache_max_size: int = 10000
 
     owner_override_enabled: bool = True
 
+    # bcrypt cost; hashes with a different cost are upgraded on next login
+    bcrypt_rounds: int = 12
+    # password hashing process pool; requests beyond workers + queue get 503
+    password_hash_workers: int = 2
+    password_hash_queue_size: int = 16
+    password_hash_timeout_seconds: float = 10.0
+
+    # in-process cache of authenticated account principals; invalidation is
+    # per process, so the TTL bounds staleness across workers
+    account_cache_ttl_seconds: int = 60
+    account_cache_max_size: int = 10000
+
     upload_storage_dir: str = "./storage"
     max_uploads_per_spot: int = 3
+    # upload byte limits (413 once exceeded): per account tier, else the
+    # default, capped per spot key or spot section, e.g. {"training": 10485760}
+    max_upload_bytes: int = 25 * 1024 * 1024
+    max_upload_bytes_by_tier: dict[str, int] = {}
+    max_upload_bytes_by_spot: dict[str, int] = {}
+
+    # org dashboard summary source: rollup|status_table|stream|sql
+    org_dashboard_source: str = "rollup"
+    # rows fetched per server-side batch when aggregating org dashboards
+    org_dashboard_batch_size: int = 500
 
 settings = Settings()
\ No newline at end of file
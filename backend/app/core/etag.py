@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import re
+from datetime import date
+
+_VERSION_RE = re.compile(r'^(?:W/)?"(?:[a-z]+-.+-v)?(\d+)(?:-\d{8})?"$')
+
+
+def make_etag(kind: str, resource_id: str, version: int, as_of: date) -> str:
+    """
+    Weak ETag for a dashboard payload. RAG statuses depend on the date as
+    well as the data, so the UTC day is part of the tag.
+    """
+    return f'W/"{kind}-{resource_id}-v{version}-{as_of:%Y%m%d}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison against an If-None-Match header (list or "*").
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def if_match_version(if_match: str | None) -> int | None:
+    """
+    Row version named by an If-Match header: either one of our ETags or a
+    bare quoted version ("7"). None if absent or unrecognised.
+    """
+    if not if_match:
+        return None
+    m = _VERSION_RE.match(if_match.strip())
+    return int(m.group(1)) if m else None
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import Select, and_, bindparam, delete, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.core.principal import AccountPrincipal
+from app.models.member_access import MemberAccess
+
+
+# Permission values: 3 control, 2 edit, 1 view (see app.core.authz.Permission).
+# Controllers get control; the creator keeps view after handing control to
+# the subject; accepted shares give view/edit to the target account, or to
+# the target org and every org above it.
+MEMBER_ACCESS_SQL = """
+    WITH RECURSIVE member_orgs(member_id, org_id, permission) AS (
+        SELECT s.service_member_id, s.target_org_id,
+               CASE WHEN s.permission = 'edit' THEN 2 ELSE 1 END
+        FROM service_member_shares s
+        WHERE s.status = 'accepted' AND s.target_org_id IS NOT NULL {share_filter}
+        UNION
+        SELECT mo.member_id, o.parent_id, mo.permission
+        FROM member_orgs mo
+        JOIN organizations o ON o.id = mo.org_id
+        WHERE o.parent_id IS NOT NULL
+    ),
+    grants(principal_type, principal_id, service_member_id, permission) AS (
+        SELECT 'account', coalesce(sm.subject_account_id, sm.creator_account_id), sm.id, 3
+        FROM service_members sm
+        WHERE true {member_filter}
+        UNION ALL
+        SELECT 'account', sm.creator_account_id, sm.id, 1
+        FROM service_members sm
+        WHERE true {member_filter}
+        UNION ALL
+        SELECT 'account', s.target_account_id, s.service_member_id,
+               CASE WHEN s.permission = 'edit' THEN 2 ELSE 1 END
+        FROM service_member_shares s
+        WHERE s.status = 'accepted' AND s.target_account_id IS NOT NULL {share_filter}
+        UNION ALL
+        SELECT 'org', mo.org_id, mo.member_id, mo.permission
+        FROM member_orgs mo
+    )
+    SELECT principal_type, principal_id, service_member_id, max(permission) AS permission
+    FROM grants
+    {grants_filter}
+    GROUP BY principal_type, principal_id, service_member_id
+"""
+
+INSERT_MEMBER_ACCESS = "INSERT INTO member_access (principal_type, principal_id, service_member_id, permission)\n"
+
+
+def _access_sql(*, members: bool = False, orgs: bool = False) -> str:
+    return MEMBER_ACCESS_SQL.format(
+        share_filter="AND s.service_member_id IN :member_ids" if members else "",
+        member_filter="AND sm.id IN :member_ids" if members else "",
+        grants_filter="WHERE principal_type = 'org' AND principal_id IN :org_ids" if orgs else "",
+    )
+
+
+# ----------------------------
+# Maintenance
+# ----------------------------
+
+def sync_member_access(db: Session, member_ids: Iterable[str]) -> None:
+    """
+    Recomputes every member_access row for these members. Call in the same
+    transaction as any change to control or shares; the caller owns the commit.
+    """
+    member_ids = sorted(set(member_ids))
+    if not member_ids:
+        return
+    db.execute(delete(MemberAccess).where(MemberAccess.service_member_id.in_(member_ids)))
+    db.execute(
+        text(INSERT_MEMBER_ACCESS + _access_sql(members=True)).bindparams(
+            bindparam("member_ids", expanding=True)
+        ),
+        {"member_ids": member_ids},
+    )
+
+
+def rebuild_member_access(db: Session, org_ids: Optional[Iterable[str]] = None) -> None:
+    """
+    Recomputes the whole table, or only the org rows of org_ids (used after
+    a unit is re-parented). The caller owns the commit.
+    """
+    if org_ids is None:
+        db.execute(delete(MemberAccess))
+        db.execute(text(INSERT_MEMBER_ACCESS + _access_sql()))
+        return
+
+    org_ids = list(org_ids)
+    if not org_ids:
+        return
+    db.execute(
+        delete(MemberAccess)
+        .where(MemberAccess.principal_type == "org")
+        .where(MemberAccess.principal_id.in_(org_ids))
+    )
+    db.execute(
+        text(INSERT_MEMBER_ACCESS + _access_sql(orgs=True)).bindparams(
+            bindparam("org_ids", expanding=True)
+        ),
+        {"org_ids": org_ids},
+    )
+
+
+def check_member_access(db: Session) -> dict[str, int]:
+    """
+    Rows the table is missing and rows it should not have, compared with
+    a fresh computation. Both zero means consistent.
+    """
+    row = db.execute(
+        text(
+            f"""
+            WITH expected AS ({_access_sql()})
+            SELECT
+                (SELECT count(*) FROM (
+                    SELECT principal_type, principal_id, service_member_id, permission FROM expected
+                    EXCEPT
+                    SELECT principal_type, principal_id, service_member_id, permission FROM member_access
+                ) missing) AS missing,
+                (SELECT count(*) FROM (
+                    SELECT principal_type, principal_id, service_member_id, permission FROM member_access
+                    EXCEPT
+                    SELECT principal_type, principal_id, service_member_id, permission FROM expected
+                ) extra) AS extra
+            """
+        )
+    ).one()
+    return {"missing": row.missing, "extra": row.extra}
+
+
+# ----------------------------
+# Reads
+# ----------------------------
+
+def principal_filter(acct: AccountPrincipal):
+    """
+    member_access rows that apply to acct: its own, plus its org's.
+    """
+    own = and_(MemberAccess.principal_type == "account", MemberAccess.principal_id == acct.id)
+    if not acct.organization_id:
+        return own
+    return or_(own, and_(MemberAccess.principal_type == "org", MemberAccess.principal_id == acct.organization_id))
+
+
+def account_member_ids(account_id: str) -> Select:
+    """
+    Members an account can see through its own grants (PK range scan).
+    """
+    return (
+        select(MemberAccess.service_member_id)
+        .where(MemberAccess.principal_type == "account")
+        .where(MemberAccess.principal_id == account_id)
+    )
+
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.org_rollup_service import apply_member_status_changes
+from app.domain.member_status import compute_member_status
+from app.domain.org_dashboard import OrgDashboardAccumulator
+from app.models.member_status import ServiceMemberStatus
+from app.models.service_member import ServiceMember
+
+STATUS_BATCH_SIZE = 1000
+
+STATUS_COLUMNS = {
+    "fitness": ServiceMemberStatus.fitness_status,
+    "training": ServiceMemberStatus.training_status,
+    "awards": ServiceMemberStatus.awards_status,
+    "readiness": ServiceMemberStatus.readiness_status,
+}
+
+
+def _status_row(service_member_id: str, stp: dict[str, Any], now: datetime) -> dict[str, Any]:
+    status = compute_member_status(stp or {}, now)
+    return {
+        "service_member_id": service_member_id,
+        "fitness_status": status.fitness_status,
+        "fitness_expiration": status.fitness_expiration,
+        "training_status": status.training_status,
+        "training_next_due": status.training_next_due,
+        "awards_status": status.awards_status,
+        "readiness_status": status.readiness_status,
+        "readiness_expiration": status.readiness_expiration,
+        "valid_until": status.valid_until,
+        "computed_at": func.now(),
+    }
+
+
+def _upsert_status_rows(db: Session, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    stmt = insert(ServiceMemberStatus).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ServiceMemberStatus.service_member_id],
+        set_={
+            col: stmt.excluded[col]
+            for col in rows[0]
+            if col != "service_member_id"
+        },
+    )
+    db.execute(stmt)
+
+
+def _card_statuses(row: dict[str, Any]) -> dict[str, str]:
+    return {card: row[col.key] for card, col in STATUS_COLUMNS.items()}
+
+
+def member_statuses(db: Session, service_member_id: str) -> dict[str, str] | None:
+    """
+    Stored card -> status map for one member, or None if not computed yet.
+    """
+    row = db.execute(
+        select(*STATUS_COLUMNS.values()).where(ServiceMemberStatus.service_member_id == service_member_id)
+    ).one_or_none()
+    return dict(zip(STATUS_COLUMNS, row)) if row else None
+
+
+def member_statuses_by_id(db: Session, service_member_ids: Iterable[str]) -> dict[str, dict[str, str]]:
+    """
+    member_statuses for many members; members without a row are omitted.
+    """
+    service_member_ids = list(service_member_ids)
+    if not service_member_ids:
+        return {}
+    return {
+        row[0]: dict(zip(STATUS_COLUMNS, row[1:]))
+        for row in db.execute(
+            select(ServiceMemberStatus.service_member_id, *STATUS_COLUMNS.values())
+            .where(ServiceMemberStatus.service_member_id.in_(service_member_ids))
+        )
+    }
+
+
+def _refresh_batch(db: Session, members: list[tuple[str, dict[str, Any]]], now: datetime) -> None:
+    ids = [service_member_id for service_member_id, _ in members]
+    # Serialize refreshes of the same member (e.g. two dashboard GETs sweeping
+    # stale rows). A member without a status row has nothing to lock below,
+    # so both would count it as new in the org rollups. NO KEY UPDATE does
+    # not block inserts that reference the member.
+    db.execute(
+        select(ServiceMember.id)
+        .where(ServiceMember.id.in_(ids))
+        .order_by(ServiceMember.id)
+        .with_for_update(key_share=True)
+    )
+    old = {
+        row[0]: dict(zip(STATUS_COLUMNS, row[1:]))
+        for row in db.execute(
+            select(ServiceMemberStatus.service_member_id, *STATUS_COLUMNS.values())
+            .where(ServiceMemberStatus.service_member_id.in_(ids))
+            .with_for_update()
+        )
+    }
+    rows = [_status_row(service_member_id, stp, now) for service_member_id, stp in members]
+    _upsert_status_rows(db, rows)
+    apply_member_status_changes(
+        db,
+        [(row["service_member_id"], old.get(row["service_member_id"]), _card_statuses(row)) for row in rows],
+    )
+
+
+def refresh_member_status(db: Session, sm: ServiceMember, *, now: datetime | None = None) -> None:
+    """
+    Recomputes the status row for one member. Call whenever stp_data changes;
+    the caller owns the commit.
+    """
+    refresh_member_statuses(db, [(sm.id, sm.stp_data)], now=now)
+
+
+def refresh_member_statuses(
+    db: Session,
+    members: Iterable[tuple[str, dict[str, Any]]],
+    *,
+    now: datetime | None = None,
+) -> int:
+    """
+    Upserts status rows for (service_member_id, stp_data) pairs in batches,
+    propagating any status change to the org rollups.
+    Returns the number of rows written; the caller owns the commit.
+    """
+    now = now or datetime.utcnow()
+    written = 0
+    batch: list[tuple[str, dict[str, Any]]] = []
+    for member in members:
+        batch.append(member)
+        if len(batch) >= STATUS_BATCH_SIZE:
+            _refresh_batch(db, batch, now)
+            written += len(batch)
+            batch = []
+    if batch:
+        _refresh_batch(db, batch, now)
+    return written + len(batch)
+
+
+def refresh_stale_member_statuses(
+    db: Session,
+    member_ids: Select | None = None,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """
+    Recomputes rows that are missing or past valid_until for the given members.
+    With member_ids=None, sweeps expired rows across all members instead.
+    Usually touches only the handful of members crossing a threshold today.
+    """
+    now = now or datetime.utcnow()
+    if member_ids is None:
+        query = (
+            select(ServiceMember.id, ServiceMember.stp_data)
+            .join(ServiceMemberStatus, ServiceMemberStatus.service_member_id == ServiceMember.id)
+            .where(ServiceMemberStatus.valid_until < now)
+        )
+    else:
+        query = (
+            select(ServiceMember.id, ServiceMember.stp_data)
+            .outerjoin(ServiceMemberStatus, ServiceMemberStatus.service_member_id == ServiceMember.id)
+            .where(ServiceMember.id.in_(member_ids))
+            .where(
+                or_(
+                    ServiceMemberStatus.service_member_id.is_(None),
+                    ServiceMemberStatus.valid_until < now,
+                )
+            )
+        )
+    stale = db.execute(query.execution_options(yield_per=STATUS_BATCH_SIZE))
+    written = refresh_member_statuses(db, stale.tuples(), now=now)
+    if written:
+        db.commit()
+    return written
+
+
+def rebuild_member_statuses(db: Session, *, batch_size: int = STATUS_BATCH_SIZE) -> int:
+    """
+    Recomputes every status row, committing once per keyset batch.
+    """
+    now = datetime.utcnow()
+    total = 0
+    last_id = ""
+    while True:
+        batch = db.execute(
+            select(ServiceMember.id, ServiceMember.stp_data)
+            .where(ServiceMember.id > last_id)
+            .order_by(ServiceMember.id)
+            .limit(batch_size)
+        ).tuples().all()
+        if not batch:
+            return total
+        total += refresh_member_statuses(db, batch, now=now)
+        db.commit()
+        last_id = batch[-1][0]
+
+
+def summarize_member_statuses(db: Session, member_ids: Select) -> dict[str, Any]:
+    """
+    Org dashboard summary from the status table: one GROUP BY over the
+    roster's status rows instead of decoding stp_data per member.
+    """
+    refresh_stale_member_statuses(db, member_ids)
+
+    rows = db.execute(
+        select(
+            ServiceMemberStatus.fitness_status,
+            ServiceMemberStatus.training_status,
+            ServiceMemberStatus.awards_status,
+            ServiceMemberStatus.readiness_status,
+            func.count(),
+        )
+        .where(ServiceMemberStatus.service_member_id.in_(member_ids))
+        .group_by(
+            ServiceMemberStatus.fitness_status,
+            ServiceMemberStatus.training_status,
+            ServiceMemberStatus.awards_status,
+            ServiceMemberStatus.readiness_status,
+        )
+    ).all()
+
+    acc = OrgDashboardAccumulator()
+    for fitness, training, awards, readiness, count in rows:
+        acc.add_statuses(fitness=fitness, training=training, awards=awards, readiness=readiness, count=count)
+    return acc.result()
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+
+class LatencyStats:
+    """
+    Thread-safe running count / mean / max of observed durations.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "count": self.count,
+                "mean_ms": round(self.total_seconds / self.count * 1000, 3) if self.count else None,
+                "max_ms": round(self.max_seconds * 1000, 3),
+            }
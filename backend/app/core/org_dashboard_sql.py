@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
+
+from app.domain.org_dashboard import OrgDashboardAccumulator
+
+# RAG buckets computed in PostgreSQL with the same thresholds as
+# app.domain.dashboard_cards. Because days_remaining is floored,
+# "days < 30" is "ts < now + 30 days" and "days <= 60" is "ts < now + 61 days".
+# The roster mirrors app.core.org_roster.org_member_ids.
+ORG_SUMMARY_SQL = text(
+    """
+    WITH RECURSIVE org_tree(id) AS (
+        SELECT o.id FROM organizations o WHERE o.id = :organization_id
+        UNION
+        SELECT o.id FROM organizations o JOIN org_tree t ON o.parent_id = t.id
+    ),
+    roster AS (
+        SELECT sm.stp_data AS stp
+        FROM service_members sm
+        WHERE sm.id IN (
+            SELECT s.service_member_id
+            FROM service_member_shares s
+            WHERE s.target_org_id IN (SELECT id FROM org_tree) AND s.status = 'accepted'
+        )
+    ),
+    cards AS (
+        SELECT
+            CASE
+                WHEN f.ts IS NULL THEN 'gray'
+                WHEN f.ts < :now + interval '30 days' THEN 'red'
+                WHEN f.ts < :now + interval '61 days' THEN 'amber'
+                ELSE 'green'
+            END AS fitness,
+            CASE
+                WHEN tr.overdue > 0 THEN 'red'
+                WHEN tr.upcoming > 0 THEN 'amber'
+                ELSE 'green'
+            END AS training,
+            CASE WHEN aw.pending > 0 THEN 'amber' ELSE 'green' END AS awards,
+            CASE
+                WHEN r.ts IS NULL THEN 'gray'
+                WHEN r.ts < :now + interval '30 days' THEN 'red'
+                WHEN r.ts < :now + interval '61 days' THEN 'amber'
+                ELSE 'green'
+            END AS readiness
+        FROM roster
+        CROSS JOIN LATERAL (
+            SELECT stp_timestamp(stp->'fitness'->'expiration_date') AS ts
+        ) f
+        CROSS JOIN LATERAL (
+            SELECT stp_timestamp(stp->'readiness'->'readiness_expiration') AS ts
+        ) r
+        CROSS JOIN LATERAL (
+            SELECT
+                count(*) FILTER (WHERE due.ts < :now) AS overdue,
+                count(*) FILTER (WHERE due.ts >= :now AND due.ts < :now + interval '61 days') AS upcoming
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(stp->'training') = 'array' THEN stp->'training' ELSE '[]'::jsonb END
+            ) AS item
+            CROSS JOIN LATERAL (SELECT stp_timestamp(item->'due_date') AS ts) due
+        ) tr
+        CROSS JOIN LATERAL (
+            SELECT count(*) FILTER (WHERE item->>'status' = 'pending') AS pending
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(stp->'awards') = 'array' THEN stp->'awards' ELSE '[]'::jsonb END
+            ) AS item
+        ) aw
+    )
+    SELECT fitness, training, awards, readiness, count(*) AS n
+    FROM cards
+    GROUP BY fitness, training, awards, readiness
+    """
+).bindparams(bindparam("now", type_=DateTime()))
+
+
+def summarize_org_sql(db: Session, organization_id: str, *, now: datetime | None = None) -> dict[str, Any]:
+    """
+    Org dashboard summary computed entirely in PostgreSQL.
+    Same response shape as build_org_dashboard.
+    """
+    rows = db.execute(
+        ORG_SUMMARY_SQL,
+        {"organization_id": organization_id, "now": now or datetime.utcnow()},
+    ).all()
+
+    acc = OrgDashboardAccumulator()
+    for fitness, training, awards, readiness, count in rows:
+        acc.add_statuses(fitness=fitness, training=training, awards=awards, readiness=readiness, count=count)
+    return acc.result()
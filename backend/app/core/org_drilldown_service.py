@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.member_status_service import STATUS_COLUMNS, refresh_stale_member_statuses
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.stp_items_service import member_item_cards
+from app.domain.card_evaluator import CardEvaluator
+from app.models.member_status import ServiceMemberStatus
+from app.models.service_member import ServiceMember
+
+# Ascending key date == ascending days remaining; awards have no date
+SORT_DATES = {
+    "fitness": ServiceMemberStatus.fitness_expiration,
+    "readiness": ServiceMemberStatus.readiness_expiration,
+    "training": ServiceMemberStatus.training_next_due,
+    "awards": None,
+}
+
+# Cards whose details come from the item tables (see stp_items_service)
+ITEM_CARDS = ("training", "awards")
+
+# Rows without a key date (gray, nothing due) sort last
+FAR_FUTURE = datetime.max
+
+
+def list_members_by_status(
+    db: Session,
+    member_ids: Select,
+    *,
+    card: str,
+    status: str,
+    limit: int,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """
+    One keyset page of roster members whose card has the given status,
+    ordered by days remaining then id, with that card's details.
+    """
+    refresh_stale_member_statuses(db, member_ids)
+
+    date_col = SORT_DATES[card]
+    sort_key = func.coalesce(date_col, literal(FAR_FUTURE)) if date_col is not None else literal(FAR_FUTURE)
+
+    query = (
+        select(ServiceMemberStatus.service_member_id, sort_key.label("sort_key"))
+        .where(ServiceMemberStatus.service_member_id.in_(member_ids))
+        .where(STATUS_COLUMNS[card] == status)
+    )
+    if cursor:
+        after_key, after_id = decode_cursor(cursor, 2)
+        if not isinstance(after_id, str):
+            raise ValueError("Invalid cursor")
+        try:
+            after_key = datetime.fromisoformat(after_key)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        query = query.where(
+            tuple_(sort_key, ServiceMemberStatus.service_member_id) > tuple_(literal(after_key), literal(after_id))
+        )
+
+    rows = db.execute(
+        query.order_by(sort_key, ServiceMemberStatus.service_member_id).limit(limit + 1)
+    ).all()
+    page, more = rows[:limit], len(rows) > limit
+
+    # Card details for this page only
+    page_ids = [row.service_member_id for row in page]
+    if card in ITEM_CARDS:
+        # Built from the training/award item tables, without decoding stp_data
+        item_cards = member_item_cards(db, page_ids)
+        details = {member_id: item_cards[member_id][card] for member_id in page_ids}
+    else:
+        stp_by_id = dict(
+            db.execute(
+                select(ServiceMember.id, ServiceMember.stp_data).where(ServiceMember.id.in_(page_ids))
+            ).tuples()
+        )
+        evaluator = CardEvaluator()
+        details = {
+            member_id: evaluator.evaluate(stp_by_id.get(member_id) or {})[card]
+            for member_id in page_ids
+        }
+    items = [{"service_member_id": member_id, card: details[member_id]} for member_id in page_ids]
+
+    next_cursor = None
+    if more:
+        last = page[-1]
+        next_cursor = encode_cursor([last.sort_key.isoformat(), last.service_member_id])
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.orm import Session
+
+from app.core.member_status_service import refresh_stale_member_statuses
+from app.domain.forecast import FORECAST_CARDS, red_window
+from app.models.member_status import ServiceMemberStatus
+
+KEY_DATES = {
+    "fitness": ServiceMemberStatus.fitness_expiration,
+    "readiness": ServiceMemberStatus.readiness_expiration,
+    "training": ServiceMemberStatus.training_next_due,
+}
+
+STATUSES = {
+    "fitness": ServiceMemberStatus.fitness_status,
+    "readiness": ServiceMemberStatus.readiness_status,
+    "training": ServiceMemberStatus.training_status,
+}
+
+
+def forecast_red(
+    db: Session,
+    member_ids: Select,
+    horizons: Sequence[int],
+    *,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    How many roster members turn red on each card within each horizon.
+
+    Each bucket is a FILTER clause with a range on a key date of the
+    status table, all counted in one scan of the roster's status rows (the
+    key dates are not indexed), so a 90-day forecast costs about as much
+    as one summary.
+    """
+    now = now or datetime.utcnow()
+    refresh_stale_member_statuses(db, member_ids, now=now)
+
+    columns = [func.count().label("total")]
+    for card in FORECAST_CARDS:
+        columns.append(func.count().filter(STATUSES[card] == "red").label(f"{card}:red"))
+        for horizon in horizons:
+            lo, hi = red_window(card, now, horizon)
+            in_window = and_(KEY_DATES[card] >= lo, KEY_DATES[card] < hi)
+            if card == "training":
+                # next_due only matters while nothing is overdue yet
+                in_window = and_(in_window, STATUSES[card] != "red")
+            columns.append(func.count().filter(in_window).label(f"{card}:{horizon}"))
+
+    row = db.execute(
+        select(*columns).where(ServiceMemberStatus.service_member_id.in_(member_ids))
+    ).one()._mapping
+
+    result: dict[str, Any] = {
+        "as_of": now.isoformat(),
+        "total_personnel": row["total"],
+        "horizons": list(horizons),
+    }
+    for card in FORECAST_CARDS:
+        result[card] = {
+            "currently_red": row[f"{card}:red"],
+            "going_red_within_days": {str(h): row[f"{card}:{h}"] for h in horizons},
+        }
+    return result
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import bindparam, delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.org_roster import org_member_ids
+from app.domain.org_rollup import MemberStatuses, status_deltas, summary_from_rollup
+from app.models.org_rollup import OrgStatusRollup
+from app.models.organization import Organization
+from app.models.service_member import ServiceMember
+from app.models.share import ServiceMemberShare
+
+
+# ----------------------------
+# Hierarchy helpers
+# ----------------------------
+
+def member_rollup_orgs(db: Session, member_ids: Iterable[str]) -> dict[str, set[str]]:
+    """
+    For each member, every org whose rollup includes it: the orgs that
+    accepted it plus all of their ancestors.
+    """
+    member_ids = list(member_ids)
+    if not member_ids:
+        return {}
+
+    up = (
+        select(
+            ServiceMemberShare.service_member_id.label("member_id"),
+            ServiceMemberShare.target_org_id.label("org_id"),
+        )
+        .where(ServiceMemberShare.service_member_id.in_(member_ids))
+        .where(ServiceMemberShare.target_org_id.is_not(None))
+        .where(ServiceMemberShare.status == "accepted")
+        .cte("member_orgs", recursive=True)
+    )
+    # UNION (not UNION ALL) also stops a misconfigured parent cycle
+    up = up.union(
+        select(up.c.member_id, Organization.parent_id)
+        .join(Organization, Organization.id == up.c.org_id)
+        .where(Organization.parent_id.is_not(None))
+    )
+
+    orgs: dict[str, set[str]] = defaultdict(set)
+    for member_id, org_id in db.execute(select(up.c.member_id, up.c.org_id)):
+        orgs[member_id].add(org_id)
+    return orgs
+
+
+def org_ancestor_ids(db: Session, organization_id: str) -> set[str]:
+    """
+    The org itself plus every org above it.
+    """
+    seen: set[str] = set()
+    current: Optional[str] = organization_id
+    while current and current not in seen:
+        seen.add(current)
+        current = db.execute(
+            select(Organization.parent_id).where(Organization.id == current)
+        ).scalar_one_or_none()
+    return seen
+
+
+# ----------------------------
+# Incremental maintenance
+# ----------------------------
+
+def apply_rollup_deltas(db: Session, deltas: Counter) -> None:
+    """
+    Adds {(organization_id, card, status): delta} to the stored counters.
+    Rows are written in key order so concurrent writers lock consistently.
+    """
+    rows = [
+        {"organization_id": org_id, "card": card, "status": status, "member_count": delta}
+        for (org_id, card, status), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+    stmt = insert(OrgStatusRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[OrgStatusRollup.organization_id, OrgStatusRollup.card, OrgStatusRollup.status],
+        set_={"member_count": OrgStatusRollup.member_count + stmt.excluded.member_count},
+    )
+    db.execute(stmt)
+
+
+def apply_member_status_changes(
+    db: Session,
+    changes: Iterable[tuple[str, Optional[MemberStatuses], Optional[MemberStatuses]]],
+) -> None:
+    """
+    Propagates (member_id, old_statuses, new_statuses) transitions to every
+    org on each member's ancestor path. The caller owns the commit.
+    """
+    per_member = {
+        member_id: deltas
+        for member_id, old, new in changes
+        if (deltas := status_deltas(old, new))
+    }
+    if not per_member:
+        return
+
+    totals: Counter = Counter()
+    for member_id, org_ids in member_rollup_orgs(db, per_member).items():
+        for org_id in org_ids:
+            for card, status, delta in per_member[member_id]:
+                totals[(org_id, card, status)] += delta
+    apply_rollup_deltas(db, totals)
+
+
+def reconcile_member_orgs(db: Session, sm: ServiceMember, before: set[str]) -> None:
+    """
+    Call after a member joins or leaves an org, passing the result of
+    member_rollup_orgs taken before the change.
+    """
+    from app.core.member_status_service import member_statuses, refresh_member_status  # local import to avoid circular deps
+
+    current = member_statuses(db, sm.id)
+    if current is None:
+        # Never counted anywhere yet: computing the row adds it to every current org
+        refresh_member_status(db, sm)
+        return
+
+    after = member_rollup_orgs(db, [sm.id]).get(sm.id, set())
+    totals: Counter = Counter()
+    for org_ids, sign in ((after - before, 1), (before - after, -1)):
+        for org_id in org_ids:
+            for card, status in current.items():
+                totals[(org_id, card, status)] += sign
+    apply_rollup_deltas(db, totals)
+
+
+def reconcile_members_orgs(db: Session, before: dict[str, set[str]]) -> None:
+    """
+    reconcile_member_orgs for many members at once; before maps each member
+    id to its member_rollup_orgs result taken before the change.
+    """
+    from app.core.member_status_service import member_statuses_by_id, refresh_member_statuses  # local import to avoid circular deps
+
+    if not before:
+        return
+    current = member_statuses_by_id(db, before)
+
+    # Never counted anywhere yet: computing the row adds it to every current org
+    uncounted = sorted(set(before) - current.keys())
+    if uncounted:
+        refresh_member_statuses(
+            db,
+            db.execute(
+                select(ServiceMember.id, ServiceMember.stp_data).where(ServiceMember.id.in_(uncounted))
+            ).tuples(),
+        )
+
+    after = member_rollup_orgs(db, current)
+    totals: Counter = Counter()
+    for member_id, statuses in current.items():
+        old, new = before[member_id], after.get(member_id, set())
+        for org_ids, sign in ((new - old, 1), (old - new, -1)):
+            for org_id in org_ids:
+                for card, status in statuses.items():
+                    totals[(org_id, card, status)] += sign
+    apply_rollup_deltas(db, totals)
+
+
+# ----------------------------
+# Rebuild / read
+# ----------------------------
+
+REBUILD_ROLLUPS_SQL = """
+    INSERT INTO org_status_rollups (organization_id, card, status, member_count)
+    WITH RECURSIVE member_orgs(member_id, org_id) AS (
+        SELECT s.service_member_id, s.target_org_id
+        FROM service_member_shares s
+        WHERE s.status = 'accepted' AND s.target_org_id IS NOT NULL
+        UNION
+        SELECT mo.member_id, o.parent_id
+        FROM member_orgs mo
+        JOIN organizations o ON o.id = mo.org_id
+        WHERE o.parent_id IS NOT NULL
+    )
+    SELECT mo.org_id, c.card, c.status, count(*)
+    FROM member_orgs mo
+    JOIN service_member_statuses st ON st.service_member_id = mo.member_id
+    CROSS JOIN LATERAL (
+        VALUES
+            ('fitness', st.fitness_status),
+            ('training', st.training_status),
+            ('awards', st.awards_status),
+            ('readiness', st.readiness_status)
+    ) AS c(card, status)
+    {where}
+    GROUP BY mo.org_id, c.card, c.status
+"""
+
+
+def rebuild_org_rollups(db: Session, org_ids: Optional[Iterable[str]] = None) -> None:
+    """
+    Recomputes rollups from the status table, for all orgs or only org_ids
+    (used after a unit is re-parented). The caller owns the commit.
+    """
+    if org_ids is None:
+        db.execute(delete(OrgStatusRollup))
+        db.execute(text(REBUILD_ROLLUPS_SQL.format(where="")))
+        return
+
+    org_ids = list(org_ids)
+    if not org_ids:
+        return
+    db.execute(delete(OrgStatusRollup).where(OrgStatusRollup.organization_id.in_(org_ids)))
+    db.execute(
+        text(REBUILD_ROLLUPS_SQL.format(where="WHERE mo.org_id IN :org_ids")).bindparams(
+            bindparam("org_ids", expanding=True)
+        ),
+        {"org_ids": org_ids},
+    )
+
+
+def summarize_org_rollup(db: Session, organization_id: str) -> dict[str, Any]:
+    """
+    Org dashboard summary for an org and its subordinate units, read from
+    the stored counters (at most 16 rows).
+    """
+    from app.core.member_status_service import refresh_stale_member_statuses  # local import to avoid circular deps
+
+    # Statuses drift with the calendar; fold in today's threshold crossings
+    # for this org's members only
+    refresh_stale_member_statuses(db, org_member_ids(organization_id))
+
+    rows = db.execute(
+        select(OrgStatusRollup.card, OrgStatusRollup.status, OrgStatusRollup.member_count)
+        .where(OrgStatusRollup.organization_id == organization_id)
+    ).tuples()
+    return summary_from_rollup(rows)
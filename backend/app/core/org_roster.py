@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from sqlalchemy import Select, select
+
+from app.models.organization import Organization
+from app.models.share import ServiceMemberShare
+
+
+def org_subtree_ids(organization_id: str) -> Select:
+    """
+    The org itself plus every subordinate unit below it.
+    """
+    tree = (
+        select(Organization.id)
+        .where(Organization.id == organization_id)
+        .cte("org_tree", recursive=True)
+    )
+    tree = tree.union(select(Organization.id).where(Organization.parent_id == tree.c.id))
+    return select(tree.c.id)
+
+
+def org_member_ids(organization_id: str) -> Select:
+    """
+    Service member ids on an organization's roster, including its
+    subordinate units.
+
+    A member belongs to an org once the org has accepted a share for it
+    (see /shares/to-org and /shares/org-decision).
+    """
+    return (
+        select(ServiceMemberShare.service_member_id)
+        .where(ServiceMemberShare.target_org_id.in_(org_subtree_ids(organization_id)))
+        .where(ServiceMemberShare.status == "accepted")
+    )
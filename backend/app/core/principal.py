@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.account import Account
+
+
+@dataclass(frozen=True)
+class AccountPrincipal:
+    """
+    What request handlers need to know about the caller. Cached in-process,
+    so anything that changes these fields must call invalidate_account().
+    """
+    id: str
+    role: str
+    is_active: bool
+    tier_code: str
+    organization_id: Optional[str] = None
+
+
+account_cache: TTLCache[AccountPrincipal] = TTLCache(
+    maxsize=settings.account_cache_max_size,
+    ttl=settings.account_cache_ttl_seconds,
+)
+
+
+def get_account_principal(db: Session, account_id: str) -> Optional[AccountPrincipal]:
+    """
+    Cached principal for an account id, loading it on a miss.
+    Missing accounts are not cached.
+    """
+    principal = account_cache.get(account_id)
+    if principal is not None:
+        return principal
+
+    row = db.execute(
+        select(Account.id, Account.role, Account.is_active, Account.tier_code, Account.organization_id)
+        .where(Account.id == account_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    principal = AccountPrincipal(*row)
+    account_cache.set(account_id, principal)
+    return principal
+
+
+def invalidate_account(account_id: str) -> None:
+    """
+    Call after changing an account's role, active flag, tier or org; also drops
+    the account's cached token claims. Other worker processes fall back
+    to the TTL.
+    """
+    from app.core.security import evict_account_tokens  # local import to avoid circular deps
+
+    account_cache.invalidate(account_id)
+    evict_account_tokens(account_id)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PoolBusy(Exception):
+    """
+    Raised instead of queueing when every worker and queue slot is taken.
+    """
+
+
+class BoundedProcessPool:
+    """
+    ProcessPoolExecutor with admission control: at most max_workers jobs
+    run and queue_size more wait; any call beyond that fails fast with
+    PoolBusy. run() blocks the calling thread until the job finishes.
+    The executor is created on first use so importing this module does
+    not fork.
+    """
+
+    def __init__(self, max_workers: int, queue_size: int, timeout: Optional[float] = None) -> None:
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise PoolBusy("worker pool is saturated")
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot stays taken until the job itself ends, not when this caller
+        # stops waiting, so timeouts cannot let more jobs pile up behind it
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result(timeout=self.timeout)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import uuid
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.audit import audit
+from app.core.member_access_service import sync_member_access
+from app.core.member_status_service import refresh_member_statuses
+from app.core.stp_items_service import replace_member_items
+from app.domain.roster_import import ImportResult, ImportRow, ImportRowError
+from app.models.service_member import ServiceMember
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def _batches(results: Iterable[ImportResult], size: int) -> Iterator[list[ImportResult]]:
+    it = iter(results)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _insert_batch(db: Session, account_id: str, rows: list[ImportRow]) -> None:
+    members = [
+        {
+            "id": str(uuid.uuid4()),
+            "creator_account_id": account_id,
+            "subject_account_id": None,  # left unlinked so each soldier can claim
+            "branch": row.branch,
+            "component": row.component,
+            "stp_data": row.stp_data,
+            "version": 1,
+        }
+        for row in rows
+    ]
+    db.execute(insert(ServiceMember).values(members))
+
+    # New members belong to no org yet, so only their own derived rows are written
+    pairs = [(m["id"], m["stp_data"]) for m in members]
+    replace_member_items(db, pairs)
+    refresh_member_statuses(db, pairs)
+    sync_member_access(db, [m["id"] for m in members])
+
+    audit(
+        db,
+        actor_type="account",
+        actor_id=account_id,
+        action="service_member.import",
+        target_type="import_batch",
+        target_id=str(uuid.uuid4()),
+        meta={
+            "count": len(members),
+            "first_line": rows[0].line,
+            "last_line": rows[-1].line,
+            "service_member_ids": [m["id"] for m in members],
+        },
+    )
+
+
+def import_service_members(
+    db: Session,
+    account_id: str,
+    results: Iterable[ImportResult],
+    *,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> dict[str, Any]:
+    """
+    Inserts parsed roster rows with one multi-row INSERT, status refresh
+    and audit entry per batch, committing each batch. Input is consumed
+    lazily, so only one batch is held in memory at a time.
+    """
+    imported = 0
+    batches = 0
+    errors: list[dict[str, Any]] = []
+    for batch in _batches(results, batch_size):
+        rows = [r for r in batch if isinstance(r, ImportRow)]
+        errors += [{"line": r.line, "error": r.error} for r in batch if isinstance(r, ImportRowError)]
+        if not rows:
+            continue
+        _insert_batch(db, account_id, rows)
+        db.commit()
+        imported += len(rows)
+        batches += 1
+
+    return {"imported": imported, "failed": len(errors), "batches": batches, "errors": errors}
@@ -1,20 +1,61 @@
 from __future__ import annotations
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 from jose import jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import LatencyStats
+from app.core.process_pool import BoundedProcessPool
+
+# bcrypt runs in its own processes so a login burst cannot starve the
+# request threads; callers get PoolBusy when the pool's queue is full
+password_pool = BoundedProcessPool(
+    max_workers=settings.password_hash_workers,
+    queue_size=settings.password_hash_queue_size,
+    timeout=settings.password_hash_timeout_seconds,
+)
+
+
+@lru_cache(maxsize=None)
+def _crypt_context(rounds: int) -> CryptContext:
+    # min/max pinned to the configured cost so needs_update() flags any
+    # hash made with a different cost, in either direction
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> tuple[bool, Optional[str]]:
+    return _crypt_context(rounds).verify_and_update(password, hashed)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_pool.run(_hash, password, settings.bcrypt_rounds)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    return verify_and_update_password(password, hashed)[0]
+
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    """
+    (matches, new_hash). new_hash is set when the stored hash was made
+    with a different cost than settings.bcrypt_rounds and should be saved.
+    """
+    return password_pool.run(_verify_and_update, password, hashed, settings.bcrypt_rounds)
 
 def create_access_token(sub: str, role: str) -> str:
     now = datetime.now(timezone.utc)
@@ -22,5 +63,30 @@ def create_access_token(sub: str, role: str) -> str:
     payload: dict[str, Any] = {"sub": sub, "role": role, "iat": int(now.timestamp()), "exp": exp}
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_alg)
 
+# Verified claims keyed by sha256(token), each kept until the token's exp
+token_cache: TTLCache[dict[str, Any]] = TTLCache(
+    maxsize=settings.token_cache_max_size,
+    ttl=settings.jwt_expires_min * 60,
+)
+token_decode_latency = LatencyStats()
+
 def decode_token(token: str) -> dict[str, Any]:
-    return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_alg])
\ No newline at end of file
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    claims = token_cache.get(digest)
+    if claims is not None:
+        return dict(claims)
+
+    started = time.perf_counter()
+    claims = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_alg])
+    token_decode_latency.observe(time.perf_counter() - started)
+
+    remaining = claims.get("exp", 0) - time.time()
+    if remaining > 0:
+        token_cache.set(digest, claims, ttl=remaining)
+    return dict(claims)
+
+def evict_account_tokens(account_id: str) -> int:
+    """
+    Drops cached claims for every token issued to account_id.
+    """
+    return token_cache.invalidate_where(lambda claims: claims.get("sub") == account_id)
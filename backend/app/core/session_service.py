@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.auth_session import AuthSession
+
+
+class InvalidRefreshToken(ValueError):
+    pass
+
+
+class RefreshTokenReused(InvalidRefreshToken):
+    """
+    A token that was already rotated came back: it has probably leaked,
+    so its whole family has been revoked. The caller must still commit.
+    """
+
+
+def _hash_token(token: str) -> str:
+    # refresh tokens are 256-bit random, so a fast hash is enough
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _add_session(db: Session, account_id: str, family_id: str) -> tuple[AuthSession, str]:
+    token = secrets.token_urlsafe(32)
+    session = AuthSession(
+        id=str(uuid.uuid4()),
+        account_id=account_id,
+        family_id=family_id,
+        token_hash=_hash_token(token),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_days),
+    )
+    db.add(session)
+    return session, token
+
+
+def issue_refresh_token(db: Session, account_id: str) -> str:
+    """
+    Starts a new session family and returns the raw token (shown to the
+    client once, never stored). The caller owns the commit.
+    """
+    return _add_session(db, account_id, str(uuid.uuid4()))[1]
+
+
+def _revoke_family(db: Session, family_id: str, now: datetime) -> None:
+    db.execute(
+        update(AuthSession)
+        .where(AuthSession.family_id == family_id)
+        .where(AuthSession.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def rotate_refresh_token(db: Session, token: str) -> tuple[str, str]:
+    """
+    Exchanges a live refresh token for a new one in the same family.
+    Returns (account_id, new_token); the caller owns the commit.
+    """
+    now = datetime.now(timezone.utc)
+    session = db.execute(
+        select(AuthSession).where(AuthSession.token_hash == _hash_token(token)).with_for_update()
+    ).scalar_one_or_none()
+    if session is None:
+        raise InvalidRefreshToken("Invalid refresh token")
+    if session.replaced_by_id is not None:
+        _revoke_family(db, session.family_id, now)
+        raise RefreshTokenReused("Refresh token already used")
+    if session.revoked_at is not None or session.expires_at <= now:
+        raise InvalidRefreshToken("Refresh token expired or revoked")
+
+    replacement, new_token = _add_session(db, session.account_id, session.family_id)
+    session.revoked_at = now
+    session.replaced_by_id = replacement.id
+    return session.account_id, new_token
+
+
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    """
+    Logout: revokes the token's whole family. Returns False if unknown.
+    """
+    family_id = db.execute(
+        select(AuthSession.family_id).where(AuthSession.token_hash == _hash_token(token))
+    ).scalar_one_or_none()
+    if family_id is None:
+        return False
+    _revoke_family(db, family_id, datetime.now(timezone.utc))
+    return True
+
+
+def revoke_account_sessions(db: Session, account_id: str) -> None:
+    db.execute(
+        update(AuthSession)
+        .where(AuthSession.account_id == account_id)
+        .where(AuthSession.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
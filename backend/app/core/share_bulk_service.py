@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.audit import audit_many
+from app.core.member_access_service import sync_member_access
+from app.core.org_rollup_service import member_rollup_orgs, reconcile_members_orgs
+from app.core.org_roster import org_subtree_ids
+from app.core.versioning import bump_member_versions, bump_org_versions
+from app.domain.bulk_share import (
+    ACCEPTED,
+    PENDING,
+    chunks,
+    classify_decision_shares,
+    classify_share_members,
+    unique_ids,
+)
+from app.models.service_member import ServiceMember
+from app.models.share import ServiceMemberShare
+
+# Members (or shares) handled per transaction
+BULK_SHARE_CHUNK_SIZE = 200
+
+
+def _share_to_org_chunk(
+    db: Session, account_id: str, member_ids: list[str], target_org_id: str
+) -> list[dict[str, Any]]:
+    controllers = dict(
+        db.execute(
+            select(
+                ServiceMember.id,
+                func.coalesce(ServiceMember.subject_account_id, ServiceMember.creator_account_id),
+            ).where(ServiceMember.id.in_(member_ids))
+        ).tuples()
+    )
+    already_shared = set(
+        db.execute(
+            select(ServiceMemberShare.service_member_id)
+            .where(ServiceMemberShare.service_member_id.in_(member_ids))
+            .where(ServiceMemberShare.target_org_id == target_org_id)
+            .where(ServiceMemberShare.status.in_((PENDING, ACCEPTED)))
+        ).scalars()
+    )
+    ok, skipped = classify_share_members(member_ids, controllers, account_id, already_shared)
+
+    share_ids = {member_id: str(uuid.uuid4()) for member_id in ok}
+    now = datetime.now(timezone.utc)
+    if ok:
+        db.execute(
+            insert(ServiceMemberShare).values([
+                {
+                    "id": share_ids[member_id],
+                    "service_member_id": member_id,
+                    "target_org_id": target_org_id,
+                    "permission": "edit",  # locked: org gets edit rights on accept
+                    "status": PENDING,
+                    "created_at": now,
+                }
+                for member_id in ok
+            ])
+        )
+        bump_member_versions(db, ok)
+        audit_many(
+            db,
+            actor_type="account",
+            actor_id=account_id,
+            action="share.org.request",
+            target_type="service_member",
+            entries=[(member_id, {"target_org_id": target_org_id, "bulk": True}) for member_id in ok],
+        )
+
+    return [
+        {"service_member_id": member_id, "share_id": share_ids[member_id], "status": PENDING}
+        if member_id in share_ids
+        else {"service_member_id": member_id, "status": skipped[member_id]}
+        for member_id in member_ids
+    ]
+
+
+def bulk_share_to_org(
+    db: Session,
+    account_id: str,
+    member_ids: Iterable[str],
+    target_org_id: str,
+    *,
+    chunk_size: int = BULK_SHARE_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """
+    Requests an org share for every member the account controls, checking
+    control with one query and inserting shares and audit rows with one
+    statement each per chunk. Each chunk is committed on its own, so a
+    failure leaves earlier chunks in place. Returns one result per
+    distinct member id, in request order.
+    """
+    results: list[dict[str, Any]] = []
+    for chunk in chunks(unique_ids(member_ids), chunk_size):
+        results += _share_to_org_chunk(db, account_id, chunk, target_org_id)
+        db.commit()
+    return results
+
+
+def _decide_chunk(
+    db: Session,
+    account_id: str,
+    share_ids: list[str],
+    decision: str,
+    reason: Optional[str],
+    allowed_org_ids: Optional[set[str]],
+) -> list[dict[str, Any]]:
+    shares = {
+        share_id: (member_id, status, org_id)
+        for share_id, member_id, status, org_id in db.execute(
+            select(
+                ServiceMemberShare.id,
+                ServiceMemberShare.service_member_id,
+                ServiceMemberShare.status,
+                ServiceMemberShare.target_org_id,
+            )
+            .where(ServiceMemberShare.id.in_(share_ids))
+            .where(ServiceMemberShare.target_org_id.is_not(None))
+            .order_by(ServiceMemberShare.id)
+            .with_for_update()
+        )
+    }
+    out_of_scope = set()
+    if allowed_org_ids is not None:
+        out_of_scope = {k for k, (_, _, org_id) in shares.items() if org_id not in allowed_org_ids}
+    ok, skipped = classify_decision_shares(
+        share_ids, {k: status for k, (_, status, _) in shares.items()}, out_of_scope
+    )
+
+    if ok:
+        member_ids = sorted({shares[share_id][0] for share_id in ok})
+        before = member_rollup_orgs(db, member_ids) if decision == ACCEPTED else {}
+        db.execute(
+            update(ServiceMemberShare)
+            .where(ServiceMemberShare.id.in_(ok))
+            .values(status=decision)
+            .execution_options(synchronize_session=False)
+        )
+        if decision == ACCEPTED:
+            reconcile_members_orgs(db, {member_id: before.get(member_id, set()) for member_id in member_ids})
+            bump_org_versions(db, set().union(*member_rollup_orgs(db, member_ids).values()))
+            sync_member_access(db, member_ids)
+        bump_member_versions(db, member_ids)
+        audit_many(
+            db,
+            actor_type="account",
+            actor_id=account_id,
+            action=f"share.org.{decision}",
+            target_type="share",
+            entries=[(share_id, {"reason": reason, "bulk": True}) for share_id in ok],
+        )
+
+    return [
+        {"share_id": share_id, "status": skipped.get(share_id, decision)}
+        for share_id in share_ids
+    ]
+
+
+def bulk_decide_org_shares(
+    db: Session,
+    account_id: str,
+    share_ids: Iterable[str],
+    decision: str,
+    reason: Optional[str] = None,
+    *,
+    org_scope: Optional[str] = None,
+    chunk_size: int = BULK_SHARE_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """
+    Accepts or denies many pending org shares. Per chunk the shares are
+    locked and updated with one statement each, rollups, org versions and
+    member_access are maintained for all accepted members together, and
+    the chunk is committed. With org_scope, only shares aimed at that org
+    or a unit under it are decided; the rest are forbidden. Returns one
+    result per distinct share id, in request order.
+    """
+    allowed_org_ids = None
+    if org_scope is not None:
+        allowed_org_ids = set(db.execute(org_subtree_ids(org_scope)).scalars())
+
+    results: list[dict[str, Any]] = []
+    for chunk in chunks(unique_ids(share_ids), chunk_size):
+        results += _decide_chunk(db, account_id, chunk, decision, reason, allowed_org_ids)
+        db.commit()
+    return results
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.member_status_service import STATUS_COLUMNS
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.member_status import ServiceMemberStatus
+from app.models.service_member import ServiceMember
+from app.models.share import ServiceMemberShare
+
+# stp_data keys copied into the inbox member summary
+SUMMARY_STP_KEYS = ("rank", "current_unit", "duty_status")
+
+
+def _pending_for_org(organization_id: str):
+    # Matches ix_service_member_shares_org_pending (partial on status = 'pending')
+    return (
+        (ServiceMemberShare.target_org_id == organization_id)
+        & (ServiceMemberShare.status == "pending")
+    )
+
+
+def count_pending_org_shares(db: Session, organization_id: str) -> int:
+    return db.execute(
+        select(func.count()).select_from(ServiceMemberShare).where(_pending_for_org(organization_id))
+    ).scalar_one()
+
+
+def list_pending_org_shares(
+    db: Session,
+    organization_id: str,
+    *,
+    limit: int,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """
+    One keyset page of shares waiting on the org's decision, oldest first,
+    each with a member summary (branch, component, a few stp_data fields
+    and stored card statuses). The total comes from the same partial index.
+    """
+    query = (
+        select(
+            ServiceMemberShare.id,
+            ServiceMemberShare.service_member_id,
+            ServiceMemberShare.permission,
+            ServiceMemberShare.created_at,
+            ServiceMember.branch,
+            ServiceMember.component,
+            ServiceMember.subject_account_id,
+            *(ServiceMember.stp_data[key].astext.label(key) for key in SUMMARY_STP_KEYS),
+            *(col.label(card) for card, col in STATUS_COLUMNS.items()),
+        )
+        .join(ServiceMember, ServiceMember.id == ServiceMemberShare.service_member_id)
+        .outerjoin(ServiceMemberStatus, ServiceMemberStatus.service_member_id == ServiceMemberShare.service_member_id)
+        .where(_pending_for_org(organization_id))
+    )
+    if cursor:
+        after_created, after_id = decode_cursor(cursor, 2)
+        if not isinstance(after_id, str):
+            raise ValueError("Invalid cursor")
+        try:
+            after_created = datetime.fromisoformat(after_created)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+        query = query.where(
+            tuple_(ServiceMemberShare.created_at, ServiceMemberShare.id)
+            > tuple_(literal(after_created), literal(after_id))
+        )
+
+    rows = db.execute(
+        query.order_by(ServiceMemberShare.created_at, ServiceMemberShare.id).limit(limit + 1)
+    ).mappings().all()
+    page, more = rows[:limit], len(rows) > limit
+
+    items = [
+        {
+            "share_id": row["id"],
+            "service_member_id": row["service_member_id"],
+            "permission": row["permission"],
+            "created_at": row["created_at"],
+            "member": {
+                "branch": row["branch"],
+                "component": row["component"],
+                "claimed": row["subject_account_id"] is not None,
+                **{key: row[key] for key in SUMMARY_STP_KEYS},
+                "statuses": {card: row[card] for card in STATUS_COLUMNS},
+            },
+        }
+        for row in page
+    ]
+
+    next_cursor = None
+    if more:
+        last = page[-1]
+        next_cursor = encode_cursor([last["created_at"].isoformat(), last["id"]])
+    return {
+        "total": count_pending_org_shares(db, organization_id),
+        "items": items,
+        "next_cursor": next_cursor,
+    }
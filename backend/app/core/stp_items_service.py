@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from typing import Any, Iterable
+
+from sqlalchemy import Select, case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.domain.member_status import AMBER_LEAD
+from app.domain.stp_items import (
+    award_item_rows,
+    build_awards_card_from_items,
+    build_training_card_from_items,
+    training_item_rows,
+)
+from app.models.service_member import ServiceMember
+from app.models.stp_items import AwardItem, TrainingItem
+
+ITEM_BATCH_SIZE = 1000
+
+# Rows per INSERT, well under the driver's bind parameter limit
+ITEM_INSERT_CHUNK = 2000
+
+
+def _insert_rows(db: Session, model, rows: list[dict[str, Any]]) -> None:
+    it = iter(rows)
+    while chunk := list(islice(it, ITEM_INSERT_CHUNK)):
+        db.execute(insert(model).values(chunk))
+
+
+def replace_member_items(db: Session, members: Iterable[tuple[str, dict[str, Any]]]) -> None:
+    """
+    Rewrites training_items/award_items for (service_member_id, stp_data)
+    pairs. Call alongside every stp_data write; the caller owns the commit.
+    """
+    members = list(members)
+    if not members:
+        return
+    ids = [service_member_id for service_member_id, _ in members]
+    db.execute(delete(TrainingItem).where(TrainingItem.service_member_id.in_(ids)))
+    db.execute(delete(AwardItem).where(AwardItem.service_member_id.in_(ids)))
+
+    training: list[dict[str, Any]] = []
+    awards: list[dict[str, Any]] = []
+    for service_member_id, stp in members:
+        training += training_item_rows(service_member_id, stp or {})
+        awards += award_item_rows(service_member_id, stp or {})
+    _insert_rows(db, TrainingItem, training)
+    _insert_rows(db, AwardItem, awards)
+
+
+def backfill_stp_items(db: Session, *, batch_size: int = ITEM_BATCH_SIZE) -> int:
+    """
+    Rebuilds both item tables from stp_data, committing once per keyset batch.
+    """
+    total = 0
+    last_id = ""
+    while True:
+        batch = db.execute(
+            select(ServiceMember.id, ServiceMember.stp_data)
+            .where(ServiceMember.id > last_id)
+            .order_by(ServiceMember.id)
+            .limit(batch_size)
+        ).tuples().all()
+        if not batch:
+            return total
+        replace_member_items(db, batch)
+        db.commit()
+        total += len(batch)
+        last_id = batch[-1][0]
+
+
+def member_item_cards(
+    db: Session,
+    member_ids: list[str],
+    *,
+    now: datetime | None = None,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Training and awards cards for many members, read from the item tables
+    instead of decoding stp_data.
+    """
+    training: dict[str, list] = defaultdict(list)
+    awards: dict[str, list] = defaultdict(list)
+    if member_ids:
+        for row in db.execute(
+            select(TrainingItem.service_member_id, TrainingItem.due_date, TrainingItem.completed)
+            .where(TrainingItem.service_member_id.in_(member_ids))
+        ):
+            training[row.service_member_id].append(row)
+        for row in db.execute(
+            select(AwardItem.service_member_id, AwardItem.status)
+            .where(AwardItem.service_member_id.in_(member_ids))
+        ):
+            awards[row.service_member_id].append(row)
+
+    return {
+        service_member_id: {
+            "training": build_training_card_from_items(training[service_member_id], now),
+            "awards": build_awards_card_from_items(awards[service_member_id]),
+        }
+        for service_member_id in member_ids
+    }
+
+
+def summarize_items_by_type(
+    db: Session,
+    member_ids: Select,
+    *,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Overdue / upcoming training and pending awards per item type for a
+    roster, answered from the indexes instead of stp_data.
+    """
+    now = now or datetime.utcnow()
+    overdue = TrainingItem.due_date < now
+    upcoming = (TrainingItem.due_date >= now) & (TrainingItem.due_date < now + AMBER_LEAD)
+
+    training = db.execute(
+        select(
+            TrainingItem.item_type,
+            func.count().label("total"),
+            func.count().filter(TrainingItem.completed).label("completed"),
+            func.count().filter(overdue).label("overdue"),
+            func.count().filter(upcoming).label("due_within_60_days"),
+            func.count(func.distinct(case((overdue, TrainingItem.service_member_id)))).label("members_overdue"),
+        )
+        .where(TrainingItem.service_member_id.in_(member_ids))
+        .group_by(TrainingItem.item_type)
+        .order_by(TrainingItem.item_type)
+    ).mappings().all()
+
+    awards = db.execute(
+        select(AwardItem.award_type, func.count().label("pending"))
+        .where(AwardItem.service_member_id.in_(member_ids))
+        .where(AwardItem.status == "pending")
+        .group_by(AwardItem.award_type)
+        .order_by(AwardItem.award_type)
+    ).mappings().all()
+
+    return {
+        "as_of": now.isoformat(),
+        "training": [dict(row) for row in training],
+        "awards_pending": [dict(row) for row in awards],
+    }
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import cast, func, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.domain.stp_patch import PatchOp
+from app.models.service_member import ServiceMember
+
+# Raised by jsonb_apply_patch() for a missing path or bad array index
+INVALID_PATCH_SQLSTATE = "22023"
+
+
+def _patched_stp(merge_patch: dict[str, Any] | None, ops: list[PatchOp] | None):
+    if merge_patch is not None:
+        return func.jsonb_merge_patch(ServiceMember.stp_data, cast(merge_patch, JSONB))
+    return func.jsonb_apply_patch(
+        ServiceMember.stp_data,
+        cast([{"op": op.op, "path": list(op.path), "value": op.value} for op in ops or []], JSONB),
+    )
+
+
+def apply_stp_patch(
+    db: Session,
+    service_member_id: str,
+    expected_version: int,
+    *,
+    merge_patch: dict[str, Any] | None = None,
+    ops: list[PatchOp] | None = None,
+) -> tuple[dict[str, Any], int] | None:
+    """
+    Applies a merge patch or validated JSON Patch ops to stp_data inside
+    Postgres, only if the row is still at expected_version.
+
+    Returns the new (stp_data, version), or None when another writer got
+    there first. Raises ValueError if a JSON Patch path does not exist.
+    The caller owns the commit.
+    """
+    stmt = (
+        update(ServiceMember)
+        .where(ServiceMember.id == service_member_id)
+        .where(ServiceMember.version == expected_version)
+        .values(stp_data=_patched_stp(merge_patch, ops), version=ServiceMember.version + 1)
+        .returning(ServiceMember.stp_data, ServiceMember.version)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        row = db.execute(stmt).one_or_none()
+    except DBAPIError as e:
+        if getattr(e.orig, "sqlstate", None) != INVALID_PATCH_SQLSTATE:
+            raise
+        db.rollback()
+        diag = getattr(e.orig, "diag", None)
+        raise ValueError(getattr(diag, "message_primary", None) or "Patch does not apply") from e
+    return (row[0], row[1]) if row else None
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.core.member_status_service import refresh_member_status
+from app.core.stp_items_service import replace_member_items
+from app.core.versioning import bump_member_org_versions
+from app.models.service_member import ServiceMember
+
+
+def sync_stp_derived(db: Session, sm: ServiceMember) -> None:
+    """
+    Keeps tables derived from stp_data in step with the member row.
+    Call after every stp_data write, inside the same unit of work.
+    """
+    replace_member_items(db, [(sm.id, sm.stp_data)])
+    refresh_member_status(db, sm)
+    bump_member_org_versions(db, sm.id)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Mapping, Optional
+
+# Bytes read from the request and written to disk per step
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Allowance for multipart framing (boundaries, part headers, the other form
+# fields) when a request's Content-Length is checked against a file limit
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """
+    Raised as soon as a stream passes its byte limit; nothing is left on disk.
+    """
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"Upload exceeds {limit} bytes")
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    path: Path
+    size_bytes: int
+    sha256: str
+
+
+def max_upload_bytes(
+    spot_key: str,
+    tier_code: Optional[str],
+    *,
+    default: int,
+    by_tier: Mapping[str, int],
+    by_spot: Mapping[str, int],
+) -> int:
+    """
+    Byte limit for one upload: the tier's limit (else the default), capped
+    by the spot's limit. A spot limit is looked up by the full key
+    ("training.weapons_qual") and then by its section ("training").
+    """
+    limit = by_tier.get(tier_code or "", default)
+    spot_limit = by_spot.get(spot_key, by_spot.get(spot_key.split(".", 1)[0]))
+    return min(limit, spot_limit) if spot_limit is not None else limit
+
+
+def hash_file(path: Path, *, chunk_size: int = UPLOAD_CHUNK_SIZE) -> StoredUpload:
+    """
+    Size and SHA-256 of a file already on disk, read in chunks.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            size += len(chunk)
+            digest.update(chunk)
+    return StoredUpload(path=path, size_bytes=size, sha256=digest.hexdigest())
+
+
+def blob_path(storage_dir: Path, sha256: str) -> Path:
+    """
+    Content-addressed location, fanned out by the first two hex digits.
+    """
+    return storage_dir / "blobs" / sha256[:2] / sha256
+
+
+def blob_lock_key(sha256: str) -> int:
+    """
+    Signed 64-bit Postgres advisory lock key for a content hash.
+    """
+    return int(sha256[:16], 16) - (1 << 63)
+
+
+def stream_to_file(
+    src: BinaryIO,
+    dest: Path,
+    *,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> StoredUpload:
+    """
+    Copies src to dest in fixed-size chunks, hashing and counting as it
+    goes, so memory use does not depend on the file size. Data lands in a
+    temp file next to dest and is renamed into place only once complete;
+    on any error (including UploadTooLarge) the temp file is removed.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=".upload-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := src.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_name, dest)
+    except BaseException:
+        try:
+            os.remove(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return StoredUpload(path=dest, size_bytes=size, sha256=digest.hexdigest())
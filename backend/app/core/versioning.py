@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.org_rollup_service import member_rollup_orgs
+from app.models.organization import Organization
+from app.models.service_member import ServiceMember
+
+
+def bump_member_version(db: Session, service_member_id: str) -> None:
+    """
+    Marks a member's cards as changed (stp_data, shares, control).
+    """
+    db.execute(
+        update(ServiceMember)
+        .where(ServiceMember.id == service_member_id)
+        .values(version=ServiceMember.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_member_versions(db: Session, service_member_ids: Iterable[str]) -> None:
+    """
+    bump_member_version for many members in one UPDATE (ids sorted, as for orgs).
+    """
+    service_member_ids = sorted(set(service_member_ids))
+    if not service_member_ids:
+        return
+    db.execute(
+        update(ServiceMember)
+        .where(ServiceMember.id.in_(service_member_ids))
+        .values(version=ServiceMember.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_org_versions(db: Session, org_ids: Iterable[str]) -> None:
+    """
+    Marks org summaries as changed. Ids are sorted so concurrent writers lock consistently.
+    """
+    org_ids = sorted(set(org_ids))
+    if not org_ids:
+        return
+    db.execute(
+        update(Organization)
+        .where(Organization.id.in_(org_ids))
+        .values(version=Organization.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_member_org_versions(db: Session, service_member_id: str) -> None:
+    """
+    Every org whose summary includes the member (direct orgs and their ancestors).
+    """
+    bump_org_versions(db, member_rollup_orgs(db, [service_member_id]).get(service_member_id, set()))
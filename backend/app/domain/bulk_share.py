@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import AbstractSet, Iterable, Iterator, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Per-item outcomes reported by the bulk share endpoints
+PENDING = "pending"
+ACCEPTED = "accepted"
+DENIED = "denied"
+NOT_FOUND = "not_found"
+FORBIDDEN = "forbidden"
+ALREADY_SHARED = "already_shared"
+ALREADY_DECIDED = "already_decided"
+
+DECISIONS = (ACCEPTED, DENIED)
+
+
+def unique_ids(ids: Iterable[str]) -> list[str]:
+    """
+    Drops repeated ids, keeping the first occurrence's position.
+    """
+    return list(dict.fromkeys(ids))
+
+
+def chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def classify_share_members(
+    member_ids: list[str],
+    controllers: Mapping[str, str],
+    account_id: str,
+    already_shared: set[str],
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Splits requested members into those the account may share now and a
+    member id -> outcome map for the rest. controllers maps each existing
+    member to its controller (subject, else creator).
+    """
+    ok: list[str] = []
+    skipped: dict[str, str] = {}
+    for member_id in member_ids:
+        controller = controllers.get(member_id)
+        if controller is None:
+            skipped[member_id] = NOT_FOUND
+        elif controller != account_id:
+            skipped[member_id] = FORBIDDEN
+        elif member_id in already_shared:
+            skipped[member_id] = ALREADY_SHARED
+        else:
+            ok.append(member_id)
+    return ok, skipped
+
+
+def classify_decision_shares(
+    share_ids: list[str],
+    statuses: Mapping[str, Optional[str]],
+    out_of_scope: AbstractSet[str] = frozenset(),
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Splits requested org shares into pending ones (decidable) and a share
+    id -> outcome map for the rest. statuses maps each existing org share
+    to its current status; shares in out_of_scope target an org the caller
+    may not decide for.
+    """
+    ok: list[str] = []
+    skipped: dict[str, str] = {}
+    for share_id in share_ids:
+        if share_id not in statuses:
+            skipped[share_id] = NOT_FOUND
+        elif share_id in out_of_scope:
+            skipped[share_id] = FORBIDDEN
+        elif statuses[share_id] != PENDING:
+            skipped[share_id] = ALREADY_DECIDED
+        else:
+            ok.append(share_id)
+    return ok, skipped
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict
+
+from app.domain.dashboard_cards import FITNESS_TEST_LABELS, _parse_iso, _status_color
+
+# Distinct dates remembered per evaluator (LRU). Shared training due dates
+# stay hot; near-unique per-member expirations age out, so a long-lived
+# evaluator (streaming summary, export) holds constant memory.
+DAYS_MEMO_SIZE = 4096
+
+
+class CardEvaluator:
+    """
+    Builds all five dashboard cards from a single walk over stp_data.
+
+    Create one per request: the clock is read once (as_of) and days
+    remaining are memoized per ISO string in a bounded LRU, so members
+    sharing training due dates only pay for parsing each date once.
+    Output matches the individual build_*_card functions.
+    """
+
+    def __init__(self, as_of: datetime | None = None, memo_size: int = DAYS_MEMO_SIZE) -> None:
+        self.as_of = as_of or datetime.utcnow()
+        self.memo_size = memo_size
+        self._days: OrderedDict[str, int | None] = OrderedDict()
+
+    def days_remaining(self, date_str: str | None) -> int | None:
+        memo = self._days
+        try:
+            days = memo[date_str]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable garbage in stp_data; _parse_iso rejects it anyway
+            return None
+        else:
+            memo.move_to_end(date_str)
+            return days
+
+        dt = _parse_iso(date_str)
+        days = (dt - self.as_of).days if dt is not None else None
+        memo[date_str] = days
+        if len(memo) > self.memo_size:
+            memo.popitem(last=False)
+        return days
+
+    def evaluate(self, stp: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        get = stp.get
+        branch = get("branch")
+
+        # perstats
+        perstats = {
+            "rank": get("rank"),
+            "duty_status": get("duty_status"),
+            "unit": get("current_unit"),
+            "branch": branch,
+            "component": get("component"),
+        }
+
+        # fitness
+        fitness = get("fitness", {})
+        fitness_expiration = fitness.get("expiration_date")
+        fitness_days = self.days_remaining(fitness_expiration)
+
+        # training
+        training = get("training", [])
+        overdue = upcoming = completed = 0
+        for item in training:
+            if item.get("completed"):
+                completed += 1
+            due = item.get("due_date")
+            if due:
+                days = self.days_remaining(due)
+                if days is not None:
+                    if days < 0:
+                        overdue += 1
+                    elif days <= 60:
+                        upcoming += 1
+        total = len(training)
+
+        # awards
+        awards = get("awards", [])
+        pending = sum(1 for award in awards if award.get("status") == "pending")
+
+        # readiness
+        readiness_expiration = get("readiness", {}).get("readiness_expiration")
+        readiness_days = self.days_remaining(readiness_expiration)
+
+        return {
+            "perstats": perstats,
+            "fitness": {
+                "test_type": FITNESS_TEST_LABELS.get(branch, "Fitness"),
+                "last_test_date": fitness.get("last_test_date"),
+                "expiration_date": fitness_expiration,
+                "days_remaining": fitness_days,
+                "status": _status_color(fitness_days),
+            },
+            "training": {
+                "total_training_items": total,
+                "completed": completed,
+                "overdue": overdue,
+                "due_within_60_days": upcoming,
+                "completion_rate_percent": round((completed / total) * 100, 2) if total else 100,
+                "status": "red" if overdue else ("amber" if upcoming else "green"),
+            },
+            "awards": {
+                "total_awards": len(awards),
+                "pending": pending,
+                "status": "amber" if pending > 0 else "green",
+            },
+            "readiness": {
+                "readiness_expiration": readiness_expiration,
+                "days_remaining": readiness_days,
+                "status": _status_color(readiness_days),
+            },
+        }
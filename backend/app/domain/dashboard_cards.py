@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 
+FITNESS_TEST_LABELS = {
+    "Army": "ACFT",
+    "Air Force": "PFA",
+    "Navy": "PRT",
+    "Marine Corps": "PFT/CFT",
+    "Coast Guard": "PT",
+    "Space Force": "PFA",
+}
+
+
 # ==========================================================
 # Internal Utility Functions
 # ==========================================================
 
-def _days_remaining(date_str: str | None) -> int | None:
+def _parse_iso(date_str: str | None) -> datetime | None:
     """
-    Safely calculate remaining days from ISO datetime string.
+    Parses an ISO datetime string from stp_data as naive UTC.
     Returns None if invalid or missing.
     """
     if not date_str:
@@ -19,8 +29,26 @@ def _days_remaining(date_str: str | None) -> int | None:
     try:
         # Handle possible Z timezone
         dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        now = datetime.utcnow()
-        return (dt - now).days
+    except Exception:
+        return None
+
+    # Offset-aware values are compared against utcnow(), so normalize them
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _days_remaining(date_str: str | None, now: datetime | None = None) -> int | None:
+    """
+    Safely calculate remaining days from ISO datetime string.
+    Returns None if invalid or missing.
+    """
+    dt = _parse_iso(date_str)
+    if dt is None:
+        return None
+
+    try:
+        return (dt - (now or datetime.utcnow())).days
     except Exception:
         return None
 
@@ -55,30 +83,21 @@ def build_perstats_card(stp: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def build_fitness_card(stp: Dict[str, Any]) -> Dict[str, Any]:
+def build_fitness_card(stp: Dict[str, Any], now: datetime | None = None) -> Dict[str, Any]:
     """
     Branch-aware fitness summary.
     """
 
     branch = stp.get("branch")
 
-    test_label_map = {
-        "Army": "ACFT",
-        "Air Force": "PFA",
-        "Navy": "PRT",
-        "Marine Corps": "PFT/CFT",
-        "Coast Guard": "PT",
-        "Space Force": "PFA",
-    }
-
     fitness = stp.get("fitness", {})
     expiration = fitness.get("expiration_date")
     last_test = fitness.get("last_test_date")
 
-    days_remaining = _days_remaining(expiration)
+    days_remaining = _days_remaining(expiration, now)
 
     return {
-        "test_type": test_label_map.get(branch, "Fitness"),
+        "test_type": FITNESS_TEST_LABELS.get(branch, "Fitness"),
         "last_test_date": last_test,
         "expiration_date": expiration,
         "days_remaining": days_remaining,
@@ -86,7 +105,7 @@ def build_fitness_card(stp: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def build_training_card(stp: Dict[str, Any]) -> Dict[str, Any]:
+def build_training_card(stp: Dict[str, Any], now: datetime | None = None) -> Dict[str, Any]:
     """
     Training readiness aggregation.
     """
@@ -103,7 +122,7 @@ def build_training_card(stp: Dict[str, Any]) -> Dict[str, Any]:
 
         due = item.get("due_date")
         if due:
-            days = _days_remaining(due)
+            days = _days_remaining(due, now)
             if days is not None:
                 if days < 0:
                     overdue += 1
@@ -144,7 +163,7 @@ def build_awards_card(stp: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def build_readiness_card(stp: Dict[str, Any]) -> Dict[str, Any]:
+def build_readiness_card(stp: Dict[str, Any], now: datetime | None = None) -> Dict[str, Any]:
     """
     Branch-neutral readiness expiration tracking.
     """
@@ -152,7 +171,7 @@ def build_readiness_card(stp: Dict[str, Any]) -> Dict[str, Any]:
     readiness = stp.get("readiness", {})
 
     expiration = readiness.get("readiness_expiration")
-    days_remaining = _days_remaining(expiration)
+    days_remaining = _days_remaining(expiration, now)
 
     return {
         "readiness_expiration": expiration,
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from app.domain.member_status import RED_LEAD
+
+DEFAULT_HORIZONS: Tuple[int, ...] = (7, 30, 60, 90)
+MAX_HORIZON_DAYS = 365
+MAX_HORIZONS = 8
+
+# How long before its key date a card turns red:
+# fitness/readiness at < 30 days remaining, training once an item is overdue
+FORECAST_CARDS = {
+    "fitness": RED_LEAD,
+    "readiness": RED_LEAD,
+    "training": timedelta(0),
+}
+
+
+def parse_horizons(raw: str | None) -> Tuple[int, ...]:
+    """
+    "7,30,60,90" -> (7, 30, 60, 90), sorted and de-duplicated.
+    """
+    if not raw:
+        return DEFAULT_HORIZONS
+    try:
+        horizons = sorted({int(part) for part in raw.split(",") if part.strip()})
+    except ValueError:
+        raise ValueError("Horizons must be comma-separated whole days")
+    if not horizons or len(horizons) > MAX_HORIZONS:
+        raise ValueError(f"Between 1 and {MAX_HORIZONS} horizons are allowed")
+    if horizons[0] < 1 or horizons[-1] > MAX_HORIZON_DAYS:
+        raise ValueError(f"Horizons must be between 1 and {MAX_HORIZON_DAYS} days")
+    return tuple(horizons)
+
+
+def red_window(card: str, as_of: datetime, horizon_days: int) -> Tuple[datetime, datetime]:
+    """
+    Half-open [lo, hi) range of key dates (expiration, or next training due
+    date) for members that are not red at as_of but are red horizon_days later.
+    """
+    lead = FORECAST_CARDS[card]
+    return as_of + lead, as_of + timedelta(days=horizon_days) + lead
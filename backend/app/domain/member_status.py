@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from app.domain.dashboard_cards import (
+    _parse_iso,
+    build_fitness_card,
+    build_training_card,
+    build_awards_card,
+    build_readiness_card,
+)
+
+
+# ==========================================================
+# Status Thresholds
+# ==========================================================
+
+# days_remaining is floored, so "< 30" flips 30 days before expiration
+# and "<= 60" flips 61 days before it (see _status_color).
+RED_LEAD = timedelta(days=30)
+AMBER_LEAD = timedelta(days=61)
+
+
+@dataclass(frozen=True)
+class MemberStatus:
+    """
+    Compact per-member snapshot of the four org dashboard cards.
+
+    valid_until is the last instant at which every status is still
+    correct; after it at least one status may flip. None means the
+    statuses never change with time.
+    """
+    fitness_status: str
+    fitness_expiration: datetime | None
+    training_status: str
+    training_next_due: datetime | None
+    awards_status: str
+    readiness_status: str
+    readiness_expiration: datetime | None
+    valid_until: datetime | None
+
+
+# ==========================================================
+# Internal Utility Functions
+# ==========================================================
+
+def _next_boundary(boundaries: list[datetime], now: datetime) -> datetime | None:
+    upcoming = [b for b in boundaries if b >= now]
+    return min(upcoming) if upcoming else None
+
+
+# ==========================================================
+# Status Builder
+# ==========================================================
+
+def compute_member_status(stp: Dict[str, Any], now: datetime | None = None) -> MemberStatus:
+    """
+    Evaluates the org dashboard cards for one member, plus the key
+    dates needed to know when the result goes stale.
+    """
+    now = now or datetime.utcnow()
+    boundaries: list[datetime] = []
+
+    fitness_expiration = _parse_iso(stp.get("fitness", {}).get("expiration_date"))
+    readiness_expiration = _parse_iso(stp.get("readiness", {}).get("readiness_expiration"))
+    for expiration in (fitness_expiration, readiness_expiration):
+        if expiration is not None:
+            boundaries += [expiration - AMBER_LEAD, expiration - RED_LEAD]
+
+    training_next_due = None
+    for item in stp.get("training", []):
+        due = _parse_iso(item.get("due_date"))
+        if due is None:
+            continue
+        boundaries += [due - AMBER_LEAD, due]
+        if due >= now and (training_next_due is None or due < training_next_due):
+            training_next_due = due
+
+    return MemberStatus(
+        fitness_status=build_fitness_card(stp, now)["status"],
+        fitness_expiration=fitness_expiration,
+        training_status=build_training_card(stp, now)["status"],
+        training_next_due=training_next_due,
+        awards_status=build_awards_card(stp)["status"],
+        readiness_status=build_readiness_card(stp, now)["status"],
+        readiness_expiration=readiness_expiration,
+        valid_until=_next_boundary(boundaries, now),
+    )
@@ -1,29 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Iterable, Dict, Any
 from collections import Counter
 
-from app.domain.dashboard_cards import (
-    build_fitness_card,
-    build_training_card,
-    build_awards_card,
-    build_readiness_card,
-)
+from app.domain.card_evaluator import CardEvaluator
 
 
 # ==========================================================
 # Utility
 # ==========================================================
 
-def _rag_counter(items: List[Dict[str, Any]]) -> Dict[str, int]:
+def _rag_counts(counter: Counter) -> Dict[str, int]:
     """
-    Counts red / amber / green statuses from card list.
+    Normalizes a status counter to the four RAG buckets.
     """
-    counter = Counter()
-    for item in items:
-        status = item.get("status", "gray")
-        counter[status] += 1
-
     return {
         "green": counter.get("green", 0),
         "amber": counter.get("amber", 0),
@@ -44,53 +35,76 @@ def _overall_status(counter: Dict[str, int]) -> str:
 
 
 # ==========================================================
-# Organization Dashboard Builder
+# Streaming Accumulator
 # ==========================================================
 
-def build_org_dashboard(service_members: List[Dict[str, Any]]) -> Dict[str, Any]:
+SUMMARY_CARDS = ("fitness", "training", "awards", "readiness")
+
+
+class OrgDashboardAccumulator:
     """
-    Aggregates dashboard view for entire organization.
-    Accepts list of STP data dictionaries.
+    Running RAG counters for an organization dashboard.
+    Members are folded in one at a time, so no per-card lists are kept
+    and memory stays flat regardless of roster size.
     """
 
-    fitness_cards = []
-    training_cards = []
-    awards_cards = []
-    readiness_cards = []
+    def __init__(self, as_of: datetime | None = None) -> None:
+        self.total_personnel = 0
+        self._counters: Dict[str, Counter] = {card: Counter() for card in SUMMARY_CARDS}
+        self._evaluator = CardEvaluator(as_of)
+
+    def add(self, stp: Dict[str, Any]) -> None:
+        cards = self._evaluator.evaluate(stp)
+        self.add_statuses(
+            fitness=cards["fitness"]["status"],
+            training=cards["training"]["status"],
+            awards=cards["awards"]["status"],
+            readiness=cards["readiness"]["status"],
+        )
+
+    def add_statuses(self, *, fitness: str, training: str, awards: str, readiness: str, count: int = 1) -> None:
+        """
+        Folds already-computed statuses (e.g. from a GROUP BY row) into the counters.
+        """
+        self.total_personnel += count
+        self._counters["fitness"][fitness] += count
+        self._counters["training"][training] += count
+        self._counters["awards"][awards] += count
+        self._counters["readiness"][readiness] += count
+
+    def result(self) -> Dict[str, Any]:
+        return summarize_card_counts(self.total_personnel, self._counters)
+
+
+def summarize_card_counts(total_personnel: int, counters: Dict[str, Counter]) -> Dict[str, Any]:
+    """
+    Builds the org dashboard response from per-card status counters.
+    """
+    summary: Dict[str, Any] = {"total_personnel": total_personnel}
+    for card in SUMMARY_CARDS:
+        counts = _rag_counts(counters.get(card, Counter()))
+        summary[f"{card}_summary"] = {
+            "counts": counts,
+            "overall_status": _overall_status(counts),
+        }
+    return summary
 
-    for stp in service_members:
-        fitness_cards.append(build_fitness_card(stp))
-        training_cards.append(build_training_card(stp))
-        awards_cards.append(build_awards_card(stp))
-        readiness_cards.append(build_readiness_card(stp))
 
-    fitness_counter = _rag_counter(fitness_cards)
-    training_counter = _rag_counter(training_cards)
-    awards_counter = _rag_counter(awards_cards)
-    readiness_counter = _rag_counter(readiness_cards)
+# ==========================================================
+# Organization Dashboard Builder
+# ==========================================================
 
-    total_personnel = len(service_members)
+def build_org_dashboard(
+    service_members: Iterable[Dict[str, Any]],
+    as_of: datetime | None = None,
+) -> Dict[str, Any]:
+    """
+    Aggregates dashboard view for entire organization.
+    Accepts any iterable of STP data dictionaries; it is consumed once,
+    so a streaming database cursor can be passed straight in.
+    """
 
-    return {
-        "total_personnel": total_personnel,
-
-        "fitness_summary": {
-            "counts": fitness_counter,
-            "overall_status": _overall_status(fitness_counter),
-        },
-
-        "training_summary": {
-            "counts": training_counter,
-            "overall_status": _overall_status(training_counter),
-        },
-
-        "awards_summary": {
-            "counts": awards_counter,
-            "overall_status": _overall_status(awards_counter),
-        },
-
-        "readiness_summary": {
-            "counts": readiness_counter,
-            "overall_status": _overall_status(readiness_counter),
-        },
-    }
\ No newline at end of file
+    acc = OrgDashboardAccumulator(as_of)
+    for stp in service_members:
+        acc.add(stp)
+    return acc.result()
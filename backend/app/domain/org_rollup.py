@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from app.domain.org_dashboard import SUMMARY_CARDS, summarize_card_counts
+
+# card -> status for one member, e.g. {"fitness": "red", ...}
+MemberStatuses = Mapping[str, str]
+
+
+def status_deltas(old: MemberStatuses | None, new: MemberStatuses | None) -> List[Tuple[str, str, int]]:
+    """
+    (card, status, delta) changes a member transition implies for every
+    org above it. old=None means the member is being added, new=None removed.
+    """
+    deltas: List[Tuple[str, str, int]] = []
+    for card in SUMMARY_CARDS:
+        before = old[card] if old else None
+        after = new[card] if new else None
+        if before == after:
+            continue
+        if before is not None:
+            deltas.append((card, before, -1))
+        if after is not None:
+            deltas.append((card, after, 1))
+    return deltas
+
+
+def summary_from_rollup(rows: Iterable[Tuple[str, str, int]]) -> Dict[str, Any]:
+    """
+    Org dashboard response from stored (card, status, member_count) rows.
+    """
+    counters: Dict[str, Counter] = {card: Counter() for card in SUMMARY_CARDS}
+    for card, status, count in rows:
+        counters[card][status] += count
+    # every member is counted once per card
+    total = sum(counters[SUMMARY_CARDS[0]].values())
+    return summarize_card_counts(total, counters)
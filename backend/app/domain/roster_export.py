@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+from app.domain.card_evaluator import CardEvaluator
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_COLUMNS = (
+    "service_member_id",
+    "branch",
+    "component",
+    "rank",
+    "duty_status",
+    "unit",
+    "fitness_status",
+    "fitness_expiration",
+    "fitness_days_remaining",
+    "training_status",
+    "training_overdue",
+    "training_due_within_60_days",
+    "training_completion_rate_percent",
+    "awards_status",
+    "awards_pending",
+    "readiness_status",
+    "readiness_expiration",
+    "readiness_days_remaining",
+)
+
+
+# ==========================================================
+# Row Builder
+# ==========================================================
+
+def export_row(
+    evaluator: CardEvaluator,
+    service_member_id: str,
+    branch: str,
+    component: str,
+    stp: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    One flat export record: identity columns plus the card fields.
+    """
+    cards = evaluator.evaluate(stp or {})
+    perstats, fitness, training = cards["perstats"], cards["fitness"], cards["training"]
+    awards, readiness = cards["awards"], cards["readiness"]
+    return {
+        "service_member_id": service_member_id,
+        "branch": branch,
+        "component": component,
+        "rank": perstats["rank"],
+        "duty_status": perstats["duty_status"],
+        "unit": perstats["unit"],
+        "fitness_status": fitness["status"],
+        "fitness_expiration": fitness["expiration_date"],
+        "fitness_days_remaining": fitness["days_remaining"],
+        "training_status": training["status"],
+        "training_overdue": training["overdue"],
+        "training_due_within_60_days": training["due_within_60_days"],
+        "training_completion_rate_percent": training["completion_rate_percent"],
+        "awards_status": awards["status"],
+        "awards_pending": awards["pending"],
+        "readiness_status": readiness["status"],
+        "readiness_expiration": readiness["readiness_expiration"],
+        "readiness_days_remaining": readiness["days_remaining"],
+    }
+
+
+# ==========================================================
+# Encoders
+# ==========================================================
+
+def encode_csv(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Header, then one CSV line per row, produced lazily.
+    """
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+
+    def flush() -> str:
+        line = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return line
+
+    writer.writeheader()
+    yield flush()
+    for row in rows:
+        writer.writerow(row)
+        yield flush()
+
+
+def encode_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, default=str) + "\n"
+
+
+def encode_export(rows: Iterable[Dict[str, Any]], fmt: str) -> Iterator[str]:
+    if fmt == "csv":
+        return encode_csv(rows)
+    if fmt == "ndjson":
+        return encode_ndjson(rows)
+    raise ValueError(f"Unsupported export format: {fmt}")
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Union
+
+from app.domain.branch_rules import validate_branch_component
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# CSV columns with a fixed meaning; any other non-empty column is stored
+# as a top-level stp_data key (rank, duty_status, current_unit, ...)
+CSV_CORE_COLUMNS = ("branch", "component", "stp_data")
+
+# stp_data keys the dashboard cards read, with the shape each must have
+CARD_OBJECT_KEYS = ("fitness", "readiness")
+CARD_LIST_KEYS = ("training", "awards")
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    line: int
+    branch: str
+    component: str
+    stp_data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    line: int
+    error: str
+
+
+ImportResult = Union[ImportRow, ImportRowError]
+
+
+# ==========================================================
+# Internal Utility Functions
+# ==========================================================
+
+def _card_data_error(stp_data: Dict[str, Any]) -> str | None:
+    for key in CARD_OBJECT_KEYS:
+        if key in stp_data and not isinstance(stp_data[key], dict):
+            return f"stp_data.{key} must be an object"
+    for key in CARD_LIST_KEYS:
+        if key not in stp_data:
+            continue
+        entries = stp_data[key]
+        if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+            return f"stp_data.{key} must be a list of objects"
+    return None
+
+
+def _build_row(line: int, record: Any) -> ImportResult:
+    if not isinstance(record, dict):
+        return ImportRowError(line, "Row must be an object")
+
+    branch = record.get("branch")
+    component = record.get("component")
+    if not isinstance(branch, str) or not isinstance(component, str) or not branch or not component:
+        return ImportRowError(line, "branch and component are required")
+    try:
+        validate_branch_component(branch, component)
+    except ValueError as e:
+        return ImportRowError(line, str(e))
+
+    stp_data = record.get("stp_data")
+    if stp_data is None:
+        stp_data = {}
+    if not isinstance(stp_data, dict):
+        return ImportRowError(line, "stp_data must be an object")
+    error = _card_data_error(stp_data)
+    if error:
+        return ImportRowError(line, error)
+    return ImportRow(line, branch, component, stp_data)
+
+
+def _parse_csv(lines: Iterable[str]) -> Iterator[ImportResult]:
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or not {"branch", "component"} <= set(reader.fieldnames):
+        yield ImportRowError(1, "CSV header must include branch and component")
+        return
+    clashing = [name for name in reader.fieldnames if name in CARD_OBJECT_KEYS + CARD_LIST_KEYS]
+    if clashing:
+        yield ImportRowError(1, f"Card data goes in the stp_data column, not {', '.join(clashing)}")
+        return
+
+    for record in reader:
+        line = reader.line_num
+        if None in record:
+            yield ImportRowError(line, "Too many columns")
+            continue
+
+        stp_data: Dict[str, Any] = {}
+        raw = (record.get("stp_data") or "").strip()
+        if raw:
+            try:
+                stp_data = json.loads(raw)
+            except ValueError:
+                yield ImportRowError(line, "stp_data is not valid JSON")
+                continue
+            if not isinstance(stp_data, dict):
+                yield ImportRowError(line, "stp_data must be an object")
+                continue
+        for key, value in record.items():
+            if key not in CSV_CORE_COLUMNS and value not in (None, ""):
+                stp_data.setdefault(key, value)
+
+        yield _build_row(
+            line,
+            {
+                "branch": (record.get("branch") or "").strip(),
+                "component": (record.get("component") or "").strip(),
+                "stp_data": stp_data,
+            },
+        )
+
+
+def _parse_ndjson(lines: Iterable[str]) -> Iterator[ImportResult]:
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            yield ImportRowError(line, "Invalid JSON")
+            continue
+        yield _build_row(line, record)
+
+
+# ==========================================================
+# Roster Import Parser
+# ==========================================================
+
+def parse_import(lines: Iterable[str], fmt: str) -> Iterator[ImportResult]:
+    """
+    Lazily turns an uploaded roster (an iterable of text lines) into
+    validated ImportRows or per-line ImportRowErrors, one at a time.
+    """
+    if fmt == "csv":
+        return _parse_csv(lines)
+    if fmt == "ndjson":
+        return _parse_ndjson(lines)
+    raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def detect_format(filename: str | None) -> str | None:
+    """
+    csv / ndjson from the upload's file extension, or None if unknown.
+    """
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from app.domain.dashboard_cards import _parse_iso
+
+ITEM_TYPE_MAX_LENGTH = 128
+ITEM_STATUS_MAX_LENGTH = 32
+
+
+# ==========================================================
+# Internal Utility Functions
+# ==========================================================
+
+def _label(item: Dict[str, Any], max_length: int, *keys: str) -> str | None:
+    for key in keys:
+        value = item.get(key)
+        if isinstance(value, str) and value:
+            return value[:max_length]
+    return None
+
+
+def _get(item: Any, key: str) -> Any:
+    return item[key] if isinstance(item, dict) else getattr(item, key)
+
+
+# ==========================================================
+# stp_data -> Item Rows
+# ==========================================================
+
+def training_item_rows(service_member_id: str, stp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flattens stp_data["training"] into training_items rows. Due dates are
+    parsed the same way the training card parses them.
+    """
+    return [
+        {
+            "service_member_id": service_member_id,
+            "position": position,
+            "item_type": _label(item, ITEM_TYPE_MAX_LENGTH, "type", "name", "title"),
+            "due_date": _parse_iso(item.get("due_date")) if item.get("due_date") else None,
+            "completed": bool(item.get("completed")),
+        }
+        for position, item in enumerate(stp.get("training", []))
+        if isinstance(item, dict)
+    ]
+
+
+def award_item_rows(service_member_id: str, stp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flattens stp_data["awards"] into award_items rows.
+    """
+    return [
+        {
+            "service_member_id": service_member_id,
+            "position": position,
+            "award_type": _label(item, ITEM_TYPE_MAX_LENGTH, "type", "name", "title"),
+            "status": _label(item, ITEM_STATUS_MAX_LENGTH, "status"),
+        }
+        for position, item in enumerate(stp.get("awards", []))
+        if isinstance(item, dict)
+    ]
+
+
+# ==========================================================
+# Card Builders over Item Rows
+# ==========================================================
+
+def build_training_card_from_items(items: Iterable[Any], now: datetime | None = None) -> Dict[str, Any]:
+    """
+    build_training_card computed from training_items rows (or dicts).
+    """
+    now = now or datetime.utcnow()
+    total = overdue = upcoming = completed = 0
+    for item in items:
+        total += 1
+        if _get(item, "completed"):
+            completed += 1
+        due = _get(item, "due_date")
+        if due is not None:
+            days = (due - now).days
+            if days < 0:
+                overdue += 1
+            elif days <= 60:
+                upcoming += 1
+
+    return {
+        "total_training_items": total,
+        "completed": completed,
+        "overdue": overdue,
+        "due_within_60_days": upcoming,
+        "completion_rate_percent": round((completed / total) * 100, 2) if total else 100,
+        "status": "red" if overdue else ("amber" if upcoming else "green"),
+    }
+
+
+def build_awards_card_from_items(items: Iterable[Any]) -> Dict[str, Any]:
+    """
+    build_awards_card computed from award_items rows (or dicts).
+    """
+    total = pending = 0
+    for item in items:
+        total += 1
+        if _get(item, "status") == "pending":
+            pending += 1
+    return {
+        "total_awards": total,
+        "pending": pending,
+        "status": "amber" if pending > 0 else "green",
+    }
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from app.domain.dashboard_cards import _parse_iso
+
+MAX_PATCH_OPS = 100
+MAX_PATH_DEPTH = 10
+
+JSON_PATCH_OPS = ("add", "replace", "remove")
+
+# stp_data keys the dashboard cards parse as ISO dates
+DATE_KEYS = frozenset({"expiration_date", "last_test_date", "readiness_expiration", "due_date"})
+
+
+@dataclass(frozen=True)
+class PatchOp:
+    op: str
+    path: Tuple[str, ...]
+    value: Any = None
+
+
+# ==========================================================
+# Internal Utility Functions
+# ==========================================================
+
+def _check_dates(path: Tuple[str, ...], value: Any) -> None:
+    """
+    Rejects unparseable strings under any known date key, at the patched
+    path itself or anywhere inside the patched value.
+    """
+    if path and path[-1] in DATE_KEYS and value is not None:
+        if not isinstance(value, str) or _parse_iso(value) is None:
+            raise ValueError(f"{format_pointer(path)} must be an ISO 8601 date")
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _check_dates(path + (key,), child)
+    elif isinstance(value, list):
+        for i, child in enumerate(value):
+            _check_dates(path + (str(i),), child)
+
+
+def _check_path(path: Tuple[str, ...]) -> None:
+    if not path:
+        raise ValueError("Patching the whole stp_data document is not allowed")
+    if len(path) > MAX_PATH_DEPTH:
+        raise ValueError(f"Paths deeper than {MAX_PATH_DEPTH} levels are not allowed")
+
+
+# ==========================================================
+# JSON Pointer (RFC 6901)
+# ==========================================================
+
+def parse_pointer(pointer: Any) -> Tuple[str, ...]:
+    """
+    "/training/0/due_date" -> ("training", "0", "due_date").
+    """
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    if not pointer:
+        return ()
+    return tuple(part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/"))
+
+
+def format_pointer(path: Tuple[str, ...]) -> str:
+    return "".join("/" + part.replace("~", "~0").replace("/", "~1") for part in path)
+
+
+# ==========================================================
+# Patch Validation
+# ==========================================================
+
+def validate_json_patch(ops: Any) -> List[PatchOp]:
+    """
+    Validates a JSON Patch (RFC 6902) document limited to add, replace
+    and remove. Whether each path exists is checked when it is applied.
+    """
+    if not isinstance(ops, list) or not ops:
+        raise ValueError("JSON Patch must be a non-empty array of operations")
+    if len(ops) > MAX_PATCH_OPS:
+        raise ValueError(f"At most {MAX_PATCH_OPS} operations are allowed")
+
+    parsed: List[PatchOp] = []
+    for op in ops:
+        if not isinstance(op, dict) or op.get("op") not in JSON_PATCH_OPS:
+            raise ValueError(f"Supported operations are: {', '.join(JSON_PATCH_OPS)}")
+        path = parse_pointer(op.get("path"))
+        _check_path(path)
+        if op["op"] == "remove":
+            parsed.append(PatchOp("remove", path))
+            continue
+        if "value" not in op:
+            raise ValueError(f"{op['op']} at {format_pointer(path)} requires a value")
+        _check_dates(path, op["value"])
+        parsed.append(PatchOp(op["op"], path, op["value"]))
+    return parsed
+
+
+def merge_patch_paths(patch: Any) -> List[str]:
+    """
+    Validates a JSON Merge Patch (RFC 7386) for stp_data and returns the
+    pointers it sets or removes, for auditing.
+    """
+    if not isinstance(patch, dict) or not patch:
+        raise ValueError("Merge patch must be a non-empty object")
+
+    paths: List[str] = []
+
+    def walk(prefix: Tuple[str, ...], node: Dict[str, Any]) -> None:
+        for key, value in node.items():
+            path = prefix + (key,)
+            _check_path(path)
+            if isinstance(value, dict) and value:
+                walk(path, value)
+                continue
+            _check_dates(path, value)
+            paths.append(format_pointer(path))
+
+    walk((), patch)
+    if len(paths) > MAX_PATCH_OPS:
+        raise ValueError(f"At most {MAX_PATCH_OPS} changed paths are allowed")
+    return paths
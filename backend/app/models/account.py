@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -15,4 +15,7 @@ class Account(Base):
     role: Mapped[str] = mapped_column(String(32), default="user")  # owner/admin/org/user
 
     tier_code: Mapped[str] = mapped_column(String(32), default="SINGLE_FREE")
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
\ No newline at end of file
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    # Org accounts act for this unit (and the units below it)
+    organization_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("organizations.id"), nullable=True, index=True)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import String, ForeignKey, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class MemberAccess(Base):
+    """
+    Materialized effective permission (app.core.authz.Permission) of an
+    account or org on a service member. Derived from control and accepted
+    shares; maintained by app.core.member_access_service.
+    """
+    __tablename__ = "member_access"
+
+    principal_type: Mapped[str] = mapped_column(String(8), primary_key=True)  # account|org
+    principal_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    service_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("service_members.id", ondelete="CASCADE"), primary_key=True, index=True)
+    permission: Mapped[int] = mapped_column(SmallInteger)
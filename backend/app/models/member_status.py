@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from sqlalchemy import String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class ServiceMemberStatus(Base):
+    """
+    Derived from ServiceMember.stp_data (see app.core.member_status_service).
+    Dates are naive UTC, matching the card builders.
+    """
+    __tablename__ = "service_member_statuses"
+    __table_args__ = (
+        Index(
+            "ix_sm_status_rag",
+            "fitness_status", "training_status", "awards_status", "readiness_status",
+        ),
+    )
+
+    service_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("service_members.id", ondelete="CASCADE"), primary_key=True)
+
+    fitness_status: Mapped[str] = mapped_column(String(8))  # green|amber|red|gray
+    fitness_expiration: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    training_status: Mapped[str] = mapped_column(String(8))
+    training_next_due: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    awards_status: Mapped[str] = mapped_column(String(8))
+    readiness_status: Mapped[str] = mapped_column(String(8))
+    readiness_expiration: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # Statuses are date-dependent; rows past valid_until are recomputed before use
+    valid_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
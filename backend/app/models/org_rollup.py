@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import String, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class OrgStatusRollup(Base):
+    """
+    Members per (card, status) for an org and all of its subordinate units.
+    Maintained incrementally by app.core.org_rollup_service.
+    """
+    __tablename__ = "org_status_rollups"
+
+    organization_id: Mapped[str] = mapped_column(String(36), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    card: Mapped[str] = mapped_column(String(16), primary_key=True)  # fitness|training|awards|readiness
+    status: Mapped[str] = mapped_column(String(8), primary_key=True)  # green|amber|red|gray
+    member_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -15,5 +15,11 @@ class Organization(Base):
     command_team: Mapped[str] = mapped_column(String(500))
     tier_code: Mapped[str] = mapped_column(String(32), default="ORG_500_MONTH")
 
+    # Unit hierarchy: company -> battalion -> brigade
+    parent_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("organizations.id"), nullable=True, index=True)
+
+    # Bumped whenever the org summary may change (roster, member data, hierarchy)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
     is_approved: Mapped[bool] = mapped_column(Boolean, default=False)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import String, ForeignKey, JSON
+from sqlalchemy import String, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -20,7 +21,11 @@ class ServiceMember(Base):
     component: Mapped[str] = mapped_column(String(64), index=True)
 
     # STP source-of-truth blob (branch modules later refine)
-    stp_data: Mapped[dict] = mapped_column(JSON, default=dict)
+    # JSONB so date paths can be indexed (see stp_timestamp() in migrations)
+    stp_data: Mapped[dict] = mapped_column(JSONB, default=dict)
+
+    # Bumped on any stp_data, share or control change (drives dashboard ETags)
+    version: Mapped[int] = mapped_column(Integer, default=1)
 
     # Claim/transfer
     claim_code: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)  # link/QR token
\ No newline at end of file
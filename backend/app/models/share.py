@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import uuid
-from sqlalchemy import String, ForeignKey
+from datetime import datetime, timezone
+from sqlalchemy import String, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
 class ServiceMemberShare(Base):
     __tablename__ = "service_member_shares"
+    __table_args__ = (
+        # Org inbox: pending shares per org, oldest first (see share_inbox_service)
+        Index(
+            "ix_service_member_shares_org_pending",
+            "target_org_id", "created_at", "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     service_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("service_members.id"), index=True)
@@ -17,4 +26,5 @@ class ServiceMemberShare(Base):
     target_org_id: Mapped[str | None] = mapped_column(String(36), ForeignKey("organizations.id"), nullable=True, index=True)
 
     permission: Mapped[str] = mapped_column(String(16), default="view")  # view|edit
-    status: Mapped[str] = mapped_column(String(16), default="pending")  # pending|accepted|denied
\ No newline at end of file
+    status: Mapped[str] = mapped_column(String(16), default="pending")  # pending|accepted|denied|revoked
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime
+from sqlalchemy import String, ForeignKey, DateTime, Integer, Boolean, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class TrainingItem(Base):
+    """
+    One row per entry of stp_data["training"], rewritten whenever stp_data
+    changes (see app.core.stp_items_service). Dates are naive UTC.
+    """
+    __tablename__ = "training_items"
+    __table_args__ = (
+        Index("ix_training_items_type_due", "item_type", "due_date"),
+    )
+
+    service_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("service_members.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)  # index in the stp_data array
+
+    item_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    due_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    completed: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+
+class AwardItem(Base):
+    """
+    One row per entry of stp_data["awards"], maintained like TrainingItem.
+    """
+    __tablename__ = "award_items"
+    __table_args__ = (
+        Index("ix_award_items_status_type", "status", "award_type"),
+    )
+
+    service_member_id: Mapped[str] = mapped_column(String(36), ForeignKey("service_members.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    award_type: Mapped[str | None] = mapped_column(String(128), nullable=True, index=True)
+    status: Mapped[str | None] = mapped_column(String(32), nullable=True)  # pending|approved|...
@@ -20,4 +20,7 @@ class UploadFile(Base):
     size_bytes: Mapped[int] = mapped_column(Integer)
 
     storage_path: Mapped[str] = mapped_column(String(500))
+    sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)  # hex; NULL for uploads before hashing
+    # Content-addressed file (upload_blobs); NULL for legacy per-upload files at storage_path
+    blob_sha256: Mapped[str | None] = mapped_column(String(64), ForeignKey("upload_blobs.sha256"), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
\ No newline at end of file
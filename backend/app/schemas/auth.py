@@ -9,6 +9,10 @@ class LoginIn(BaseModel):
     email: EmailStr
     password: str
 
+class RefreshIn(BaseModel):
+    refresh_token: str
+
 class TokenOut(BaseModel):
     access_token: str
-    token_type: str = "bearer"
\ No newline at end of file
+    token_type: str = "bearer"
+    refresh_token: str | None = None
\ No newline at end of file
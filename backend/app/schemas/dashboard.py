@@ -0,0 +1,8 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+# Largest batch /dashboard/cards accepts (a company-sized view)
+MAX_CARDS_BATCH = 200
+
+class DashboardCardsBatchIn(BaseModel):
+    service_member_ids: list[str] = Field(min_length=1, max_length=MAX_CARDS_BATCH)
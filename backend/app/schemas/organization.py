@@ -7,11 +7,15 @@ class OrgCreateRequestIn(BaseModel):
     command_team: str
     unit_memorandum_note: str | None = None
 
+class OrgParentIn(BaseModel):
+    parent_id: str | None = None  # None detaches the unit
+
 class OrgOut(BaseModel):
     id: str
     name: str
     base: str
     command_team: str
     tier_code: str
+    parent_id: str | None = None
     is_verified: bool
     is_approved: bool
\ No newline at end of file
@@ -14,6 +14,19 @@ class ServiceMemberOut(BaseModel):
     component: str
     stp_data: dict
 
+class ServiceMemberSummaryOut(BaseModel):
+    id: str
+    creator_account_id: str
+    subject_account_id: str | None
+    branch: str
+    component: str
+    version: int
+    stp_data: dict | None = None  # only when requested via ?fields=stp_data
+
+class ServiceMemberPageOut(BaseModel):
+    items: list[ServiceMemberSummaryOut]
+    next_cursor: str | None = None
+
 class ClaimCodeOut(BaseModel):
     service_member_id: str
     claim_code: str
\ No newline at end of file
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# Largest id list the bulk share endpoints accept per request
+MAX_BULK_SHARE = 1000
 
 class ShareToAccountIn(BaseModel):
     service_member_id: str
@@ -14,4 +17,13 @@ class ShareToOrgIn(BaseModel):
 class ShareDecisionIn(BaseModel):
     share_id: str
     decision: str  # accepted|denied
-    reason: str | None = None
\ No newline at end of file
+    reason: str | None = None
+
+class ShareToOrgBulkIn(BaseModel):
+    service_member_ids: list[str] = Field(min_length=1, max_length=MAX_BULK_SHARE)
+    target_org_id: str
+
+class ShareDecisionBulkIn(BaseModel):
+    share_ids: list[str] = Field(min_length=1, max_length=MAX_BULK_SHARE)
+    decision: str  # accepted|denied
+    reason: str | None = None
@@ -0,0 +1,13 @@
+from __future__ import annotations
+from pydantic import BaseModel
+
+class AccountRoleIn(BaseModel):
+    role: str  # owner|admin|org|user
+    organization_id: str | None = None  # required for org accounts
+
+class AccountStatusOut(BaseModel):
+    id: str
+    role: str
+    is_active: bool
+    tier_code: str
+    organization_id: str | None = None
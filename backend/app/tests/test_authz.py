@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_account, get_db
+from app.core.authz import Action, Permission, decide_member_action, share_permission
+from app.core.principal import AccountPrincipal
+from app.main import app
+from app.models.service_member import ServiceMember
+
+
+def test_permissions_are_ordered():
+    assert Permission.NONE < Permission.VIEW < Permission.EDIT < Permission.CONTROL
+    assert share_permission("edit") == Permission.EDIT
+    assert share_permission("view") == Permission.VIEW
+
+
+def test_member_actions_by_permission():
+    assert decide_member_action(Permission.VIEW, Action.SM_READ).allowed
+    assert not decide_member_action(Permission.VIEW, Action.SM_WRITE_STP).allowed
+    assert decide_member_action(Permission.EDIT, Action.SM_UPLOAD).allowed
+    assert not decide_member_action(Permission.EDIT, Action.SM_DELETE).allowed
+    assert decide_member_action(Permission.CONTROL, Action.SM_DELETE).allowed
+    assert not decide_member_action(Permission.NONE, Action.SM_READ).allowed
+    assert not decide_member_action(Permission.CONTROL, Action.ORG_READ).allowed
+
+
+@pytest.fixture
+def as_account():
+    db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: db
+
+    def login(role="user", level=Permission.NONE):
+        sm = ServiceMember(id="m1", creator_account_id="acct-2", version=3, stp_data={})
+        db.execute.return_value.one_or_none.return_value = (sm, int(level))
+        app.dependency_overrides[get_current_account] = lambda: AccountPrincipal(
+            id="acct-1", role=role, is_active=True, tier_code="SINGLE_FREE"
+        )
+        return TestClient(app), db
+
+    try:
+        yield login
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_view_share_reads_cards_in_one_query(as_account):
+    client, db = as_account(level=Permission.VIEW)
+    assert client.get("/api/dashboard/m1/cards").status_code == 200
+    db.execute.assert_called_once()
+
+
+def test_view_share_cannot_patch_stp(as_account):
+    client, db = as_account(level=Permission.VIEW)
+    resp = client.patch("/api/service-members/m1/stp", json={"rank": "SGT"}, headers={"If-Match": "3"})
+    assert resp.status_code == 403
+    db.commit.assert_not_called()
+
+
+@pytest.mark.parametrize("role, code", [("user", 403), ("org", 403), ("admin", 200)])
+def test_cards_need_a_grant_unless_support_staff(as_account, role, code):
+    client, _ = as_account(role=role)
+    assert client.get("/api/dashboard/m1/cards").status_code == code
+
+
+def test_unknown_member_is_404(as_account):
+    client, db = as_account()
+    db.execute.return_value.one_or_none.return_value = None
+    assert client.get("/api/dashboard/m1/cards").status_code == 404
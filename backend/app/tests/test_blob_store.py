@@ -0,0 +1,164 @@
+import copy
+import io
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.core.blob_store import store_upload
+from app.core.upload_storage import blob_path, stream_to_file
+from app.models.upload import UploadFile
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        assert self.value is not None
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def first(self):
+        return (self.value,) if self.value is not None else None
+
+
+class FakeSession:
+    """
+    Just enough of a Session for the blob statements: upload_blobs rows,
+    upload_files -> blob references (with the FK enforced), flush,
+    commit and rollback.
+    """
+
+    def __init__(self, blobs=None, files=None):
+        self.blobs = blobs or {}  # sha256 -> {"ref_count", "storage_path"}
+        self.files = files or {}  # upload id -> blob_sha256
+        self._saved = None
+        self._added = []
+        self._deleted = []
+        self.fail_commit = False
+
+    def _begin(self):
+        if self._saved is None:
+            self._saved = copy.deepcopy((self.blobs, self.files))
+
+    def execute(self, stmt):
+        self._begin()
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql, params = str(compiled), compiled.params
+        if "pg_advisory_xact_lock" in sql:
+            return _Result(None)
+        if sql.startswith("INSERT INTO upload_blobs"):
+            row = self.blobs.setdefault(params["sha256"], {"ref_count": 0, "storage_path": params["storage_path"]})
+            row["ref_count"] += 1
+            return _Result(row["storage_path"])
+        if sql.startswith("UPDATE upload_blobs"):
+            row = self.blobs.get(params["sha256_1"])
+            if row is None:
+                return _Result(None)
+            row["ref_count"] -= 1
+            return _Result(row["ref_count"])
+        if sql.startswith("DELETE FROM upload_blobs"):
+            sha = params["sha256_1"]
+            if sha in self.files.values():
+                raise IntegrityError(sql, params, Exception("upload_files_blob_sha256_fkey"))
+            row = self.blobs.pop(sha)
+            return _Result(row["storage_path"])
+        if sql.startswith("SELECT upload_blobs.sha256"):
+            sha = params["sha256_1"]
+            return _Result(sha if sha in self.blobs else None)
+        raise AssertionError(f"unexpected statement: {sql}")
+
+    def add(self, obj):
+        self._begin()
+        self._added.append(obj)
+
+    def delete(self, obj):
+        self._begin()
+        self._deleted.append(obj)
+
+    def flush(self):
+        for obj in self._deleted:
+            self.files.pop(obj.id, None)
+        for obj in self._added:
+            self.files[obj.id] = obj.blob_sha256
+        self._added, self._deleted = [], []
+
+    def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.flush()
+        self._saved = None
+
+    def rollback(self):
+        if self._saved is not None:
+            self.blobs, self.files = self._saved
+        self._saved = None
+        self._added, self._deleted = [], []
+
+
+def _stage(tmp_path, data, name):
+    staging = tmp_path / ".staging"
+    staging.mkdir(exist_ok=True)
+    return stream_to_file(io.BytesIO(data), staging / name, max_bytes=len(data))
+
+
+def _existing(db, tmp_path, data, upload_id):
+    staged = _stage(tmp_path, data, upload_id)
+    store_upload(db, staged, tmp_path, UploadFile(id=upload_id))
+    return UploadFile(id=upload_id, blob_sha256=staged.sha256, storage_path=str(blob_path(tmp_path, staged.sha256)))
+
+
+def test_rotating_the_last_reference_deletes_blob_row_and_file(tmp_path):
+    db = FakeSession()
+    oldest = _existing(db, tmp_path, b"old orders", "old")
+
+    staged = _stage(tmp_path, b"new orders", "new")
+    store_upload(db, staged, tmp_path, UploadFile(id="new"), rotated=oldest)
+
+    assert db.files == {"new": staged.sha256}
+    assert set(db.blobs) == {staged.sha256}
+    assert not blob_path(tmp_path, oldest.blob_sha256).exists()
+    assert blob_path(tmp_path, staged.sha256).read_bytes() == b"new orders"
+    assert not staged.path.exists()
+
+
+def test_rotating_a_shared_blob_keeps_it_for_other_uploads(tmp_path):
+    db = FakeSession()
+    oldest = _existing(db, tmp_path, b"unit memo", "old")
+    _existing(db, tmp_path, b"unit memo", "other-member")
+
+    store_upload(db, _stage(tmp_path, b"cert", "new"), tmp_path, UploadFile(id="new"), rotated=oldest)
+
+    assert db.blobs[oldest.blob_sha256]["ref_count"] == 1
+    assert blob_path(tmp_path, oldest.blob_sha256).read_bytes() == b"unit memo"
+
+
+def test_duplicate_content_is_stored_once(tmp_path):
+    db = FakeSession()
+    first = _existing(db, tmp_path, b"same pdf", "a")
+    second = _stage(tmp_path, b"same pdf", "b")
+
+    store_upload(db, second, tmp_path, UploadFile(id="b"))
+
+    assert db.blobs[first.blob_sha256]["ref_count"] == 2
+    assert not second.path.exists()
+    assert [p.name for p in (tmp_path / "blobs").rglob("*") if p.is_file()] == [first.blob_sha256]
+
+
+def test_failed_commit_removes_new_blob_and_keeps_rotated_one(tmp_path):
+    db = FakeSession()
+    oldest = _existing(db, tmp_path, b"old orders", "old")
+
+    staged = _stage(tmp_path, b"new orders", "new")
+    db.fail_commit = True
+    with pytest.raises(RuntimeError):
+        store_upload(db, staged, tmp_path, UploadFile(id="new"), rotated=oldest)
+    db.fail_commit = False
+
+    assert db.files == {"old": oldest.blob_sha256}
+    assert set(db.blobs) == {oldest.blob_sha256}
+    assert not blob_path(tmp_path, staged.sha256).exists()
+    assert blob_path(tmp_path, oldest.blob_sha256).exists()
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+from app.core.share_bulk_service import bulk_decide_org_shares
+from app.domain.bulk_share import (
+    ALREADY_DECIDED,
+    ALREADY_SHARED,
+    FORBIDDEN,
+    NOT_FOUND,
+    chunks,
+    classify_decision_shares,
+    classify_share_members,
+    unique_ids,
+)
+
+
+def test_unique_ids_keeps_first_position():
+    assert unique_ids(["b", "a", "b", "c", "a"]) == ["b", "a", "c"]
+
+
+def test_chunks_splits_lazily_with_short_tail():
+    assert list(chunks(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunks([], 3)) == []
+
+
+def test_classify_share_members():
+    ok, skipped = classify_share_members(
+        ["m1", "m2", "m3", "m4"],
+        controllers={"m1": "acct", "m2": "other", "m4": "acct"},
+        account_id="acct",
+        already_shared={"m4"},
+    )
+    assert ok == ["m1"]
+    assert skipped == {"m2": FORBIDDEN, "m3": NOT_FOUND, "m4": ALREADY_SHARED}
+
+
+def test_classify_decision_shares():
+    ok, skipped = classify_decision_shares(
+        ["s1", "s2", "s3"],
+        statuses={"s1": "pending", "s2": "accepted"},
+    )
+    assert ok == ["s1"]
+    assert skipped == {"s2": ALREADY_DECIDED, "s3": NOT_FOUND}
+
+
+def test_classify_decision_shares_out_of_scope():
+    ok, skipped = classify_decision_shares(
+        ["s1", "s2", "s3"],
+        statuses={"s1": "pending", "s2": "accepted", "s3": "pending"},
+        out_of_scope={"s2", "s3"},
+    )
+    assert ok == ["s1"]
+    assert skipped == {"s2": FORBIDDEN, "s3": FORBIDDEN}
+
+
+def test_org_staff_cannot_decide_shares_for_other_orgs():
+    db = MagicMock()
+    db.execute.side_effect = [
+        MagicMock(scalars=lambda: iter(["org-1", "org-2"])),  # caller's subtree
+        iter([("s1", "m1", "pending", "org-9"), ("s2", "m2", "accepted", "org-2")]),
+    ]
+
+    results = bulk_decide_org_shares(db, "acct-1", ["s1", "s2", "s3"], "accepted", org_scope="org-1")
+
+    assert results == [
+        {"share_id": "s1", "status": FORBIDDEN},
+        {"share_id": "s2", "status": ALREADY_DECIDED},
+        {"share_id": "s3", "status": NOT_FOUND},
+    ]
+    assert db.execute.call_count == 2
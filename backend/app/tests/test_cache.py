@@ -0,0 +1,62 @@
+from app.core.cache import TTLCache
+from app.core.metrics import LatencyStats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+    cache.set("a", 1)
+    clock.now = 59
+    assert cache.get("a") == 1
+    clock.now = 60
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_and_counters():
+    cache = TTLCache(maxsize=2, ttl=60, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a is now most recent
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 2)
+    assert stats["hit_ratio"] == round(2 / 3, 4)
+
+
+def test_explicit_invalidation():
+    cache = TTLCache(maxsize=10, ttl=60, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.invalidate_where(lambda v: v == 2) == 1
+    assert cache.get("b") is None
+
+
+def test_per_entry_ttl_overrides_default():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=3600, clock=clock)
+    cache.set("token", {"sub": "a"}, ttl=5)
+    clock.now = 4.9
+    assert cache.get("token") == {"sub": "a"}
+    clock.now = 5
+    assert cache.get("token") is None
+
+
+def test_latency_stats():
+    latency = LatencyStats()
+    assert latency.stats() == {"count": 0, "mean_ms": None, "max_ms": 0.0}
+    latency.observe(0.001)
+    latency.observe(0.003)
+    assert latency.stats() == {"count": 2, "mean_ms": 2.0, "max_ms": 3.0}
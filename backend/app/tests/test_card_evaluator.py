@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from app.domain.card_evaluator import CardEvaluator
+from app.domain.dashboard_cards import (
+    build_perstats_card,
+    build_fitness_card,
+    build_training_card,
+    build_awards_card,
+    build_readiness_card,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _iso(days: int) -> str:
+    return (NOW + timedelta(days=days)).isoformat()
+
+
+SAMPLES = [
+    {},
+    {
+        "rank": "SGT",
+        "branch": "Army",
+        "component": "Active",
+        "current_unit": "A Co",
+        "fitness": {"expiration_date": _iso(40), "last_test_date": _iso(-300)},
+        "readiness": {"readiness_expiration": _iso(10) + "Z"},
+        "training": [
+            {"due_date": _iso(-1), "completed": True},
+            {"due_date": _iso(59)},
+            {"due_date": "not a date"},
+            {"completed": True},
+        ],
+        "awards": [{"status": "pending"}, {"status": "approved"}],
+    },
+    {"branch": "Navy", "fitness": {"expiration_date": _iso(61)}, "training": [{"due_date": _iso(90)}]},
+]
+
+
+def test_evaluator_matches_card_builders():
+    evaluator = CardEvaluator(NOW)
+    for stp in SAMPLES:
+        assert evaluator.evaluate(stp) == {
+            "perstats": build_perstats_card(stp),
+            "fitness": build_fitness_card(stp, NOW),
+            "training": build_training_card(stp, NOW),
+            "awards": build_awards_card(stp),
+            "readiness": build_readiness_card(stp, NOW),
+        }
+
+
+def test_evaluator_memoizes_shared_dates():
+    evaluator = CardEvaluator(NOW)
+    due = _iso(5)
+    for _ in range(3):
+        evaluator.evaluate({"training": [{"due_date": due}]})
+    assert evaluator._days == {due: 5, None: None}
+
+
+def test_evaluator_memo_is_bounded_lru():
+    evaluator = CardEvaluator(NOW, memo_size=2)
+    shared = _iso(5)
+    for days in range(1, 50):
+        evaluator.days_remaining(shared)
+        assert evaluator.days_remaining(_iso(days + 10)) == days + 10
+    assert len(evaluator._days) == 2
+    assert shared in evaluator._days
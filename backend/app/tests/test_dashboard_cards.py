@@ -0,0 +1,86 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import get_current_account, get_db
+from app.core.authz import Permission
+from app.core.principal import AccountPrincipal
+from app.domain.dashboard_cards import _days_remaining, build_fitness_card
+from app.main import app
+from app.models.service_member import ServiceMember
+from app.schemas.dashboard import MAX_CARDS_BATCH
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def test_offset_aware_dates_are_normalized_to_utc():
+    assert _days_remaining("2026-04-15T12:00:00Z", NOW) == 45
+    assert _days_remaining("2026-04-15T14:00:00+02:00", NOW) == 45
+    assert _days_remaining("2026-04-15T12:00:00", NOW) == 45
+
+
+def test_invalid_dates_are_gray():
+    card = build_fitness_card({"fitness": {"expiration_date": "next spring"}}, NOW)
+    assert card["days_remaining"] is None
+    assert card["status"] == "gray"
+
+
+@pytest.fixture
+def batch_client():
+    db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_account] = lambda: AccountPrincipal(
+        id="acct-1", role="user", is_active=True, tier_code="SINGLE_FREE"
+    )
+    try:
+        yield TestClient(app), db
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _member(member_id):
+    return ServiceMember(id=member_id, stp_data={"fitness": {"expiration_date": "2099-01-01"}})
+
+
+def test_batch_cards_mixes_cards_and_per_member_errors(batch_client):
+    client, db = batch_client
+    db.execute.return_value = [
+        (_member("own"), int(Permission.CONTROL)),
+        (_member("shared"), int(Permission.VIEW)),
+        (_member("other"), int(Permission.NONE)),
+    ]
+
+    resp = client.post("/api/dashboard/cards", json={"service_member_ids": ["own", "other", "gone", "shared"]})
+
+    body = resp.json()
+    assert resp.status_code == 200
+    assert list(body["cards"]) == ["own", "shared"]
+    assert body["cards"]["own"]["fitness"]["status"] == "green"
+    assert body["errors"] == {
+        "other": {"status": 403, "detail": "Not authorized"},
+        "gone": {"status": 404, "detail": "Service member not found"},
+    }
+    db.execute.assert_called_once()
+
+
+def test_batch_cards_dedupes_ids(batch_client):
+    client, db = batch_client
+    db.execute.return_value = [(_member("m1"), int(Permission.CONTROL))]
+
+    resp = client.post("/api/dashboard/cards", json={"service_member_ids": ["m1", "m1", "m1"]})
+
+    assert list(resp.json()["cards"]) == ["m1"]
+    (query,), _ = db.execute.call_args
+    compiled = query.compile(dialect=postgresql.dialect())
+    assert compiled.params["id_1"] == ["m1"]
+
+
+@pytest.mark.parametrize("count, code", [(0, 422), (MAX_CARDS_BATCH, 200), (MAX_CARDS_BATCH + 1, 422)])
+def test_batch_cards_size_limits(batch_client, count, code):
+    client, db = batch_client
+    db.execute.return_value = []
+    ids = [f"m{i}" for i in range(count)]
+    assert client.post("/api/dashboard/cards", json={"service_member_ids": ids}).status_code == code
@@ -0,0 +1,28 @@
+from datetime import date
+
+from app.core.etag import etag_matches, if_match_version, make_etag
+
+
+def test_etag_changes_with_version_and_day():
+    tag = make_etag("sm", "abc", 3, date(2026, 3, 1))
+    assert tag == 'W/"sm-abc-v3-20260301"'
+    assert tag != make_etag("sm", "abc", 4, date(2026, 3, 1))
+    assert tag != make_etag("sm", "abc", 3, date(2026, 3, 2))
+
+
+def test_if_none_match_uses_weak_comparison():
+    tag = make_etag("org", "o1", 1, date(2026, 3, 1))
+    assert etag_matches(tag, tag)
+    assert etag_matches('"org-o1-v1-20260301"', tag)
+    assert etag_matches('W/"other", ' + tag, tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches(None, tag)
+    assert not etag_matches('W/"org-o1-v0-20260301"', tag)
+
+
+def test_if_match_version_reads_etag_or_bare_version():
+    assert if_match_version(make_etag("sm", "0b6f-4c1e", 12, date(2026, 3, 1))) == 12
+    assert if_match_version('"7"') == 7
+    assert if_match_version(None) is None
+    assert if_match_version("*") is None
+    assert if_match_version('"abc"') is None
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.forecast import DEFAULT_HORIZONS, parse_horizons, red_window
+from app.domain.member_status import compute_member_status
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _fitness(expiration: datetime) -> dict:
+    return {"fitness": {"expiration_date": expiration.isoformat()}}
+
+
+def test_red_window_matches_status_transitions():
+    lo, hi = red_window("fitness", NOW, 7)
+    later = NOW + timedelta(days=7)
+
+    # first key date in the window: not red now, red a week later
+    assert compute_member_status(_fitness(lo), NOW).fitness_status != "red"
+    assert compute_member_status(_fitness(lo), later + timedelta(microseconds=1)).fitness_status == "red"
+    # last key date in the window
+    last = hi - timedelta(microseconds=1)
+    assert compute_member_status(_fitness(last), later).fitness_status == "red"
+    # hi itself is still not red at the horizon
+    assert compute_member_status(_fitness(hi), later).fitness_status != "red"
+
+
+def test_training_window_starts_now():
+    assert red_window("training", NOW, 30) == (NOW, NOW + timedelta(days=30))
+
+
+def test_parse_horizons():
+    assert parse_horizons(None) == DEFAULT_HORIZONS
+    assert parse_horizons("90, 7,30,7") == (7, 30, 90)
+
+
+@pytest.mark.parametrize("bad", ["abc", "0", "400", ",".join(str(d) for d in range(1, 10))])
+def test_parse_horizons_rejects(bad):
+    with pytest.raises(ValueError):
+        parse_horizons(bad)
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core import member_status_service
+
+from app.domain.member_status import compute_member_status
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def test_status_matches_cards_and_tracks_next_flip():
+    stp = {
+        "fitness": {"expiration_date": (NOW + timedelta(days=100)).isoformat()},
+        "readiness": {"readiness_expiration": (NOW + timedelta(days=45)).isoformat()},
+        "training": [
+            {"due_date": (NOW - timedelta(days=3)).isoformat()},
+            {"due_date": (NOW + timedelta(days=20)).isoformat()},
+        ],
+        "awards": [{"status": "approved"}],
+    }
+    status = compute_member_status(stp, NOW)
+
+    assert status.fitness_status == "green"
+    assert status.readiness_status == "amber"
+    assert status.training_status == "red"
+    assert status.awards_status == "green"
+    assert status.training_next_due == NOW + timedelta(days=20)
+    # fitness turns amber 61 days before expiration -> day 39
+    # readiness turns red 30 days before expiration -> day 15
+    assert status.valid_until == NOW + timedelta(days=15)
+
+
+def test_status_is_stable_until_valid_until():
+    stp = {"fitness": {"expiration_date": (NOW + timedelta(days=70)).isoformat()}}
+    status = compute_member_status(stp, NOW)
+
+    assert compute_member_status(stp, status.valid_until).fitness_status == "green"
+    later = compute_member_status(stp, status.valid_until + timedelta(seconds=1))
+    assert later.fitness_status == "amber"
+
+
+def test_empty_stp_never_goes_stale():
+    status = compute_member_status({}, NOW)
+    assert status.fitness_status == "gray"
+    assert status.valid_until is None
+
+
+def test_refresh_locks_members_before_reading_old_statuses(monkeypatch):
+    monkeypatch.setattr(member_status_service, "apply_member_status_changes", lambda db, changes: None)
+    db = MagicMock()
+    db.execute.return_value = []
+
+    member_status_service.refresh_member_statuses(db, [("m2", {}), ("m1", {})])
+
+    lock, old, _ = (str(c.args[0].compile(dialect=postgresql.dialect())) for c in db.execute.call_args_list)
+    assert lock.startswith("SELECT service_members.id") and lock.endswith("FOR NO KEY UPDATE")
+    assert "FROM service_member_statuses" in old and old.endswith("FOR UPDATE")
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_account, get_db
+from app.api.routes import org_dashboard
+from app.core.principal import AccountPrincipal
+from app.domain.org_dashboard import OrgDashboardAccumulator, build_org_dashboard
+from app.main import app
+
+
+def _iso(days: int) -> str:
+    return (datetime.utcnow() + timedelta(days=days, hours=1)).isoformat()
+
+
+def test_org_dashboard_counts():
+    members = [
+        {"fitness": {"expiration_date": _iso(90)}, "readiness": {"readiness_expiration": _iso(10)}},
+        {"fitness": {"expiration_date": _iso(45)}, "awards": [{"status": "pending"}]},
+        {"training": [{"due_date": _iso(-5)}]},
+    ]
+    summary = build_org_dashboard(members)
+
+    assert summary["total_personnel"] == 3
+    assert summary["fitness_summary"]["counts"] == {"green": 1, "amber": 1, "red": 0, "gray": 1}
+    assert summary["readiness_summary"]["overall_status"] == "red"
+    assert summary["training_summary"]["counts"]["red"] == 1
+    assert summary["awards_summary"]["counts"] == {"green": 2, "amber": 1, "red": 0, "gray": 0}
+
+
+def test_org_dashboard_consumes_generator():
+    summary = build_org_dashboard({} for _ in range(5))
+    assert summary["total_personnel"] == 5
+    assert summary["fitness_summary"]["counts"]["gray"] == 5
+
+
+def test_accumulator_folds_grouped_statuses():
+    acc = OrgDashboardAccumulator()
+    acc.add_statuses(fitness="red", training="green", awards="green", readiness="gray", count=4)
+    result = acc.result()
+    assert result["total_personnel"] == 4
+    assert result["fitness_summary"] == {
+        "counts": {"green": 0, "amber": 0, "red": 4, "gray": 0},
+        "overall_status": "red",
+    }
+
+
+@pytest.fixture
+def org_client(monkeypatch):
+    # org-2 sits under org-1; org-9 is unrelated
+    ancestors = {"org-1": {"org-1"}, "org-2": {"org-2", "org-1"}, "org-9": {"org-9"}}
+    monkeypatch.setattr(org_dashboard, "org_ancestor_ids", lambda db, org_id: ancestors[org_id])
+    monkeypatch.setattr(org_dashboard, "summarize_items_by_type", lambda db, member_ids: {"training": []})
+    app.dependency_overrides[get_db] = lambda: MagicMock()
+    app.dependency_overrides[get_current_account] = lambda: AccountPrincipal(
+        id="acct-1", role="org", is_active=True, tier_code="ORG", organization_id="org-1"
+    )
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "summary",
+        "forecast",
+        "items",
+        "export",
+        "members?card=fitness&status=red",
+    ],
+)
+def test_org_staff_cannot_read_other_orgs(org_client, path):
+    resp = org_client.get(f"/api/org-dashboard/org-9/{path}")
+    assert resp.status_code == 403
+
+
+def test_org_staff_can_read_their_subordinate_units(org_client):
+    assert org_client.get("/api/org-dashboard/org-2/items").json() == {"training": []}
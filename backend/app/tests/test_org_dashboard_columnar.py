@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain import org_dashboard_columnar
+from app.domain.org_dashboard import build_org_dashboard
+from app.domain.org_dashboard_columnar import build_org_dashboard_columnar
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _iso(days: float) -> str:
+    return (NOW + timedelta(days=days)).isoformat()
+
+
+ROSTER = [
+    {},
+    {"fitness": {"expiration_date": _iso(29.99)}, "readiness": {"readiness_expiration": _iso(30)}},
+    {"fitness": {"expiration_date": _iso(61)}, "readiness": {"readiness_expiration": _iso(60.5) + "Z"}},
+    {"fitness": {"expiration_date": "bad"}, "training": [{"due_date": _iso(-0.01)}, {"due_date": ""}]},
+    {"training": [{"due_date": _iso(60.9)}, {"due_date": _iso(61)}], "awards": [{"status": "pending"}]},
+    {"training": [{"due_date": _iso(200), "completed": True}], "awards": [{"status": "approved"}]},
+]
+
+
+def test_columnar_matches_python_path():
+    pytest.importorskip("numpy")
+    roster = ROSTER * 50
+    assert build_org_dashboard_columnar(roster, NOW, chunk_size=7) == build_org_dashboard(roster, NOW)
+
+
+def test_columnar_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(org_dashboard_columnar, "np", None)
+    assert build_org_dashboard_columnar(ROSTER, NOW) == build_org_dashboard(ROSTER, NOW)
+
+
+def test_date_column_memo_is_bounded_lru():
+    pytest.importorskip("numpy")
+    column = org_dashboard_columnar._DateColumn(memo_size=2)
+    shared = _iso(5)
+    for days in range(1, 50):
+        column.parse(shared)
+        column.parse(_iso(days + 10))
+    assert len(column._parsed) == 2
+    assert shared in column._parsed
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.core import member_status_service
+from app.core.org_rollup_service import summarize_org_rollup
+from app.domain.org_rollup import status_deltas, summary_from_rollup
+
+GREEN = {"fitness": "green", "training": "green", "awards": "green", "readiness": "gray"}
+
+
+def test_status_deltas_only_touch_changed_cards():
+    red_fitness = dict(GREEN, fitness="red")
+    assert status_deltas(GREEN, red_fitness) == [("fitness", "green", -1), ("fitness", "red", 1)]
+    assert status_deltas(GREEN, GREEN) == []
+
+
+def test_status_deltas_for_join_and_leave():
+    assert len(status_deltas(None, GREEN)) == 4
+    assert all(delta == -1 for _, _, delta in status_deltas(GREEN, None))
+
+
+def test_summary_from_rollup_rows():
+    summary = summary_from_rollup([
+        ("fitness", "green", 3), ("fitness", "red", 1),
+        ("training", "green", 4),
+        ("awards", "amber", 4),
+        ("readiness", "gray", 4),
+        ("readiness", "red", 0),
+    ])
+    assert summary["total_personnel"] == 4
+    assert summary["fitness_summary"]["overall_status"] == "red"
+    assert summary["awards_summary"]["counts"]["amber"] == 4
+    assert summary["readiness_summary"]["overall_status"] == "green"
+
+
+def test_org_summary_only_refreshes_the_orgs_members(monkeypatch):
+    swept = []
+    monkeypatch.setattr(
+        member_status_service, "refresh_stale_member_statuses", lambda db, member_ids=None: swept.append(member_ids)
+    )
+    db = MagicMock()
+    db.execute.return_value.tuples.return_value = []
+
+    summarize_org_rollup(db, "org-1")
+
+    (member_ids,) = swept
+    compiled = member_ids.compile(dialect=postgresql.dialect())
+    assert "org-1" in compiled.params.values()
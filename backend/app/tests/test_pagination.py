@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_account, get_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.principal import AccountPrincipal
+from app.main import app
+
+
+def test_cursor_round_trip():
+    values = ["2026-11-01T00:00:00", "sm-42"]
+    cursor = encode_cursor(values)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == values
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor(["only-one"]), encode_cursor({"a": 1})])
+def test_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
+
+
+@pytest.mark.parametrize("after_id", [7, ["sm-1"], {"id": "sm-1"}, None])
+def test_member_list_rejects_cursor_with_non_string_id(after_id):
+    db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_account] = lambda: AccountPrincipal(
+        id="acct-1", role="user", is_active=True, tier_code="SINGLE_FREE"
+    )
+    try:
+        resp = TestClient(app).get("/api/service-members", params={"cursor": encode_cursor([after_id])})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert resp.status_code == 400
+    db.execute.assert_not_called()
@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.api.routes import auth
+from app.core import security
+from app.core.config import settings
+from app.core.process_pool import PoolBusy
+from app.main import app
+from app.models.account import Account
+
+
+def _bcrypt_backend_works() -> bool:
+    try:
+        security._hash("pw", 4)
+    except Exception:
+        return False
+    return True
+
+
+# A bcrypt that is too new for passlib cannot hash at all; such installs skip these
+needs_bcrypt = pytest.mark.skipif(not _bcrypt_backend_works(), reason="passlib bcrypt backend unavailable")
+
+COST_6_HASH = "$2b$06$" + "a" * 53
+
+
+def test_hash_with_other_cost_needs_update_in_either_direction():
+    assert not security._crypt_context(6).needs_update(COST_6_HASH)
+    assert security._crypt_context(7).needs_update(COST_6_HASH)
+    assert security._crypt_context(5).needs_update(COST_6_HASH)
+
+
+@needs_bcrypt
+def test_verify_and_update_returns_new_hash_on_cost_change(monkeypatch):
+    stored = security._hash("secret", 4)
+
+    monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+    assert security.verify_and_update_password("secret", stored) == (True, None)
+
+    monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+    ok, new_hash = security.verify_and_update_password("secret", stored)
+    assert ok and new_hash.startswith("$2b$05$")
+    assert security.verify_and_update_password("wrong", stored) == (False, None)
+
+
+@pytest.fixture
+def client_and_db():
+    db = MagicMock()
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app), db
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def _account(password_hash="stored-hash"):
+    return Account(id="acct-1", email="a@example.com", password_hash=password_hash, role="user", is_active=True)
+
+
+def test_login_saves_rehashed_password(client_and_db, monkeypatch):
+    client, db = client_and_db
+    acct = _account()
+    db.query.return_value.filter.return_value.first.return_value = acct
+    monkeypatch.setattr(auth, "verify_and_update_password", lambda password, hashed: (True, "new-hash"))
+
+    resp = client.post("/api/auth/login", json={"email": acct.email, "password": "pw"})
+
+    assert resp.status_code == 200
+    assert acct.password_hash == "new-hash"
+    db.commit.assert_called_once()
+
+
+def test_login_keeps_hash_when_cost_unchanged(client_and_db, monkeypatch):
+    client, db = client_and_db
+    acct = _account()
+    db.query.return_value.filter.return_value.first.return_value = acct
+    monkeypatch.setattr(auth, "verify_and_update_password", lambda password, hashed: (True, None))
+
+    assert client.post("/api/auth/login", json={"email": acct.email, "password": "pw"}).status_code == 200
+    assert acct.password_hash == "stored-hash"
+
+
+@pytest.mark.parametrize("error", [PoolBusy("full"), TimeoutError()])
+def test_busy_or_slow_hasher_maps_to_503_with_retry_after(client_and_db, monkeypatch, error):
+    client, db = client_and_db
+
+    def fail(*args):
+        raise error
+
+    monkeypatch.setattr(auth, "verify_and_update_password", fail)
+    monkeypatch.setattr(auth, "hash_password", fail)
+
+    db.query.return_value.filter.return_value.first.return_value = _account()
+    resp = client.post("/api/auth/login", json={"email": "a@example.com", "password": "pw"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+
+    db.query.return_value.filter.return_value.first.return_value = None
+    resp = client.post("/api/auth/register", json={"email": "b@example.com", "password": "pw"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    db.commit.assert_not_called()
@@ -0,0 +1,51 @@
+import threading
+import time
+
+import pytest
+
+from app.core.process_pool import BoundedProcessPool, PoolBusy
+
+
+def test_runs_in_worker_process():
+    pool = BoundedProcessPool(max_workers=1, queue_size=0)
+    try:
+        assert pool.run(pow, 2, 10) == 1024
+    finally:
+        pool.shutdown()
+
+
+def test_rejects_when_workers_and_queue_are_full():
+    pool = BoundedProcessPool(max_workers=1, queue_size=0)
+    started = threading.Event()
+
+    def occupy():
+        started.set()
+        pool.run(time.sleep, 0.5)
+
+    worker = threading.Thread(target=occupy)
+    try:
+        worker.start()
+        started.wait()
+        time.sleep(0.05)
+        with pytest.raises(PoolBusy):
+            pool.run(pow, 2, 2)
+    finally:
+        worker.join()
+        pool.shutdown()
+    assert pool.run(pow, 2, 3) == 8
+    pool.shutdown()
+
+
+def test_timed_out_job_keeps_its_slot_until_it_finishes():
+    pool = BoundedProcessPool(max_workers=1, queue_size=0, timeout=0.05)
+    try:
+        with pytest.raises(TimeoutError):
+            pool.run(time.sleep, 0.5)
+        # The sleep is still running in the worker, so nothing else is admitted
+        with pytest.raises(PoolBusy):
+            pool.run(pow, 2, 2)
+
+        time.sleep(0.6)
+        assert pool.run(pow, 2, 4) == 16
+    finally:
+        pool.shutdown()
@@ -0,0 +1,43 @@
+import csv
+import json
+from datetime import datetime, timedelta
+
+from app.domain.card_evaluator import CardEvaluator
+from app.domain.roster_export import EXPORT_COLUMNS, encode_export, export_row
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+STP = {
+    "rank": "SGT",
+    "current_unit": "A Co, 1-5 IN",
+    "fitness": {"expiration_date": (NOW + timedelta(days=20)).isoformat()},
+    "awards": [{"status": "pending"}],
+}
+
+
+def _rows():
+    evaluator = CardEvaluator(NOW)
+    yield export_row(evaluator, "sm-1", "Army", "Active", STP)
+    yield export_row(evaluator, "sm-2", "Navy", "Reserve", {})
+
+
+def test_export_row_flattens_cards():
+    row = next(_rows())
+    assert tuple(row) == EXPORT_COLUMNS
+    assert row["fitness_status"] == "red"
+    assert row["fitness_days_remaining"] == 20
+    assert row["awards_pending"] == 1
+    assert row["readiness_status"] == "gray"
+
+
+def test_csv_export_is_streamed_line_by_line():
+    chunks = list(encode_export(_rows(), "csv"))
+    assert len(chunks) == 3
+    parsed = list(csv.DictReader(chunks))
+    assert parsed[0]["unit"] == "A Co, 1-5 IN"
+    assert parsed[1]["service_member_id"] == "sm-2"
+
+
+def test_ndjson_export():
+    lines = list(encode_export(_rows(), "ndjson"))
+    assert [json.loads(line)["branch"] for line in lines] == ["Army", "Navy"]
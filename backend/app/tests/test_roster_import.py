@@ -0,0 +1,66 @@
+from app.domain.roster_import import ImportRow, ImportRowError, detect_format, parse_import
+
+
+def test_csv_rows_validate_and_collect_extra_columns():
+    lines = [
+        "branch,component,rank,stp_data\r\n",
+        'Army,Active,SGT,"{""fitness"": {""expiration_date"": ""2027-01-01""}}"\r\n',
+        "Navy,National Guard,PO2,\r\n",
+        "Army,Reserve,,\r\n",
+    ]
+    results = list(parse_import(lines, "csv"))
+
+    assert results[0] == ImportRow(
+        2, "Army", "Active", {"fitness": {"expiration_date": "2027-01-01"}, "rank": "SGT"}
+    )
+    assert results[1] == ImportRowError(3, "Invalid branch/component combination")
+    assert results[2] == ImportRow(4, "Army", "Reserve", {})
+
+
+def test_csv_requires_branch_and_component_header():
+    assert list(parse_import(["name,rank\n"], "csv")) == [
+        ImportRowError(1, "CSV header must include branch and component")
+    ]
+
+
+def test_ndjson_reports_bad_lines_and_skips_blank_ones():
+    lines = [
+        '{"branch": "Space Force", "component": "Active", "stp_data": {"rank": "Spc3"}}\n',
+        "\n",
+        "{not json\n",
+        '{"branch": "Army"}\n',
+        '{"branch": "Army", "component": "Active", "stp_data": []}\n',
+    ]
+    assert list(parse_import(lines, "ndjson")) == [
+        ImportRow(1, "Space Force", "Active", {"rank": "Spc3"}),
+        ImportRowError(3, "Invalid JSON"),
+        ImportRowError(4, "branch and component are required"),
+        ImportRowError(5, "stp_data must be an object"),
+    ]
+
+
+def test_malformed_card_data_is_reported_per_row():
+    lines = [
+        '{"branch": "Army", "component": "Active", "stp_data": {"fitness": "2027-01-01"}}\n',
+        '{"branch": "Army", "component": "Active", "stp_data": {"training": {"due_date": "2027-01-01"}}}\n',
+        '{"branch": "Army", "component": "Active", "stp_data": {"awards": ["ARCOM"]}}\n',
+        '{"branch": "Army", "component": "Active", "stp_data": {"readiness": {}, "training": [{}]}}\n',
+    ]
+    assert list(parse_import(lines, "ndjson")) == [
+        ImportRowError(1, "stp_data.fitness must be an object"),
+        ImportRowError(2, "stp_data.training must be a list of objects"),
+        ImportRowError(3, "stp_data.awards must be a list of objects"),
+        ImportRow(4, "Army", "Active", {"readiness": {}, "training": [{}]}),
+    ]
+
+
+def test_csv_rejects_columns_named_after_cards():
+    assert list(parse_import(["branch,component,fitness\n", "Army,Active,green\n"], "csv")) == [
+        ImportRowError(1, "Card data goes in the stp_data column, not fitness")
+    ]
+
+
+def test_detect_format():
+    assert detect_format("roster.CSV") == "csv"
+    assert detect_format("roster.jsonl") == "ndjson"
+    assert detect_format("roster.xlsx") is None
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import get_db
+from app.api.routes import auth
+from app.core.session_service import (
+    InvalidRefreshToken,
+    RefreshTokenReused,
+    _hash_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
+from app.main import app
+from app.models.account import Account
+from app.models.auth_session import AuthSession
+
+
+def _session(**overrides):
+    fields = {
+        "id": "s1",
+        "account_id": "acct-1",
+        "family_id": "fam-1",
+        "token_hash": _hash_token("old-token"),
+        "expires_at": datetime.now(timezone.utc) + timedelta(days=1),
+        "revoked_at": None,
+        "replaced_by_id": None,
+    }
+    fields.update(overrides)
+    return AuthSession(**fields)
+
+
+def _db_returning(value):
+    db = MagicMock()
+    db.execute.return_value.scalar_one_or_none.return_value = value
+    return db
+
+
+def _family_revocations(db):
+    """The family_id of every UPDATE auth_sessions ... WHERE family_id = ? executed."""
+    families = []
+    for call in db.execute.call_args_list:
+        compiled = call.args[0].compile(dialect=postgresql.dialect())
+        if str(compiled).startswith("UPDATE auth_sessions"):
+            families.append(compiled.params["family_id_1"])
+    return families
+
+
+def test_rotate_issues_replacement_in_same_family_and_revokes_old():
+    old = _session()
+    db = _db_returning(old)
+
+    account_id, new_token = rotate_refresh_token(db, "old-token")
+
+    (replacement,), _ = db.add.call_args
+    assert account_id == "acct-1"
+    assert new_token != "old-token"
+    assert replacement.family_id == "fam-1"
+    assert replacement.token_hash == _hash_token(new_token)
+    assert replacement.expires_at > datetime.now(timezone.utc)
+    assert old.revoked_at is not None
+    assert old.replaced_by_id == replacement.id
+    assert _family_revocations(db) == []
+
+
+def test_reusing_a_rotated_token_revokes_the_whole_family():
+    db = _db_returning(_session(revoked_at=datetime.now(timezone.utc), replaced_by_id="s2"))
+
+    with pytest.raises(RefreshTokenReused):
+        rotate_refresh_token(db, "old-token")
+
+    assert _family_revocations(db) == ["fam-1"]
+    db.add.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)},
+        {"revoked_at": datetime.now(timezone.utc)},  # logged out
+    ],
+)
+def test_expired_or_revoked_token_is_rejected_without_family_revoke(overrides):
+    db = _db_returning(_session(**overrides))
+
+    with pytest.raises(InvalidRefreshToken) as exc:
+        rotate_refresh_token(db, "old-token")
+
+    assert not isinstance(exc.value, RefreshTokenReused)
+    assert _family_revocations(db) == []
+    db.add.assert_not_called()
+
+
+def test_unknown_token_is_rejected():
+    with pytest.raises(InvalidRefreshToken):
+        rotate_refresh_token(_db_returning(None), "nope")
+
+
+def test_logout_revokes_the_family_of_a_known_token():
+    db = _db_returning("fam-1")
+    assert revoke_refresh_token(db, "old-token") is True
+    assert _family_revocations(db) == ["fam-1"]
+
+    assert revoke_refresh_token(_db_returning(None), "nope") is False
+
+
+def test_inactive_account_cannot_log_in(monkeypatch):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = Account(
+        id="acct-1", email="a@example.com", password_hash="h", role="user", is_active=False
+    )
+    monkeypatch.setattr(auth, "verify_and_update_password", lambda password, hashed: (True, None))
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        resp = TestClient(app).post("/api/auth/login", json={"email": "a@example.com", "password": "pw"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert resp.status_code == 401
+    db.add.assert_not_called()
+    db.commit.assert_not_called()
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from app.domain.dashboard_cards import build_awards_card, build_training_card
+from app.domain.stp_items import (
+    award_item_rows,
+    build_awards_card_from_items,
+    build_training_card_from_items,
+    training_item_rows,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _iso(days: float) -> str:
+    return (NOW + timedelta(days=days)).isoformat()
+
+
+STP = {
+    "training": [
+        {"type": "Weapons Qual", "due_date": _iso(-1), "completed": False},
+        {"name": "SHARP", "due_date": _iso(0.5)},
+        {"name": "CTIP", "due_date": _iso(60.9), "completed": True},
+        {"name": "Cyber Awareness", "due_date": _iso(61)},
+        {"name": "Free-form", "due_date": "next month"},
+        {},
+    ],
+    "awards": [{"type": "AAM", "status": "pending"}, {"name": "ARCOM", "status": "approved"}, {}],
+}
+
+
+def test_item_rows_flatten_arrays():
+    training = training_item_rows("sm-1", STP)
+    assert [row["item_type"] for row in training] == [
+        "Weapons Qual", "SHARP", "CTIP", "Cyber Awareness", "Free-form", None,
+    ]
+    assert training[0]["due_date"] == NOW - timedelta(days=1)
+    assert training[4]["due_date"] is None
+    assert [row["position"] for row in award_item_rows("sm-1", STP)] == [0, 1, 2]
+
+
+def test_cards_from_items_match_stp_builders():
+    assert build_training_card_from_items(training_item_rows("sm-1", STP), NOW) == build_training_card(STP, NOW)
+    assert build_awards_card_from_items(award_item_rows("sm-1", STP)) == build_awards_card(STP)
+    assert build_training_card_from_items([], NOW) == build_training_card({}, NOW)
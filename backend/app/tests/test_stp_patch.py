@@ -0,0 +1,50 @@
+import pytest
+
+from app.domain.stp_patch import (
+    PatchOp,
+    format_pointer,
+    merge_patch_paths,
+    parse_pointer,
+    validate_json_patch,
+)
+
+
+def test_pointer_round_trip_with_escapes():
+    path = parse_pointer("/a~1b/m~0n/0")
+    assert path == ("a/b", "m~n", "0")
+    assert format_pointer(path) == "/a~1b/m~0n/0"
+
+
+def test_json_patch_validation():
+    ops = validate_json_patch([
+        {"op": "replace", "path": "/fitness/expiration_date", "value": "2027-01-01"},
+        {"op": "add", "path": "/training/-", "value": {"name": "SHARP", "due_date": "2027-02-01"}},
+        {"op": "remove", "path": "/awards/0"},
+    ])
+    assert ops[0] == PatchOp("replace", ("fitness", "expiration_date"), "2027-01-01")
+    assert ops[2] == PatchOp("remove", ("awards", "0"))
+
+
+@pytest.mark.parametrize("ops", [
+    [],
+    [{"op": "move", "from": "/a", "path": "/b"}],
+    [{"op": "add", "path": "/rank"}],
+    [{"op": "replace", "path": "", "value": {}}],
+    [{"op": "replace", "path": "fitness", "value": 1}],
+    [{"op": "add", "path": "/training/-", "value": {"due_date": "next week"}}],
+])
+def test_json_patch_rejects(ops):
+    with pytest.raises(ValueError):
+        validate_json_patch(ops)
+
+
+def test_merge_patch_paths_lists_leaves():
+    paths = merge_patch_paths({"fitness": {"expiration_date": "2027-01-01", "score": None}, "rank": "SSG"})
+    assert paths == ["/fitness/expiration_date", "/fitness/score", "/rank"]
+
+
+def test_merge_patch_rejects_bad_dates_and_non_objects():
+    with pytest.raises(ValueError):
+        merge_patch_paths({"readiness": {"readiness_expiration": 20270101}})
+    with pytest.raises(ValueError):
+        merge_patch_paths([])
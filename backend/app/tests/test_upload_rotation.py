@@ -1,6 +1,83 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.api import deps_authz
+from app.api.deps import get_current_account, get_db
+from app.api.routes import uploads
+from app.core.authz import Permission
+from app.core.config import settings
+from app.core.principal import AccountPrincipal
+from app.main import app
+from app.models.service_member import ServiceMember
+from app.models.upload import UploadFile
+
+
 def test_rotation_policy_contract():
     # Policy is enforced in API:
     # 1) 3 files allowed per spot
     # 2) 4th requires confirm_rotate
     # 3) on confirm, oldest is deleted
-    assert True
\ No newline at end of file
+    assert True
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    db = MagicMock()
+    monkeypatch.setattr(
+        deps_authz,
+        "resolve_member_access",
+        lambda db, acct, member_id, with_stp=True: (ServiceMember(id=member_id), Permission.CONTROL),
+    )
+    db.execute.return_value.scalars.return_value.all.return_value = []
+    monkeypatch.setattr(settings, "upload_storage_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "max_upload_bytes", 100)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_account] = lambda: AccountPrincipal(
+        id="acct-1", role="user", is_active=True, tier_code="SINGLE_FREE"
+    )
+    try:
+        yield TestClient(app), db
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _post(client, data: bytes, **form):
+    form = {"service_member_id": "m1", "spot_key": "training.weapons_qual", **form}
+    return client.post("/api/uploads/spot", data=form, files={"file": ("scan.pdf", data, "application/pdf")})
+
+
+def test_oversized_content_length_is_refused_before_the_body_is_parsed(client, monkeypatch):
+    client, _ = client
+
+    def parsed(*args, **kwargs):
+        raise AssertionError("body was parsed")
+
+    monkeypatch.setattr(Request, "form", parsed)
+    resp = _post(client, b"x" * (100 + uploads.MULTIPART_OVERHEAD + 1))
+    assert resp.status_code == 413
+
+
+def test_over_limit_within_framing_margin_is_caught_while_streaming(client):
+    client, db = client
+    resp = _post(client, b"x" * 101)
+    assert resp.status_code == 413
+    db.commit.assert_not_called()
+
+
+def test_full_spot_asks_for_confirmation(client, monkeypatch):
+    client, db = client
+    monkeypatch.setattr(settings, "max_uploads_per_spot", 1)
+    db.execute.return_value.scalars.return_value.all.return_value = [UploadFile(id="old", filename="old.pdf")]
+    store = MagicMock()
+    monkeypatch.setattr(uploads, "store_upload", store)
+
+    resp = _post(client, b"pdf")
+    assert resp.json()["requires_confirmation"] is True
+    store.assert_not_called()
+
+    resp = _post(client, b"pdf", confirm_rotate="true")
+    assert resp.json()["uploaded"] is True
+    assert store.call_args.kwargs["rotated"].id == "old"
@@ -0,0 +1,67 @@
+import hashlib
+import io
+
+import pytest
+
+from app.core.upload_storage import (
+    UploadTooLarge,
+    blob_lock_key,
+    blob_path,
+    hash_file,
+    max_upload_bytes,
+    stream_to_file,
+)
+
+
+def test_streams_in_chunks_with_hash_and_size(tmp_path):
+    data = b"x" * 10 + b"y" * 7
+    dest = tmp_path / "scan.pdf"
+
+    stored = stream_to_file(io.BytesIO(data), dest, max_bytes=100, chunk_size=4)
+
+    assert dest.read_bytes() == data
+    assert stored.size_bytes == 17
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert [p.name for p in tmp_path.iterdir()] == ["scan.pdf"]
+
+
+def test_over_limit_aborts_and_leaves_nothing_behind(tmp_path):
+    dest = tmp_path / "scan.pdf"
+    dest.write_bytes(b"previous")
+
+    with pytest.raises(UploadTooLarge) as exc:
+        stream_to_file(io.BytesIO(b"z" * 50), dest, max_bytes=8, chunk_size=4)
+
+    assert exc.value.limit == 8
+    assert dest.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["scan.pdf"]
+
+
+def test_limit_is_tier_then_capped_by_spot():
+    kw = {
+        "default": 100,
+        "by_tier": {"SINGLE_FREE": 50, "ORG_500_MONTH": 500},
+        "by_spot": {"training": 200, "awards.attachments": 20},
+    }
+    assert max_upload_bytes("fitness.acft", None, **kw) == 100
+    assert max_upload_bytes("fitness.acft", "SINGLE_FREE", **kw) == 50
+    assert max_upload_bytes("training.weapons_qual", "ORG_500_MONTH", **kw) == 200
+    assert max_upload_bytes("awards.attachments", "ORG_500_MONTH", **kw) == 20
+    assert max_upload_bytes("awards.other", "ORG_500_MONTH", **kw) == 500
+
+
+def test_hash_file_matches_streamed_upload(tmp_path):
+    data = b"orders" * 1000
+    stored = stream_to_file(io.BytesIO(data), tmp_path / "a", max_bytes=len(data))
+    hashed = hash_file(tmp_path / "a", chunk_size=100)
+    assert (hashed.size_bytes, hashed.sha256) == (stored.size_bytes, stored.sha256)
+
+
+def test_blob_path_fans_out_by_hash_prefix(tmp_path):
+    sha = hashlib.sha256(b"memo").hexdigest()
+    assert blob_path(tmp_path, sha) == tmp_path / "blobs" / sha[:2] / sha
+
+
+def test_blob_lock_key_fits_signed_bigint():
+    assert blob_lock_key("0" * 64) == -(1 << 63)
+    assert blob_lock_key("f" * 64) == (1 << 63) - 1
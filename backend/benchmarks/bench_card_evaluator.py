@@ -0,0 +1,85 @@
+"""
+Compares CardEvaluator against the individual build_*_card functions.
+
+    cd backend
+    PYTHONPATH=. python benchmarks/bench_card_evaluator.py [members]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from app.domain.card_evaluator import CardEvaluator
+from app.domain.dashboard_cards import (
+    build_perstats_card,
+    build_fitness_card,
+    build_training_card,
+    build_awards_card,
+    build_readiness_card,
+)
+
+
+def _synthetic_roster(n: int) -> list[dict]:
+    rng = random.Random(7)
+    today = datetime.utcnow()
+    # a unit shares a handful of training suspense dates
+    suspenses = [(today + timedelta(days=d)).isoformat() for d in range(-30, 120, 15)]
+
+    def day(offset: int) -> str:
+        return (today + timedelta(days=offset)).isoformat()
+
+    return [
+        {
+            "rank": "SPC",
+            "branch": "Army",
+            "component": "Active",
+            "fitness": {"expiration_date": day(rng.randint(-10, 200))},
+            "readiness": {"readiness_expiration": day(rng.randint(-10, 200))},
+            "training": [
+                {"due_date": rng.choice(suspenses), "completed": rng.random() < 0.5}
+                for _ in range(12)
+            ],
+            "awards": [{"status": rng.choice(["pending", "approved"])} for _ in range(3)],
+        }
+        for _ in range(n)
+    ]
+
+
+def _per_card(roster: list[dict]) -> None:
+    for stp in roster:
+        build_perstats_card(stp)
+        build_fitness_card(stp)
+        build_training_card(stp)
+        build_awards_card(stp)
+        build_readiness_card(stp)
+
+
+def _evaluator(roster: list[dict]) -> None:
+    evaluator = CardEvaluator()
+    for stp in roster:
+        evaluator.evaluate(stp)
+
+
+def _best_of(fn, roster: list[dict], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(roster)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    roster = _synthetic_roster(n)
+    per_card = _best_of(_per_card, roster)
+    evaluator = _best_of(_evaluator, roster)
+    print(f"members:          {n}")
+    print(f"per-card builders {per_card * 1000:8.1f} ms")
+    print(f"CardEvaluator     {evaluator * 1000:8.1f} ms  ({per_card / evaluator:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()